@@ -0,0 +1,121 @@
+"""Minimal in-process Sentinel stub used by the benchmark scripts.
+
+It answers the handful of endpoints the Python SDK talks to with canned
+payloads, speaks HTTP/1.1 keep-alive, and counts the TCP connections it
+accepts and the access requests it answers, so transport and caching
+changes can be compared without a real server.
+"""
+
+import json
+import socket
+import socketserver
+import statistics
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+APPROVED = {
+    "request_id": "req_bench",
+    "status": "APPROVED",
+    "secret": {
+        "type": "managed_secret",
+        "value": "secret_v1_benchmark",
+        "expires_at": "2099-01-01T00:00:00Z",
+    },
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        if self.connection.family != socket.AF_UNIX:
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _send(self, status: int, payload) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        with self.server.lock:
+            self.server.access_requests += 1
+        if self.path.startswith("/v1/access/requests/batch"):
+            items = json.loads(body)["requests"]
+            self._send(200, {"responses": [APPROVED for _ in items]})
+        else:
+            self._send(200, APPROVED)
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/v1/secrets"):
+            self._send(200, {"resource-1": "value-1", "resource-2": "value-2"})
+        elif self.path.startswith("/v1/resources"):
+            self._send(200, ["resource-1", "resource-2"])
+        else:
+            self._send(200, APPROVED)
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # bursts of concurrent callers overflow socketserver's default backlog of 5
+    request_queue_size = socket.SOMAXCONN
+
+    def __init__(self, address=("127.0.0.1", 0)):
+        super().__init__(address, _Handler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.access_requests = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubServer":
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class UnixStubServer(socketserver.ThreadingUnixStreamServer, StubServer):
+    def __init__(self, path: str):
+        socketserver.ThreadingUnixStreamServer.__init__(self, path, _Handler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.access_requests = 0
+
+    @property
+    def url(self) -> str:
+        return f"unix://{self.server_address}"
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Return p50/p99/mean latency in milliseconds."""
+    ordered = sorted(samples)
+    p99_index = min(len(ordered) - 1, int(len(ordered) * 0.99))
+    return {
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p99_ms": ordered[p99_index] * 1000,
+        "mean_ms": statistics.fmean(ordered) * 1000,
+    }
+
+
+def format_row(label: str, stats: Dict[str, float]) -> str:
+    return (
+        f"{label:<28} p50={stats['p50_ms']:7.3f}ms  "
+        f"p99={stats['p99_ms']:7.3f}ms  mean={stats['mean_ms']:7.3f}ms"
+    )
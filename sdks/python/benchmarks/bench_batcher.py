@@ -0,0 +1,83 @@
+"""Compare bursts of concurrent request_secret calls with and without coalescing.
+
+Usage:
+    python benchmarks/bench_batcher.py [--callers 200] [--bursts 20] [--window 0.003]
+
+Each burst starts `--callers` threads that request distinct resources at the
+same moment, as an agent swarm fanning out would. Without batching every
+call is its own upstream request; with `batch_window` set, calls arriving
+within the window share one `POST /v1/access/requests/batch`.
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from _server import StubServer, format_row, summarize  # noqa: E402
+from sentinel_client import AccessIntent, SentinelClient  # noqa: E402
+
+INTENT = AccessIntent(summary="bench", description="benchmark", task_id="bench")
+
+
+def _burst(client: SentinelClient, callers: int, samples: list) -> None:
+    barrier = threading.Barrier(callers)
+
+    def call(n: int) -> None:
+        barrier.wait()
+        start = time.perf_counter()
+        client.request_secret(f"bench-resource-{n}", INTENT)
+        samples.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=call, args=(n,)) for n in range(callers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def _run(server: StubServer, args, batch_window) -> tuple:
+    samples: list = []
+    with SentinelClient(
+        server.url,
+        "bench-token",
+        "bench",
+        prefer_agent=False,
+        max_connections=args.callers,
+        batch_window=batch_window,
+    ) as client:
+        before = server.access_requests
+        for _ in range(args.bursts):
+            _burst(client, args.callers, samples)
+        stats = client.batcher.stats if client.batcher else None
+    return samples, server.access_requests - before, stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--callers", type=int, default=200)
+    parser.add_argument("--bursts", type=int, default=20)
+    parser.add_argument("--window", type=float, default=0.003)
+    args = parser.parse_args()
+
+    with StubServer() as server:
+        for label, window in (("unbatched", None), ("batched", args.window)):
+            samples, upstream, stats = _run(server, args, window)
+            extra = ""
+            if stats is not None:
+                extra = (
+                    f"  mean_batch={stats.mean_batch_size:.1f}"
+                    f"  mean_queue={stats.mean_queue_delay * 1000:.2f}ms"
+                    f"  max_queue={stats.max_queue_delay * 1000:.2f}ms"
+                )
+            print(
+                format_row(f"{label} x{args.callers}", summarize(samples)),
+                f"upstream={upstream}{extra}",
+            )
+
+
+if __name__ == "__main__":
+    main()
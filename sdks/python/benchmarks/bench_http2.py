@@ -0,0 +1,141 @@
+"""Compare HTTP/1.1 and HTTP/2 under concurrent request_secret callers.
+
+Usage:
+    pip install hypercorn trustme "httpx[http2]"
+    python benchmarks/bench_http2.py [--calls-per-caller 20]
+
+A hypercorn server (TLS, ALPN offering h2 and http/1.1) in a child process
+answers the access request endpoint. For 1, 32 and 256 concurrent threads sharing one
+SentinelClient, the script reports tail latency and how many TCP
+connections the server saw.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import trustme
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from _server import APPROVED, format_row, summarize  # noqa: E402
+from sentinel_client import AccessIntent, SentinelClient, SentinelError  # noqa: E402
+
+INTENT = AccessIntent(summary="bench", description="benchmark", task_id="bench")
+BODY = json.dumps(APPROVED).encode()
+
+
+class _App:
+    """ASGI app that records client addresses; `/__peers` reports and resets."""
+
+    def __init__(self):
+        self.peers = set()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+        while (await receive()).get("more_body"):
+            pass
+        body = BODY
+        if scope["path"] == "/__peers":
+            body = str(len(self.peers)).encode()
+            self.peers.clear()
+        else:
+            self.peers.add(tuple(scope["client"]))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _serve(port: int, certfile: str) -> None:
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.certfile = certfile
+    config.keyfile = certfile
+    config.alpn_protocols = ["h2", "http/1.1"]
+    config.backlog = 2048
+    config.keep_alive_timeout = 60
+    config.keep_alive_max_requests = 1_000_000
+    config.h2_max_concurrent_streams = 512
+    config.loglevel = "WARNING"
+    asyncio.run(serve(_App(), config))
+
+
+def _run(client: SentinelClient, callers: int, calls: int) -> tuple:
+    errors = []
+
+    def worker(_):
+        samples = []
+        for _ in range(calls):
+            start = time.perf_counter()
+            try:
+                client.request_secret("bench-resource", INTENT)
+            except SentinelError:
+                errors.append(1)
+                continue
+            samples.append(time.perf_counter() - start)
+        return samples
+
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        samples = [s for batch in pool.map(worker, range(callers)) for s in batch]
+    return samples, len(errors)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls-per-caller", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as certdir:
+        ca = trustme.CA()
+        certfile = os.path.join(certdir, "server.pem")
+        cafile = os.path.join(certdir, "ca.pem")
+        ca.issue_cert("localhost").private_key_and_cert_chain_pem.write_to_path(
+            certfile
+        )
+        ca.cert_pem.write_to_path(cafile)
+        os.environ["SSL_CERT_FILE"] = cafile
+
+        port = _free_port()
+        url = f"https://localhost:{port}"
+        server = multiprocessing.Process(target=_serve, args=(port, certfile))
+        server.start()
+        time.sleep(1.0)
+        try:
+            for callers in (1, 32, 256):
+                for http2 in (False, True):
+                    with SentinelClient(url, "bench-token", "bench", http2=http2) as c:
+                        samples, errors = _run(c, callers, args.calls_per_caller)
+                        connections = c._http.get(f"{url}/__peers").text
+                    label = f"{'HTTP/2' if http2 else 'HTTP/1.1'} x{callers}"
+                    print(
+                        format_row(label, summarize(samples)),
+                        f"connections={connections} errors={errors}",
+                    )
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    main()
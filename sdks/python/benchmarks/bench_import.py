@@ -0,0 +1,71 @@
+"""Measure cold-start import time of the `sentinel` CLI and the package.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 20] [--budget-ms 30]
+
+Each run starts a fresh interpreter with `-X importtime` and reads the
+cumulative import time of the target module, so interpreter startup itself
+is excluded. The CLI import must stay within `--budget-ms` (median); the
+script exits non-zero when it does not, so it can gate CI. The full client
+import is shown for comparison.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(__file__), "..", "src")
+
+TARGETS = (
+    ("sentinel_client.cli", "import sentinel_client.cli"),
+    ("sentinel_client", "import sentinel_client"),
+    ("sentinel_client.client", "import sentinel_client.client"),
+)
+
+
+def _import_ms(module: str, code: str) -> float:
+    """Cumulative import time of `module` in a fresh interpreter, in ms."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=dict(os.environ, PYTHONPATH=SRC),
+    )
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=30.0)
+    args = parser.parse_args()
+
+    # warm the bytecode cache so the first run does not pay for compilation
+    _import_ms(*TARGETS[2])
+
+    medians = {}
+    for module, code in TARGETS:
+        samples = [_import_ms(module, code) for _ in range(args.runs)]
+        medians[module] = statistics.median(samples)
+        print(
+            f"{module:<28} median={medians[module]:7.2f}ms  "
+            f"min={min(samples):7.2f}ms  max={max(samples):7.2f}ms"
+        )
+
+    cli = medians["sentinel_client.cli"]
+    if cli > args.budget_ms:
+        print(f"FAIL: CLI import {cli:.2f}ms exceeds {args.budget_ms:.0f}ms budget")
+        sys.exit(1)
+    print(f"OK: CLI import {cli:.2f}ms within {args.budget_ms:.0f}ms budget")
+
+
+if __name__ == "__main__":
+    main()
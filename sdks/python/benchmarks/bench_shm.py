@@ -0,0 +1,83 @@
+"""Compare upstream access requests from pre-forked workers with private and shared caches.
+
+Usage:
+    python benchmarks/bench_shm.py [--workers 16] [--resources 50] [--rounds 20]
+
+Each worker process has its own SentinelClient and requests every resource
+`--rounds` times, as a gunicorn worker serving traffic would. With a private
+`GrantCache` each worker fetches every grant itself; with a
+`SharedGrantCache` one worker fetches and all of them read it.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from _server import StubServer, format_row, summarize  # noqa: E402
+from sentinel_client import AccessIntent, GrantCache, SentinelClient  # noqa: E402
+from sentinel_client.shm import SharedGrantCache  # noqa: E402
+
+INTENT = AccessIntent(summary="bench", description="benchmark", task_id="bench")
+
+
+def _worker(url, shm_path, resources, rounds, start, queue) -> None:
+    cache = SharedGrantCache(shm_path) if shm_path else GrantCache()
+    samples = []
+    with SentinelClient(
+        url, "bench-token", "bench", prefer_agent=False, cache=cache
+    ) as c:
+        start.wait()
+        for _ in range(rounds):
+            for i in range(resources):
+                t0 = time.perf_counter()
+                c.request_secret(f"bench-resource-{i}", INTENT)
+                samples.append(time.perf_counter() - t0)
+    queue.put(samples)
+
+
+def _run(server, shm_path, args) -> tuple:
+    ctx = multiprocessing.get_context("fork")
+    start, queue = ctx.Event(), ctx.Queue()
+    workers = [
+        ctx.Process(
+            target=_worker,
+            args=(server.url, shm_path, args.resources, args.rounds, start, queue),
+        )
+        for _ in range(args.workers)
+    ]
+    for w in workers:
+        w.start()
+    before = server.access_requests
+    start.set()
+    samples = [s for _ in workers for s in queue.get()]
+    for w in workers:
+        w.join()
+    return samples, server.access_requests - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--resources", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    with StubServer() as server, tempfile.TemporaryDirectory() as tmp:
+        for label, shm_path in (
+            ("private GrantCache", None),
+            ("SharedGrantCache", os.path.join(tmp, "grants.shm")),
+        ):
+            samples, upstream = _run(server, shm_path, args)
+            print(
+                format_row(f"{label} x{args.workers}", summarize(samples)),
+                f"upstream={upstream}",
+            )
+
+
+if __name__ == "__main__":
+    main()
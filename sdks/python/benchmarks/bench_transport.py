@@ -0,0 +1,66 @@
+"""Compare per-call connections against the pooled SentinelClient transport.
+
+Usage:
+    python benchmarks/bench_transport.py [--iterations 2000]
+
+Both runs drive `request_secret` against a local stub server. The baseline
+reproduces the previous behaviour (module-level `httpx.post`, a new TCP
+connection per call); the pooled run uses the client's keep-alive pool.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from _server import StubServer, format_row, summarize  # noqa: E402
+from sentinel_client import AccessIntent, SentinelClient  # noqa: E402
+
+INTENT = AccessIntent(summary="bench", description="benchmark", task_id="bench")
+
+
+class _UnpooledClient(SentinelClient):
+    """SentinelClient variant that opens a fresh connection for every call."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._http.close()
+        self._http = httpx  # module-level helpers, as before pooling
+
+
+def _run(client: SentinelClient, iterations: int) -> list:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        client.request_secret("bench-resource", INTENT)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    for label, factory in (
+        ("per-call connection", _UnpooledClient),
+        ("pooled keep-alive", SentinelClient),
+    ):
+        with StubServer() as server:
+            client = factory(server.url, "bench-token", "bench-agent")
+            _run(client, 50)  # warm-up
+            samples = _run(client, args.iterations)
+            if isinstance(client._http, httpx.Client):
+                client.close()
+            print(
+                format_row(label, summarize(samples)),
+                f"connections={server.connections}",
+            )
+
+
+if __name__ == "__main__":
+    main()
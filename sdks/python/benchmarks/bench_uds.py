@@ -0,0 +1,48 @@
+"""Compare request_secret latency over loopback TCP and a Unix domain socket.
+
+Usage:
+    python benchmarks/bench_uds.py [--iterations 5000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from _server import StubServer, UnixStubServer, format_row, summarize  # noqa: E402
+from sentinel_client import AccessIntent, SentinelClient  # noqa: E402
+
+INTENT = AccessIntent(summary="bench", description="benchmark", task_id="bench")
+
+
+def _run(client: SentinelClient, iterations: int) -> list:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        client.request_secret("bench-resource", INTENT)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        servers = (
+            ("loopback TCP", StubServer()),
+            ("unix domain socket", UnixStubServer(os.path.join(tmp, "s.sock"))),
+        )
+        for label, server in servers:
+            with server, SentinelClient(server.url, "bench-token", "bench") as client:
+                _run(client, 200)  # warm-up
+                samples = _run(client, args.iterations)
+            print(format_row(label, summarize(samples)))
+
+
+if __name__ == "__main__":
+    main()
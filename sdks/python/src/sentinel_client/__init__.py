@@ -1,29 +1,87 @@
-from .client import SentinelClient
-from .types import (
-    AccessIntent,
-    AccessRequest,
-    AccessResponse,
-    AccessStatus,
-    SecretPayload,
-)
-from .exceptions import (
-    SentinelError,
-    SentinelAuthError,
-    SentinelNetworkError,
-    SentinelTimeoutError,
-    SentinelDeniedError,
-)
-
-__all__ = [
-    "SentinelClient",
-    "AccessIntent",
-    "AccessRequest",
-    "AccessResponse",
-    "AccessStatus",
-    "SecretPayload",
-    "SentinelError",
-    "SentinelAuthError",
-    "SentinelNetworkError",
-    "SentinelTimeoutError",
-    "SentinelDeniedError",
-]
+"""Python client SDK for Sentinel.
+
+Public names are imported on first access (PEP 562), so `import
+sentinel_client` and the `sentinel` CLI start without loading httpx or
+pydantic until a client or model is actually used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .client import SentinelClient
+    from .async_client import AsyncSentinelClient
+    from .futures import SecretFuture
+    from .batcher import BatchStats, RequestBatcher
+    from .cache import CacheStats, DenialCache, GrantCache
+    from .shm import SharedGrantCache
+    from .poller import ApprovalPoller, PollerStats
+    from .polling import ExponentialBackoff, FixedInterval, PollStats, PollStrategy
+    from .refresh import RefreshAheadScheduler, RefreshStats
+    from .singleflight import FlightStats, SingleFlight
+    from .types import (
+        AccessIntent,
+        AccessRequest,
+        AccessResponse,
+        AccessStatus,
+        SecretOutcome,
+        SecretPayload,
+        SecretResult,
+    )
+    from .exceptions import (
+        SentinelError,
+        SentinelAuthError,
+        SentinelNetworkError,
+        SentinelTimeoutError,
+        SentinelDeniedError,
+    )
+
+# public name -> submodule that defines it
+_EXPORTS: Dict[str, str] = {
+    "SentinelClient": ".client",
+    "AsyncSentinelClient": ".async_client",
+    "SecretFuture": ".futures",
+    "RequestBatcher": ".batcher",
+    "BatchStats": ".batcher",
+    "GrantCache": ".cache",
+    "DenialCache": ".cache",
+    "CacheStats": ".cache",
+    "SharedGrantCache": ".shm",
+    "PollStrategy": ".polling",
+    "FixedInterval": ".polling",
+    "ExponentialBackoff": ".polling",
+    "PollStats": ".polling",
+    "ApprovalPoller": ".poller",
+    "PollerStats": ".poller",
+    "RefreshAheadScheduler": ".refresh",
+    "RefreshStats": ".refresh",
+    "SingleFlight": ".singleflight",
+    "FlightStats": ".singleflight",
+    "AccessIntent": ".types",
+    "AccessRequest": ".types",
+    "AccessResponse": ".types",
+    "AccessStatus": ".types",
+    "SecretPayload": ".types",
+    "SecretOutcome": ".types",
+    "SecretResult": ".types",
+    "SentinelError": ".exceptions",
+    "SentinelAuthError": ".exceptions",
+    "SentinelNetworkError": ".exceptions",
+    "SentinelTimeoutError": ".exceptions",
+    "SentinelDeniedError": ".exceptions",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip this hook
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(__all__)
@@ -0,0 +1,378 @@
+"""Local caching sidecar ("sentinel agent").
+
+The agent listens on a Unix domain socket and speaks the same HTTP API as the
+Sentinel server, so any `SentinelClient` can talk to it unchanged. All local
+processes share its single pooled upstream connection; approved grants are
+served from memory until they expire, identical in-flight requests (same
+resource, intent and TTL) are collapsed into one upstream request, and each
+pending approval is polled upstream exactly once no matter how many local
+clients are waiting on it.
+"""
+
+import hmac
+import json
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+import httpx
+
+from .cache import GrantCache
+from .polling import _RETRYABLE_STATUSES, parse_retry_after
+from .types import SecretPayload
+
+if TYPE_CHECKING:
+    from .client import SentinelClient
+
+AGENT_SOCKET_ENV = "SENTINEL_AGENT_SOCKET"
+
+# Resolved requests stay queryable this long for clients still polling them.
+_RESOLVED_RETENTION = 300.0
+
+
+def default_agent_socket() -> str:
+    """Return the per-user socket path the agent listens on by default."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, f"sentinel-agent-{os.getuid()}.sock")
+    # never a shared directory such as /tmp, where another user could bind first
+    return os.path.join(os.path.expanduser("~"), ".sentinel", "agent.sock")
+
+
+def agent_metadata_path(socket_path: str) -> str:
+    """Return the file in which the agent listening on `socket_path` names its upstream."""
+    return f"{socket_path}.json"
+
+
+def _owned_by_user(path: str, kind: int) -> bool:
+    """True if `path` is a `kind` file of this user in a directory only they can write."""
+    try:
+        st = os.lstat(path)
+        parent = os.stat(os.path.dirname(os.path.abspath(path)))
+    except OSError:
+        return False
+    return (
+        stat.S_IFMT(st.st_mode) == kind
+        and st.st_uid == os.getuid()
+        and parent.st_uid in (os.getuid(), 0)
+        and not parent.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def find_agent_socket(base_url: str) -> Optional[str]:
+    """
+    Return the socket of a running local agent for `base_url`, or None.
+
+    The socket and its metadata file must belong to the current user, sit in a
+    directory no other user can write to, and name `base_url` as the agent's
+    upstream; otherwise the client talks to the server directly.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = os.environ.get(AGENT_SOCKET_ENV) or default_agent_socket()
+    metadata = agent_metadata_path(path)
+    if not (
+        _owned_by_user(path, stat.S_IFSOCK) and _owned_by_user(metadata, stat.S_IFREG)
+    ):
+        return None
+    try:
+        with open(metadata) as f:
+            upstream = json.load(f).get("upstream")
+    except (OSError, ValueError, AttributeError):
+        return None
+    if not isinstance(upstream, str) or upstream.rstrip("/") != base_url.rstrip("/"):
+        return None
+    return path
+
+
+class _PendingRequest:
+    """An upstream request shared by every local client asking for the same grant."""
+
+    def __init__(self, key: Tuple[Any, ...], grant_key: Tuple[Any, ...]):
+        self.key = key
+        self.grant_key = grant_key
+        self.ready = threading.Event()
+        self.status_code = 0
+        self.response: Dict[str, Any] = {}
+        self.resolved_at: Optional[float] = None
+
+
+class SentinelAgent:
+    def __init__(
+        self,
+        upstream: "SentinelClient",
+        socket_path: Optional[str] = None,
+        poll_interval: float = 2.0,
+        max_wait: float = 600.0,
+        cache: Optional[GrantCache] = None,
+    ):
+        """
+        Initialize the local agent.
+
+        Args:
+            upstream: Client used for all upstream traffic. Its API token is
+                also the token local clients must present.
+            socket_path: Unix socket to listen on (defaults to `default_agent_socket()`).
+            poll_interval: Seconds between upstream polls of a pending approval.
+            max_wait: Seconds after which an unresolved approval stops being polled.
+            cache: Cache for approved grants (defaults to a fresh `GrantCache`).
+        """
+        self.upstream = upstream
+        self.socket_path = socket_path or default_agent_socket()
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self.cache = cache if cache is not None else GrantCache()
+        self._inflight: Dict[Tuple[Any, ...], _PendingRequest] = {}
+        self._requests: Dict[str, _PendingRequest] = {}
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+
+    def serve_forever(self) -> None:
+        """Listen on the socket until `shutdown()` is called."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.socket_path)), 0o700, True)
+        metadata = agent_metadata_path(self.socket_path)
+        for path in (self.socket_path, metadata):
+            if os.path.lexists(path):
+                os.unlink(path)
+        old_umask = os.umask(0o177)  # socket is reachable by this user only
+        try:
+            # written before binding, so a client that sees the socket can check it
+            self._write_metadata(metadata)
+            self._server = _AgentServer(self.socket_path, self)
+        finally:
+            os.umask(old_umask)
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            for path in (self.socket_path, metadata):
+                if os.path.lexists(path):
+                    os.unlink(path)
+
+    def _write_metadata(self, path: str) -> None:
+        """Record the upstream URL so clients only use an agent for their own server."""
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"upstream": self.upstream.base_url}, f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def shutdown(self) -> None:
+        """Stop a running `serve_forever()` loop."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def authorized(self, authorization: Optional[str]) -> bool:
+        expected = f"Bearer {self.upstream.api_token}"
+        return hmac.compare_digest((authorization or "").encode(), expected.encode())
+
+    def request_access(self, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """Answer an access request from the cache, an in-flight request, or upstream."""
+        grant_key = (
+            body.get("resource_id"),
+            body.get("version"),
+            body.get("environment"),
+            body.get("agent_id"),
+        )
+        grant = self.cache.get(grant_key)
+        if grant is not None:
+            return _cached_response(grant)
+        # Only requests with the same intent are shared, so the audit trail holds.
+        key = grant_key + (
+            body.get("ttl_seconds"),
+            json.dumps(body.get("intent"), sort_keys=True),
+        )
+        with self._lock:
+            self._prune()
+            pending = self._inflight.get(key)
+            # A leader may have cached the grant and retired since our miss
+            grant = self.cache.get(grant_key) if pending is None else None
+            leader = pending is None and grant is None
+            if leader:
+                pending = self._inflight[key] = _PendingRequest(key, grant_key)
+
+        if grant is not None:
+            return _cached_response(grant)
+        if not leader:
+            pending.ready.wait()
+            return pending.status_code, pending.response
+
+        try:
+            response = self.upstream._http.post(
+                f"{self.upstream.base_url}/v1/access/request",
+                headers=self.upstream.headers,
+                json=body,
+            )
+            pending.status_code = response.status_code
+            pending.response = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            pending.status_code = 502
+            pending.response = {"error": f"Upstream error: {e}"}
+        finally:
+            request_id = pending.response.get("request_id")
+            if pending.status_code == 202 and request_id:
+                with self._lock:
+                    self._requests[request_id] = pending
+                threading.Thread(
+                    target=self._poll, args=(request_id, pending), daemon=True
+                ).start()
+            else:
+                self._resolve(pending)
+            pending.ready.set()
+        return pending.status_code, pending.response
+
+    def request_status(self, request_id: str) -> Optional[Dict[str, Any]]:
+        """Return the last known state of a request this agent is tracking."""
+        with self._lock:
+            pending = self._requests.get(request_id)
+        return pending.response if pending is not None else None
+
+    def _poll(self, request_id: str, pending: _PendingRequest) -> None:
+        """
+        Poll one pending approval upstream on behalf of every local waiter.
+
+        Throttling and gateway errors are retried, after `Retry-After` if the
+        server sends one. If polling gives up before the request is settled,
+        the agent stops answering for it and local clients poll upstream
+        through the proxy instead.
+        """
+        deadline = time.monotonic() + self.max_wait
+        delay = self.poll_interval
+        try:
+            while time.monotonic() < deadline:
+                time.sleep(delay)
+                delay = self.poll_interval
+                try:
+                    response = self.upstream._http.get(
+                        f"{self.upstream.base_url}/v1/access/requests/{request_id}",
+                        headers=self.upstream.headers,
+                    )
+                except httpx.RequestError:
+                    continue
+                if response.status_code in _RETRYABLE_STATUSES:
+                    retry_after = parse_retry_after(response)
+                    if retry_after is not None:
+                        remaining = max(deadline - time.monotonic(), 0.0)
+                        delay = min(max(retry_after, delay), remaining)
+                    continue
+                if response.status_code != 200:
+                    break
+                try:
+                    data = response.json()
+                except ValueError:
+                    break
+                if not isinstance(data, dict):
+                    break
+                if data.get("status") != "PENDING_APPROVAL":
+                    pending.status_code = 200
+                    pending.response = data
+                    break
+        finally:
+            if pending.status_code != 200:
+                with self._lock:
+                    self._requests.pop(request_id, None)
+            self._resolve(pending)
+
+    def _resolve(self, pending: _PendingRequest) -> None:
+        """Retire an in-flight request, caching its grant if it was approved."""
+        secret = pending.response.get("secret")
+        if pending.response.get("status") == "APPROVED" and secret:
+            try:
+                self.cache.put(pending.grant_key, SecretPayload(**secret))
+            except (TypeError, ValueError):
+                pass
+        with self._lock:
+            if self._inflight.get(pending.key) is pending:
+                del self._inflight[pending.key]
+            pending.resolved_at = time.monotonic()
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - _RESOLVED_RETENTION
+        for request_id in [
+            r
+            for r, p in self._requests.items()
+            if p.resolved_at is not None and p.resolved_at < cutoff
+        ]:
+            del self._requests[request_id]
+
+
+def _cached_response(grant: SecretPayload) -> Tuple[int, Dict[str, Any]]:
+    return 200, {
+        "request_id": "agent_cache",
+        "status": "APPROVED",
+        "secret": grant.model_dump(),
+        "message": "Served from the local sentinel agent cache.",
+    }
+
+
+class _AgentServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    # The default backlog of 5 refuses bursts of local clients with EAGAIN
+    request_queue_size = socket.SOMAXCONN
+
+    def __init__(self, path: str, agent: SentinelAgent):
+        super().__init__(path, _AgentHandler)
+        self.agent = agent
+
+
+class _AgentHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _AgentServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _proxy_get(self) -> None:
+        upstream = self.server.agent.upstream
+        try:
+            response = upstream._http.get(
+                f"{upstream.base_url}{self.path}", headers=upstream.headers
+            )
+            self._send(response.status_code, response.json())
+        except (httpx.HTTPError, ValueError) as e:
+            self._send(502, {"error": f"Upstream error: {e}"})
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        agent = self.server.agent
+        if not agent.authorized(self.headers.get("Authorization")):
+            self._send(401, {"error": "Unauthorized"})
+        elif self.path != "/v1/access/request":
+            self._send(404, {"error": "Not found"})
+        else:
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                self._send(400, {"error": "Invalid Request"})
+                return
+            self._send(*agent.request_access(payload))
+
+    def do_GET(self) -> None:
+        agent = self.server.agent
+        if not agent.authorized(self.headers.get("Authorization")):
+            self._send(401, {"error": "Unauthorized"})
+            return
+        prefix = "/v1/access/requests/"
+        if self.path.startswith(prefix):
+            status = agent.request_status(self.path[len(prefix) :])
+            if status is not None:
+                self._send(200, status)
+                return
+        self._proxy_get()
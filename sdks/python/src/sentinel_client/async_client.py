@@ -0,0 +1,287 @@
+import asyncio
+import os
+from typing import Optional, Dict, Any
+import httpx
+
+from .client import (
+    _access_request_error,
+    _api_error,
+    _resolve_access_response,
+    _resolve_http2,
+    _split_uds,
+)
+from .agent import find_agent_socket
+from .codec import decode_access_response, encode_access_request
+from .polling import FixedInterval, PollRun, PollStrategy
+from .types import (
+    AccessIntent,
+    SecretPayload,
+)
+from .exceptions import (
+    SentinelError,
+    SentinelNetworkError,
+    SentinelTimeoutError,
+)
+
+
+class AsyncSentinelClient:
+    def __init__(
+        self,
+        base_url: str,
+        api_token: str,
+        agent_id: str,
+        timeout: float = 30.0,
+        environment: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        uds: Optional[str] = None,
+        prefer_agent: bool = True,
+        poll_strategy: Optional[PollStrategy] = None,
+        validate_requests: bool = False,
+    ):
+        """
+        Initialize the asyncio Sentinel Client.
+
+        Mirrors `SentinelClient`, but every network call is a coroutine and
+        approval polling sleeps with `asyncio.sleep`, so many pending requests
+        can be awaited from a single event loop. Call `aclose()` (or use the
+        client as an async context manager) to release the connections.
+
+        Args:
+            base_url: The URL of the Sentinel server (e.g., "http://localhost:3000").
+                A "unix:///path/to.sock" URL connects over a Unix domain socket.
+            api_token: The API token for authentication.
+            agent_id: The ID of the agent using this client.
+            timeout: Default request timeout in seconds.
+            environment: Default environment to use (defaults to "production" or SENTINEL_ENVIRONMENT env var).
+            max_connections: Maximum number of concurrent connections to the server.
+            max_keepalive_connections: Maximum number of idle connections kept open for reuse.
+            keepalive_expiry: Seconds an idle connection is kept before being closed.
+            http2: Negotiate HTTP/2 so concurrent calls multiplex over one connection.
+                Requires the `http2` extra; servers that do not offer HTTP/2 via
+                TLS ALPN are spoken to over HTTP/1.1.
+            uds: Path of a Unix domain socket to reach a co-located server through,
+                bypassing the TCP stack.
+            prefer_agent: Route requests through a local `sentinel agent` sidecar
+                when no explicit socket was given and this user's agent for
+                the same `base_url` is running.
+            poll_strategy: How to pace status polls of pending approvals, e.g.
+                `ExponentialBackoff()`. Defaults to a fixed `polling_interval`.
+            validate_requests: Build access request bodies through the
+                `AccessRequest` model, so invalid arguments raise
+                `pydantic.ValidationError` before anything is sent.
+        """
+        self.base_url, self.uds = _split_uds(base_url, uds)
+        if self.uds is None and prefer_agent:
+            self.uds = find_agent_socket(self.base_url)
+        self.api_token = api_token
+        self.poll_strategy = poll_strategy
+        self.validate_requests = validate_requests
+        self.agent_id = agent_id
+        self.timeout = timeout
+        self.environment = (
+            environment or os.environ.get("SENTINEL_ENVIRONMENT") or "production"
+        )
+        self.headers = {
+            "Authorization": f"Bearer {api_token}",
+            "Content-Type": "application/json",
+            "User-Agent": f"SentinelPythonSDK/0.1.1 Agent/{agent_id}",
+        }
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = _resolve_http2(http2)
+        transport = (
+            httpx.AsyncHTTPTransport(uds=self.uds, limits=self.limits, http2=self.http2)
+            if self.uds
+            else None
+        )
+        self._http = httpx.AsyncClient(
+            limits=self.limits, timeout=timeout, http2=self.http2, transport=transport
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncSentinelClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def request_secret(
+        self,
+        resource_id: str,
+        intent: AccessIntent,
+        version: Optional[int] = None,
+        environment: Optional[str] = None,
+        ttl_seconds: int = 3600,
+        polling_interval: float = 2.0,
+        polling_timeout: float = 60.0,
+    ) -> SecretPayload:
+        """
+        Request a secret for a specific resource.
+
+        If the request is PENDING_APPROVAL, this coroutine polls without
+        blocking the event loop until the request is APPROVED, DENIED, or
+        times out.
+
+        Args:
+            resource_id: The ID of the resource to access.
+            intent: The intent details (summary, description, task_id).
+            version: Optional version number to request.
+            environment: Optional environment to request (defaults to client environment).
+            ttl_seconds: Time-to-live for the secret in seconds.
+            polling_interval: Seconds to wait between polling attempts.
+            polling_timeout: Maximum seconds to wait for approval.
+
+        Returns:
+            SecretPayload containing the secret value and metadata.
+
+        Raises:
+            SentinelDeniedError: If the request is denied.
+            SentinelTimeoutError: If polling times out.
+            SentinelError: For other API errors.
+        """
+        request_body = encode_access_request(
+            self.agent_id,
+            resource_id,
+            version,
+            environment or self.environment,
+            intent,
+            ttl_seconds,
+            validate=self.validate_requests,
+        )
+
+        try:
+            response = await self._http.post(
+                f"{self.base_url}/v1/access/request",
+                headers=self.headers,
+                json=request_body,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+
+            access_response = decode_access_response(response.content)
+            secret = _resolve_access_response(access_response)
+            if secret is None:
+                return await self._poll_for_approval(
+                    access_response.request_id, polling_interval, polling_timeout
+                )
+            return secret
+
+        except httpx.HTTPStatusError as e:
+            raise _access_request_error(e) from e
+        except httpx.RequestError as e:
+            raise SentinelNetworkError(f"Network error: {e}") from e
+        except Exception as e:
+            # re-raise known exceptions
+            if isinstance(e, SentinelError):
+                raise
+            raise SentinelError(f"Unexpected error: {e}") from e
+
+    async def fetch_secrets(self, environment: Optional[str] = None) -> Dict[str, str]:
+        """
+        Fetch all latest secrets for the current environment/project.
+
+        Args:
+            environment: Optional environment to fetch secrets for (defaults to client environment).
+
+        Returns:
+            Dict[str, str]: A dictionary mapping resource IDs to secret values.
+        """
+        target_environment = environment or self.environment
+        params = {"environment": target_environment} if target_environment else {}
+
+        try:
+            response = await self._http.get(
+                f"{self.base_url}/v1/secrets",
+                headers=self.headers,
+                params=params,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            raise _api_error(e) from e
+        except httpx.RequestError as e:
+            raise SentinelNetworkError(f"Network error: {e}") from e
+        except Exception as e:
+            raise SentinelError(f"Unexpected error: {e}") from e
+
+    async def list_resources(self, environment: Optional[str] = None) -> list[str]:
+        """
+        List all available resource IDs that can be requested.
+
+        Args:
+            environment: Optional environment to list resources for (defaults to client environment).
+
+        Returns:
+            list[str]: A list of resource IDs.
+        """
+        target_environment = environment or self.environment
+        params = {"environment": target_environment} if target_environment else {}
+
+        try:
+            response = await self._http.get(
+                f"{self.base_url}/v1/resources",
+                headers=self.headers,
+                params=params,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            raise _api_error(e) from e
+        except httpx.RequestError as e:
+            raise SentinelNetworkError(f"Network error: {e}") from e
+        except Exception as e:
+            raise SentinelError(f"Unexpected error: {e}") from e
+
+    async def _poll_for_approval(
+        self, request_id: str, interval: float, timeout: float
+    ) -> SecretPayload:
+        """Poll the request status until approved, denied, or timeout."""
+        run = PollRun(self.poll_strategy or FixedInterval(interval), timeout)
+        try:
+            while True:
+                wait = run.next_wait()
+                if wait is None:
+                    break
+                await asyncio.sleep(wait)
+
+                try:
+                    response = await self._http.get(
+                        f"{self.base_url}/v1/access/requests/{request_id}",
+                        headers=self.headers,
+                        timeout=self.timeout,
+                    )
+                except httpx.RequestError:
+                    # transient network errors back off like any other poll
+                    run.failed()
+                    continue
+                if run.retry_later(response):
+                    continue
+
+                try:
+                    response.raise_for_status()
+                except httpx.HTTPStatusError as e:
+                    # 404 or other non-transient errors should abort
+                    raise SentinelError(f"Error during polling: {e}") from e
+
+                secret = _resolve_access_response(
+                    decode_access_response(response.content)
+                )
+                if secret is not None:
+                    return secret
+
+                # If still PENDING_APPROVAL, continue loop
+        finally:
+            run.finish()
+
+        raise SentinelTimeoutError(f"Polling timed out after {timeout} seconds")
@@ -0,0 +1,250 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, Optional, Tuple, Union
+
+from .codec import decode_access_item
+from .exceptions import SentinelError
+from .types import AccessRequest
+
+if TYPE_CHECKING:
+    from .client import SentinelClient
+
+
+@dataclass
+class BatchStats:
+    batches: int = 0
+    items: int = 0
+    max_batch_size: int = 0
+    queue_delay: float = 0.0
+    max_queue_delay: float = 0.0
+    fallbacks: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.items / self.batches if self.batches else 0.0
+
+    @property
+    def mean_queue_delay(self) -> float:
+        """Average seconds an item waited for its batch to be sent."""
+        return self.queue_delay / self.items if self.items else 0.0
+
+
+class _Batch:
+    def __init__(self, deadline: float) -> None:
+        self.deadline = deadline
+        self.items: List[Tuple[Dict[str, Any], float, Future]] = []
+
+
+class RequestBatcher:
+    def __init__(
+        self,
+        client: "SentinelClient",
+        window: float = 0.003,
+        max_batch_size: int = 100,
+        max_concurrent_batches: int = 4,
+    ):
+        """
+        Coalesce concurrent access requests into batch requests.
+
+        Requests submitted within `window` seconds of the first one in a batch
+        are sent together through `POST /v1/access/requests/batch`, as soon as
+        the window closes or `max_batch_size` requests have been collected.
+        Only requests for the same environment and intent share a batch.
+        Each `submit()` returns a `Future` for that request's own
+        `AccessResponse`; pending approvals are left to the caller to poll.
+        Against a server without the batch endpoint the futures resolve to
+        None and the caller sends its request directly. A caller that stops
+        waiting can `cancel()` its future; the request is then left out of
+        its batch unless that batch is already being sent.
+
+        Args:
+            client: Client whose connection pool and credentials are used.
+            window: Seconds to wait for more requests after the first one.
+            max_batch_size: Requests per batch (the server accepts 100).
+            max_concurrent_batches: Batch requests in flight at once, so a
+                burst spanning several batches is not sent one by one.
+        """
+        self._client = client
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.max_concurrent_batches = max_concurrent_batches
+        self._condition = threading.Condition()
+        self._batches: Dict[Hashable, _Batch] = {}
+        self._supported = True
+        self._stats = BatchStats()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._senders: Optional[ThreadPoolExecutor] = None
+
+    def submit(self, request: Union[AccessRequest, Dict[str, Any]]) -> Future:
+        """
+        Queue `request` for the next batch.
+
+        `request` is an `AccessRequest` or its JSON body as built by
+        `encode_access_request`.
+
+        Returns:
+            Future: Resolves to `(AccessResponse, long_poll_seconds)`, or None
+                if the server does not support batching; fails with
+                `SentinelError` if the batch request failed.
+        """
+        future: Future = Future()
+        if isinstance(request, AccessRequest):
+            request = request.model_dump()
+        intent = request["intent"]
+        key = (
+            request["environment"],
+            intent["summary"],
+            intent["description"],
+            intent["task_id"],
+        )
+        with self._condition:
+            if self._closed:
+                raise SentinelError("Request batcher is shut down")
+            if not self._supported:
+                self._stats.fallbacks += 1
+                future.set_result(None)
+                return future
+            batch = self._batches.get(key)
+            if batch is None:
+                now = time.monotonic()
+                batch = self._batches[key] = _Batch(now + self.window)
+            batch.items.append((request, time.monotonic(), future))
+            if self._thread is None:
+                self._senders = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_batches,
+                    thread_name_prefix="sentinel-batch-sender",
+                )
+                self._thread = threading.Thread(
+                    target=self._run, name="sentinel-request-batcher", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return future
+
+    def shutdown(self) -> None:
+        """Stop batching; requests not yet sent fail with `SentinelError`."""
+        with self._condition:
+            self._closed = True
+            batches, self._batches = self._batches, {}
+            self._condition.notify()
+        for batch in batches.values():
+            for _, _, future in batch.items:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(SentinelError("Request batcher shut down"))
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        if self._senders is not None:
+            # batches already handed over fail fast; wait for those in flight
+            self._senders.shutdown()
+
+    @property
+    def stats(self) -> BatchStats:
+        with self._condition:
+            return BatchStats(**vars(self._stats))
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    ready = self._take_ready(time.monotonic())
+                    if ready:
+                        break
+                    deadlines = [b.deadline for b in self._batches.values()]
+                    timeout = (
+                        max(min(deadlines) - time.monotonic(), 0) if deadlines else None
+                    )
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+            for items in ready:
+                self._senders.submit(self._send_or_fail, items)
+
+    def _send_or_fail(self, items: List[Tuple[Dict[str, Any], float, Future]]) -> None:
+        try:
+            self._send(items)
+        except Exception as e:
+            # keep the sender alive for later batches
+            for _, _, future in items:
+                if not future.done():
+                    future.set_exception(SentinelError(f"Unexpected error: {e}"))
+
+    def _take_ready(
+        self, now: float
+    ) -> List[List[Tuple[Dict[str, Any], float, Future]]]:
+        """Remove and return the batches that are full or whose window closed."""
+        ready = []
+        for key in list(self._batches):
+            batch = self._batches[key]
+            while len(batch.items) >= self.max_batch_size:
+                ready.append(batch.items[: self.max_batch_size])
+                batch.items = batch.items[self.max_batch_size :]
+            if batch.deadline <= now or not batch.items:
+                if batch.items:
+                    ready.append(batch.items)
+                del self._batches[key]
+        return ready
+
+    def _send(self, items: List[Tuple[Dict[str, Any], float, Future]]) -> None:
+        from .client import _long_poll_seconds
+
+        # callers that gave up waiting have cancelled; the rest can't from here on
+        items = [item for item in items if item[2].set_running_or_notify_cancel()]
+        if not items:
+            return
+        if self._closed:
+            for _, _, future in items:
+                future.set_exception(SentinelError("Request batcher shut down"))
+            return
+        sent_at = time.monotonic()
+        with self._condition:
+            self._stats.batches += 1
+            self._stats.items += len(items)
+            self._stats.max_batch_size = max(self._stats.max_batch_size, len(items))
+            for _, queued_at, _ in items:
+                delay = sent_at - queued_at
+                self._stats.queue_delay += delay
+                self._stats.max_queue_delay = max(self._stats.max_queue_delay, delay)
+
+        first = items[0][0]
+        try:
+            response = self._client._post_batch(
+                first["intent"],
+                first["environment"],
+                [
+                    (request["resource_id"], request["ttl_seconds"])
+                    for request, _, _ in items
+                ],
+            )
+            if response is None:
+                # older server: every caller sends its own request from now on
+                with self._condition:
+                    self._supported = False
+                    self._stats.fallbacks += len(items)
+                for _, _, future in items:
+                    future.set_result(None)
+                return
+            long_poll = _long_poll_seconds(response)
+            responses = response.json().get("responses", [])
+            if not isinstance(responses, list):
+                raise ValueError("'responses' is not a list")
+        except SentinelError as e:
+            for _, _, future in items:
+                future.set_exception(e)
+            return
+        except Exception as e:
+            # e.g. a body that is not an object; callers must not wait forever
+            for _, _, future in items:
+                future.set_exception(SentinelError(f"Unexpected error: {e}"))
+            return
+
+        for index, (_, _, future) in enumerate(items):
+            if index >= len(responses):
+                future.set_exception(SentinelError("Missing batch response item"))
+                continue
+            try:
+                future.set_result((decode_access_item(responses[index]), long_poll))
+            except ValueError as e:
+                future.set_exception(SentinelError(f"Unexpected error: {e}"))
@@ -0,0 +1,275 @@
+"""Load generator behind `sentinel bench`.
+
+Drives one client operation at a time from `concurrency` threads for a fixed
+duration and reports throughput, latency percentiles, a latency histogram
+and errors by type. Reports are plain dataclasses so the CLI can print them
+as a table or as JSON that diffs cleanly between releases.
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+from .codec import decode_access_response, encode_access_request
+from .exceptions import SentinelError
+from .types import AccessIntent, AccessStatus
+
+if TYPE_CHECKING:
+    from .client import SentinelClient
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, math.inf)
+
+
+@dataclass
+class OperationReport:
+    operation: str
+    requests: int
+    errors: Dict[str, int]
+    duration: float
+    throughput: float
+    latency_ms: Dict[str, float]
+    histogram: Dict[str, int]
+
+
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty sequence."""
+    index = max(math.ceil(fraction * len(ordered)) - 1, 0)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+def summarize(
+    operation: str, samples: List[float], errors: Dict[str, int], duration: float
+) -> OperationReport:
+    """Build the report for one operation from its successful latencies (seconds)."""
+    ordered = sorted(samples)
+    latency_ms: Dict[str, float] = {}
+    if ordered:
+        latency_ms = {
+            "p50": percentile(ordered, 0.50) * 1000,
+            "p90": percentile(ordered, 0.90) * 1000,
+            "p99": percentile(ordered, 0.99) * 1000,
+            "max": ordered[-1] * 1000,
+            "mean": sum(ordered) / len(ordered) * 1000,
+        }
+    histogram: Dict[str, int] = {}
+    lower = 0.0
+    start = 0
+    for bound in BUCKETS_MS:
+        end = start
+        while end < len(ordered) and ordered[end] * 1000 <= bound:
+            end += 1
+        label = f"<={bound:g}ms" if bound != math.inf else f">{lower:g}ms"
+        histogram[label] = end - start
+        start, lower = end, bound
+    requests = len(ordered) + sum(errors.values())
+    return OperationReport(
+        operation=operation,
+        requests=requests,
+        errors=dict(errors),
+        duration=duration,
+        throughput=requests / duration if duration > 0 else 0.0,
+        latency_ms=latency_ms,
+        histogram=histogram,
+    )
+
+
+def _pending_request_id(
+    client: "SentinelClient", resource_id: str, intent: AccessIntent
+) -> str:
+    """Create an access request that waits for approval, for the poll benchmark."""
+    request = encode_access_request(
+        client.agent_id, resource_id, None, client.environment, intent, 60
+    )
+    try:
+        response = client._http.post(
+            f"{client.base_url}/v1/access/request",
+            headers=client.headers,
+            json=request,
+            timeout=client.timeout,
+        )
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        raise SentinelError(f"Could not create a pending request: {e}") from e
+    access_response = decode_access_response(response.content)
+    if access_response.status != AccessStatus.PENDING_APPROVAL:
+        raise SentinelError(
+            f"'{resource_id}' does not require approval; "
+            "pick a resource that does for the poll benchmark"
+        )
+    return access_response.request_id
+
+
+def _poll_once(client: "SentinelClient", request_id: str) -> None:
+    """One approval status poll, as `_poll_for_approval` issues it."""
+    try:
+        response = client._http.get(
+            f"{client.base_url}/v1/access/requests/{request_id}",
+            headers=client.headers,
+            timeout=client.timeout,
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise SentinelError(f"HTTP Error: {e}") from e
+    except httpx.RequestError as e:
+        raise SentinelError(f"Network error: {e}") from e
+
+
+def _fetch_full(client: "SentinelClient") -> None:
+    """One `/v1/secrets` fetch without a snapshot to revalidate."""
+    params = {"environment": client.environment} if client.environment else {}
+    try:
+        response = client._http.get(
+            f"{client.base_url}/v1/secrets",
+            headers=client.headers,
+            params=params,
+            timeout=client.timeout,
+        )
+        response.raise_for_status()
+        response.json()
+    except httpx.HTTPStatusError as e:
+        raise SentinelError(f"HTTP Error: {e}") from e
+    except httpx.RequestError as e:
+        raise SentinelError(f"Network error: {e}") from e
+    except ValueError as e:
+        raise SentinelError(f"Unexpected error: {e}") from e
+
+
+def _operation(
+    client: "SentinelClient",
+    operation: str,
+    resource_id: str,
+    approval_resource_id: str,
+    intent: AccessIntent,
+) -> Callable[[], object]:
+    if operation == "request":
+        return lambda: client.request_secret(
+            resource_id, intent, polling_interval=0.1, polling_timeout=10.0
+        )
+    if operation == "fetch":
+        return lambda: _fetch_full(client)
+    if operation == "revalidate":
+        return client.fetch_secrets
+    if operation == "list":
+        return client.list_resources
+    if operation == "poll":
+        request_id = _pending_request_id(client, approval_resource_id, intent)
+        return lambda: _poll_once(client, request_id)
+    raise ValueError(f"Unknown operation: {operation}")
+
+
+def run_operation(
+    call: Callable[[], object],
+    concurrency: int,
+    duration: float,
+    warmup: float = 0.0,
+) -> Tuple[List[float], Dict[str, int], float]:
+    """
+    Call `call` from `concurrency` threads for `duration` seconds.
+
+    Calls made during the first `warmup` seconds are not recorded.
+
+    Returns:
+        tuple: Latencies of successful calls in seconds, error counts by
+            exception type, and the measured wall time.
+    """
+    samples: List[float] = []
+    errors: Dict[str, int] = {}
+    lock = threading.Lock()
+    start = time.monotonic()
+    record_from = start + warmup
+    deadline = record_from + duration
+
+    def worker() -> None:
+        local: List[float] = []
+        local_errors: Dict[str, int] = {}
+        while True:
+            t0 = time.monotonic()
+            if t0 >= deadline:
+                break
+            try:
+                call()
+            except Exception as e:
+                if t0 >= record_from:
+                    name = type(e).__name__
+                    local_errors[name] = local_errors.get(name, 0) + 1
+                continue
+            if t0 >= record_from:
+                local.append(time.monotonic() - t0)
+        with lock:
+            samples.extend(local)
+            for name, count in local_errors.items():
+                errors[name] = errors.get(name, 0) + count
+
+    threads = [
+        threading.Thread(target=worker, name=f"sentinel-bench-{n}")
+        for n in range(concurrency)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return samples, errors, time.monotonic() - record_from
+
+
+def run_benchmark(
+    client: "SentinelClient",
+    operations: Sequence[str] = ("request",),
+    concurrency: int = 8,
+    duration: float = 10.0,
+    warmup: float = 1.0,
+    resource_id: str = "bench-resource",
+    approval_resource_id: str = "prod-bench",
+    intent: Optional[AccessIntent] = None,
+) -> List[OperationReport]:
+    """
+    Benchmark each of `operations` in turn against `client`'s server.
+
+    Operations are "request" (`request_secret`), "fetch" (a full
+    `/v1/secrets` fetch), "revalidate" (`fetch_secrets`, which after its first
+    call only revalidates its snapshot with `If-None-Match`), "list"
+    (`list_resources`) and "poll" (one approval status poll of a request for
+    `approval_resource_id`, which must require approval and is left pending).
+
+    Returns:
+        List[OperationReport]: One report per operation, in order.
+    """
+    intent = intent or AccessIntent(
+        summary="sentinel bench",
+        description="Load test via sentinel bench",
+        task_id="sentinel-bench",
+    )
+    reports = []
+    for operation in operations:
+        call = _operation(client, operation, resource_id, approval_resource_id, intent)
+        samples, errors, elapsed = run_operation(call, concurrency, duration, warmup)
+        reports.append(summarize(operation, samples, errors, elapsed))
+    return reports
+
+
+def format_report(report: OperationReport) -> str:
+    """Render one report as a human-readable block."""
+    lines = [
+        f"{report.operation}: {report.requests} requests in {report.duration:.2f}s "
+        f"({report.throughput:.1f} req/s)"
+    ]
+    if report.latency_ms:
+        lines.append(
+            "  latency  "
+            + "  ".join(f"{k}={v:.2f}ms" for k, v in report.latency_ms.items())
+        )
+    total = sum(report.histogram.values())
+    for label, count in report.histogram.items():
+        if count:
+            bar = "#" * max(1, round(40 * count / total))
+            lines.append(f"  {label:>10} {count:>8} {bar}")
+    if report.errors:
+        lines.append(
+            "  errors   "
+            + "  ".join(f"{k}={v}" for k, v in sorted(report.errors.items()))
+        )
+    return "\n".join(lines)
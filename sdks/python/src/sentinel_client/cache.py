@@ -0,0 +1,175 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .types import SecretPayload
+
+# (resource_id, version, environment, agent_id)
+CacheKey = Tuple[str, Optional[int], str, str]
+
+
+def parse_expires_at(expires_at: str) -> Optional[float]:
+    """Parse a SecretPayload `expires_at` timestamp into seconds since the epoch."""
+    try:
+        return datetime.fromisoformat(expires_at.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, ValueError):
+        return None
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class GrantCache:
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        safety_margin: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        In-memory LRU cache of approved grants.
+
+        Grants are served until `safety_margin` seconds before their
+        `expires_at`, so callers never receive a secret that is about to lapse.
+        Grants without a parseable expiry are not cached.
+
+        Args:
+            max_entries: Maximum number of grants kept; the least recently used is evicted.
+            safety_margin: Seconds before `expires_at` at which a grant stops being served.
+            clock: Wall-clock source, overridable for tests.
+        """
+        self.max_entries = max_entries
+        self.safety_margin = safety_margin
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, Tuple[SecretPayload, float]]" = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: CacheKey) -> Optional["SecretPayload"]:
+        """Return a still-valid grant for `key`, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > self._clock():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def put(self, key: CacheKey, secret: "SecretPayload") -> None:
+        """Store a grant until shortly before it expires."""
+        expires_at = parse_expires_at(secret.expires_at)
+        if expires_at is None:
+            return
+        serve_until = expires_at - self.safety_margin
+        if serve_until <= self._clock():
+            return
+        with self._lock:
+            self._entries[key] = (secret, serve_until)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, resource_id: Optional[str] = None) -> None:
+        """Drop cached grants for `resource_id`, or every grant when omitted."""
+        with self._lock:
+            if resource_id is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == resource_id]:
+                del self._entries[key]
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+
+class DenialCache:
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Short-lived memory of denied requests.
+
+        Keyed on (resource_id, environment). While an entry is live the client
+        raises `SentinelDeniedError` without contacting the server; `stats.hits`
+        counts the round trips avoided that way.
+
+        Args:
+            ttl: Seconds a denial is remembered.
+            max_entries: Maximum number of denials kept; the oldest is evicted.
+            clock: Monotonic time source, overridable for tests.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Tuple[str, str]) -> Optional[str]:
+        """Return the remembered denial reason for `key`, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > self._clock():
+                self._hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def put(self, key: Tuple[str, str], reason: str) -> None:
+        """Remember a denial for `ttl` seconds."""
+        with self._lock:
+            self._entries[key] = (reason, self._clock() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, resource_id: Optional[str] = None) -> None:
+        """Forget denials for `resource_id`, or every denial when omitted."""
+        with self._lock:
+            if resource_id is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == resource_id]:
+                del self._entries[key]
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
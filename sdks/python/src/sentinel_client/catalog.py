@@ -0,0 +1,124 @@
+"""Locally persisted resource catalog for fast lookups and shell completion.
+
+The catalog stores the server's resource IDs as a sorted list, so a prefix
+query is two binary searches instead of a round trip or a linear scan. It is
+saved per (server URL, environment) under the CLI cache directory and is
+revalidated in the background once it is older than `max_age`.
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import time
+from typing import TYPE_CHECKING, List, Optional
+
+from .disk_cache import default_cache_dir
+
+if TYPE_CHECKING:
+    from .client import SentinelClient
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+class ResourceCatalog:
+    def __init__(
+        self,
+        base_url: str,
+        environment: str = "production",
+        directory: Optional[str] = None,
+        max_age: float = 300.0,
+    ):
+        """
+        Initialize the catalog for one server and environment.
+
+        Args:
+            base_url: Sentinel server URL the resource IDs come from.
+            environment: Environment the resource IDs were listed for.
+            directory: Cache directory (defaults to `default_cache_dir()`).
+            max_age: Seconds after which the catalog is considered stale.
+        """
+        self.directory = directory or default_cache_dir()
+        self.max_age = max_age
+        identity = f"{base_url.rstrip('/')}\0{environment}".encode()
+        name = hashlib.sha256(b"sentinel-catalog\0" + identity).hexdigest()[:16]
+        self.path = os.path.join(self.directory, f"catalog-{name}.json")
+        self._lock_path = os.path.join(self.directory, f"catalog-{name}.lock")
+        self._resources: Optional[List[str]] = None
+        self._fetched_at = 0.0
+
+    @property
+    def resources(self) -> List[str]:
+        """All known resource IDs, sorted."""
+        self._load()
+        return list(self._resources or [])
+
+    @property
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    @property
+    def stale(self) -> bool:
+        """True when the catalog is missing or older than `max_age`."""
+        self._load()
+        return self._resources is None or time.time() - self._fetched_at > self.max_age
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Return the resource IDs starting with `prefix`, in sorted order."""
+        self._load()
+        resources = self._resources or []
+        start = bisect.bisect_left(resources, prefix)
+        # Every string with this prefix sorts below prefix + U+10FFFF
+        end = bisect.bisect_left(resources, prefix + "\U0010ffff", lo=start)
+        if limit is not None:
+            end = min(end, start + limit)
+        return resources[start:end]
+
+    def update(self, resources: List[str]) -> None:
+        """Replace the catalog contents and persist them atomically."""
+        self._resources = sorted(set(resources))
+        self._fetched_at = time.time()
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"fetched_at": self._fetched_at, "resources": self._resources}, f)
+        os.replace(tmp_path, self.path)
+
+    def refresh(
+        self, client: "SentinelClient", environment: Optional[str] = None
+    ) -> bool:
+        """
+        Re-list resources from the server and persist them.
+
+        Only one process refreshes a catalog at a time; others return at once.
+
+        Returns:
+            bool: True if this call refreshed the catalog.
+        """
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return False
+            self.update(client.list_resources(environment=environment))
+            return True
+        finally:
+            os.close(fd)  # closing the descriptor releases the lock
+
+    def _load(self) -> None:
+        if self._resources is not None:
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            self._resources = data["resources"]
+            self._fetched_at = data["fetched_at"]
+        except (OSError, ValueError, KeyError, TypeError):
+            self._resources = None
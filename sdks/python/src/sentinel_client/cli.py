@@ -1,12 +1,261 @@
+"""Command-line interface ("sentinel").
+
+Shell loops and completion call the CLI far more often than it does real
+work, so only the standard library is imported up front. Subcommands import
+the client (and with it httpx and pydantic) when they first need it; keep
+new module-level imports out of this file for the same reason.
+"""
+
 import argparse
 import os
 import sys
 import json
-import subprocess
-from sentinel_client.client import SentinelClient
-from sentinel_client.types import AccessIntent
+from typing import TYPE_CHECKING, Any, Dict, Optional
 from sentinel_client.exceptions import SentinelError
 
+if TYPE_CHECKING:
+    from sentinel_client.catalog import ResourceCatalog
+    from sentinel_client.client import SentinelClient
+    from sentinel_client.disk_cache import DiskGrantCache
+    from sentinel_client.futures import SecretFuture
+    from sentinel_client.types import AccessIntent, SecretResult
+
+
+def _make_client(args: argparse.Namespace, **kwargs: Any) -> "SentinelClient":
+    """Build a client from the global options."""
+    from sentinel_client.client import SentinelClient
+
+    return SentinelClient(
+        base_url=args.url,
+        api_token=args.token,
+        agent_id=args.agent_id,
+        uds=args.uds,
+        **kwargs,
+    )
+
+
+def _open_disk_cache(args: argparse.Namespace) -> Optional["DiskGrantCache"]:
+    """Return the on-disk cache when --cache is on and usable, else None."""
+    if not args.cache:
+        return None
+    from sentinel_client.disk_cache import DiskGrantCache
+
+    try:
+        return DiskGrantCache(args.url, args.token)
+    except SentinelError as e:
+        print(f"Warning: {e}; continuing without cache.", file=sys.stderr)
+        return None
+
+
+COMPLETION_SCRIPTS = {
+    "bash": """\
+_sentinel_complete() {
+    local cur="${COMP_WORDS[COMP_CWORD]}"
+    if [[ $COMP_CWORD -eq 1 ]]; then
+        COMPREPLY=($(compgen -W "get resources run bench cache agent complete" -- "$cur"))
+    elif [[ ${COMP_WORDS[1]} == get && $COMP_CWORD -eq 2 ]]; then
+        COMPREPLY=($(sentinel complete -- "$cur" 2>/dev/null))
+    fi
+}
+complete -o default -F _sentinel_complete sentinel""",
+    "zsh": """\
+_sentinel_complete() {
+    if (( CURRENT == 2 )); then
+        compadd get resources run bench cache agent complete
+    elif [[ ${words[2]} == get && CURRENT -eq 3 ]]; then
+        compadd -- ${(f)"$(sentinel complete -- "$PREFIX" 2>/dev/null)"}
+    fi
+}
+compdef _sentinel_complete sentinel""",
+}
+
+
+def _spawn_catalog_refresh(args: argparse.Namespace) -> None:
+    """Revalidate the resource catalog in a detached background process."""
+    import subprocess
+
+    cmd = [sys.executable, "-m", "sentinel_client.cli", "--url", args.url]
+    cmd += ["--agent-id", args.agent_id]
+    if args.uds:
+        cmd += ["--uds", args.uds]
+    if args.environment:
+        cmd += ["--environment", args.environment]
+    cmd += ["complete", "--refresh"]
+    # Hand the token over via the environment so it never shows up in `ps`
+    env = dict(os.environ, SENTINEL_TOKEN=args.token)
+    subprocess.Popen(
+        cmd,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def _open_catalog(args: argparse.Namespace) -> "ResourceCatalog":
+    """Return the resource catalog, fetching it now if it was never built.
+
+    A stale catalog is answered from as-is and revalidated in the background.
+    """
+    from sentinel_client.catalog import ResourceCatalog
+
+    catalog = ResourceCatalog(args.url, args.environment or "production")
+    if not catalog.exists:
+        client = _make_client(args)
+        try:
+            catalog.refresh(client, environment=args.environment)
+        finally:
+            client.close()
+    elif catalog.stale:
+        _spawn_catalog_refresh(args)
+    return catalog
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _parse_request_line(line: str) -> Dict[str, Any]:
+    """
+    Parse one `sentinel get --stdin` line into request_secret arguments.
+
+    A line is either a JSON object with `resource_id` and optional `version`
+    and `environment`, or a resource ID followed by optional `version=N` and
+    `environment=E` fields.
+
+    Raises:
+        ValueError: If the line is malformed.
+    """
+    if line.startswith("{"):
+        data = json.loads(line)
+        if not isinstance(data, dict) or not data.get("resource_id"):
+            raise ValueError("JSON line needs a resource_id")
+        request = {"resource_id": str(data["resource_id"])}
+        if data.get("version") is not None:
+            request["version"] = int(data["version"])
+        if data.get("environment"):
+            request["environment"] = str(data["environment"])
+        return request
+
+    resource_id, *fields = line.split()
+    request = {"resource_id": resource_id}
+    for field in fields:
+        key, sep, value = field.partition("=")
+        if sep and key == "version":
+            request["version"] = int(value)
+        elif sep and key in ("environment", "env"):
+            request["environment"] = value
+        else:
+            raise ValueError(f"unexpected field {field!r}")
+    return request
+
+
+def _get_from_stdin(
+    args: argparse.Namespace, client: "SentinelClient", intent: "AccessIntent"
+) -> int:
+    """
+    Resolve every resource listed on stdin and stream the results to stdout.
+
+    Requests start while stdin is still being read, and each result is
+    printed from its future's done-callback as soon as it completes, so one
+    slow approval (or a producer that keeps stdin open) never holds back
+    the rest.
+
+    Returns:
+        int: Number of resources that were not granted.
+    """
+    import threading
+
+    from sentinel_client.client import _failed_result, _granted_result
+    from sentinel_client.types import SecretOutcome, SecretResult
+
+    failures: Dict[str, int] = {}
+    reported = threading.Condition()
+    outstanding = [0]
+
+    def report(result: "SecretResult") -> None:
+        with reported:
+            _print_stdin_result(args, result)
+            if not result.granted:
+                outcome = result.outcome.value.lower()
+                failures[outcome] = failures.get(outcome, 0) + 1
+
+    def settle(resource_id: str, future: "SecretFuture") -> None:
+        try:
+            report(_granted_result(resource_id, future.result()))
+        except SentinelError as e:
+            report(_failed_result(resource_id, e))
+        except BaseException as e:
+            report(
+                SecretResult(
+                    resource_id=resource_id, outcome=SecretOutcome.ERROR, error=str(e)
+                )
+            )
+        finally:
+            with reported:
+                outstanding[0] -= 1
+                reported.notify_all()
+
+    total = 0
+    for number, line in enumerate(sys.stdin, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        total += 1
+        try:
+            request = _parse_request_line(line)
+        except ValueError as e:
+            report(
+                SecretResult(
+                    resource_id=line,
+                    outcome=SecretOutcome.ERROR,
+                    error=f"line {number}: {e}",
+                )
+            )
+            continue
+        future = client.submit_request(
+            request["resource_id"],
+            intent,
+            version=request.get("version", args.version),
+            environment=request.get("environment", args.environment),
+            ttl_seconds=args.ttl,
+        )
+        with reported:
+            outstanding[0] += 1
+        future.add_done_callback(
+            lambda f, resource_id=request["resource_id"]: settle(resource_id, f)
+        )
+
+    with reported:
+        reported.wait_for(lambda: outstanding[0] == 0)
+
+    failed = sum(failures.values())
+    summary = f"{total - failed}/{total} secrets granted"
+    if failures:
+        details = ", ".join(f"{n} {o}" for o, n in sorted(failures.items()))
+        summary += f" ({details})"
+    print(summary, file=sys.stderr)
+    return failed
+
+
+def _print_stdin_result(args: argparse.Namespace, result: "SecretResult") -> None:
+    if args.format in ("json", "ndjson"):
+        print(json.dumps(result.model_dump(mode="json")), flush=True)
+    elif not result.granted:
+        print(
+            f"{result.resource_id}: {result.outcome.value}: {result.error}",
+            file=sys.stderr,
+        )
+    elif args.format == "env":
+        print(f"{result.resource_id}={result.secret.value}", flush=True)
+    else:
+        print(f"{result.resource_id}\t{result.secret.value}", flush=True)
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -17,22 +266,40 @@ def main():
     # 'get' command
     get_parser = subparsers.add_parser("get", help="Request a secret")
     get_parser.add_argument(
-        "resource_id", help="The ID of the secret/resource to request"
+        "resource_id", nargs="?", help="The ID of the secret/resource to request"
+    )
+    get_parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Read resource IDs from stdin, one per line "
+        "(optionally 'ID version=N environment=E' or a JSON object), "
+        "and print each result as it completes",
+    )
+    get_parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=_positive_int,
+        default=8,
+        help="Requests in flight at once with --stdin (default: 8)",
     )
     get_parser.add_argument(
         "--intent", "-i", default="CLI Access", help="Reason for access"
     )
     get_parser.add_argument(
-        "--version", "-v", type=int, help="Specific version to request"
+        "--version",
+        "-v",
+        type=int,
+        help="Specific version to request (the default for each line with --stdin)",
     )
     get_parser.add_argument(
         "--ttl", type=int, default=3600, help="Time-to-live in seconds"
     )
     get_parser.add_argument(
         "--format",
-        choices=["text", "json", "env"],
+        choices=["text", "json", "ndjson", "env"],
         default="text",
-        help="Output format (default: text)",
+        help="Output format (default: text); json and ndjson print one object "
+        "per line with --stdin",
     )
 
     resources_parser = subparsers.add_parser(
@@ -44,6 +311,30 @@ def main():
         default="text",
         help="Output format (default: text)",
     )
+    resources_parser.add_argument(
+        "--cached",
+        action="store_true",
+        help="Answer from the local resource catalog, revalidating it in the background",
+    )
+
+    # 'complete' command
+    complete_parser = subparsers.add_parser(
+        "complete", help="Complete resource IDs from the local catalog"
+    )
+    complete_parser.add_argument(
+        "prefix", nargs="?", default="", help="Resource ID prefix to complete"
+    )
+    complete_parser.add_argument(
+        "--script",
+        choices=sorted(COMPLETION_SCRIPTS),
+        help='Print a shell completion script (e.g. eval "$(sentinel complete --script bash)")',
+    )
+    complete_parser.add_argument(
+        "--limit", type=int, help="Maximum number of completions to print"
+    )
+    complete_parser.add_argument(
+        "--refresh", action="store_true", help="Re-list resources into the catalog now"
+    )
 
     # 'run' command
     run_parser = subparsers.add_parser(
@@ -54,12 +345,128 @@ def main():
         nargs=argparse.REMAINDER,
         help="Command to run (e.g. -- python script.py)",
     )
+    run_parser.add_argument(
+        "--supervise",
+        action="store_true",
+        help="Stay running as the command's parent and apply secret rotations",
+    )
+    run_parser.add_argument(
+        "--interval",
+        type=float,
+        default=30.0,
+        help="Seconds between secret checks with --supervise (default: 30)",
+    )
+    run_parser.add_argument(
+        "--on-change",
+        choices=["restart", "signal"],
+        default="restart",
+        help="On rotation, restart the command or signal it to re-read --env-file",
+    )
+    run_parser.add_argument(
+        "--env-file",
+        help="Keep a dotenv file of the secrets here and export its path as SENTINEL_ENV_FILE",
+    )
+    run_parser.add_argument(
+        "--reload-signal",
+        choices=["HUP", "USR1", "USR2"],
+        default="HUP",
+        help="Signal sent with --on-change signal (default: HUP)",
+    )
+    run_parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=300.0,
+        help="Seconds to reuse cached secrets when --cache is on (default: 300)",
+    )
+
+    # 'bench' command
+    bench_parser = subparsers.add_parser(
+        "bench", help="Measure latency and throughput of a Sentinel deployment"
+    )
+    bench_parser.add_argument(
+        "--operation",
+        "-o",
+        action="append",
+        choices=["request", "fetch", "revalidate", "list", "poll"],
+        help="Operation to drive; repeat for several (default: request)",
+    )
+    bench_parser.add_argument(
+        "--concurrency", "-c", type=_positive_int, default=8, help="Concurrent callers"
+    )
+    bench_parser.add_argument(
+        "--duration",
+        "-d",
+        type=float,
+        default=10.0,
+        help="Seconds to run each operation (default: 10)",
+    )
+    bench_parser.add_argument(
+        "--warmup",
+        type=float,
+        default=1.0,
+        help="Seconds of unrecorded calls before each operation (default: 1)",
+    )
+    bench_parser.add_argument(
+        "--resource",
+        default="bench-resource",
+        help="Resource requested by the 'request' operation",
+    )
+    bench_parser.add_argument(
+        "--approval-resource",
+        default="prod-bench",
+        help="Resource that requires approval, polled by the 'poll' operation "
+        "(its request is left pending)",
+    )
+    bench_parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (default: text)",
+    )
+
+    # 'cache' command
+    cache_parser = subparsers.add_parser(
+        "cache", help="Inspect or clear the encrypted on-disk cache"
+    )
+    cache_parser.add_argument("action", choices=["clear", "stats"])
+
+    # 'agent' command
+    agent_parser = subparsers.add_parser(
+        "agent", help="Run a local caching sidecar for clients on this host"
+    )
+    agent_parser.add_argument(
+        "--socket",
+        help="Unix socket to listen on (default: $SENTINEL_AGENT_SOCKET, else $XDG_RUNTIME_DIR or ~/.sentinel)",
+    )
+    agent_parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=2.0,
+        help="Seconds between upstream polls of a pending approval",
+    )
+    agent_parser.add_argument(
+        "--max-wait",
+        type=float,
+        default=600.0,
+        help="Seconds to keep polling an unresolved approval",
+    )
 
     # Global args
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        default=os.environ.get("SENTINEL_CLI_CACHE", "").lower() in ("1", "true"),
+        help="Reuse grants from the encrypted on-disk cache (or SENTINEL_CLI_CACHE=1)",
+    )
     parser.add_argument(
         "--url",
         default=os.environ.get("SENTINEL_URL", "http://localhost:3000"),
-        help="Sentinel Server URL",
+        help="Sentinel Server URL (use unix:///path/to.sock for a local socket)",
+    )
+    parser.add_argument(
+        "--uds",
+        default=os.environ.get("SENTINEL_SOCKET"),
+        help="Unix domain socket of a co-located Sentinel server",
     )
     parser.add_argument(
         "--token", default=os.environ.get("SENTINEL_TOKEN"), help="Sentinel API Token"
@@ -85,17 +492,30 @@ def main():
             print("Error: --token or SENTINEL_TOKEN is required.", file=sys.stderr)
             sys.exit(1)
 
-        client = SentinelClient(
-            base_url=args.url, api_token=args.token, agent_id=args.agent_id
-        )
+        if args.stdin == bool(args.resource_id):
+            print("Error: pass a resource_id or --stdin.", file=sys.stderr)
+            sys.exit(1)
 
-        try:
-            intent = AccessIntent(
-                summary=args.intent,
-                description=f"Request via CLI by {args.agent_id}",
-                task_id="cli-manual",
+        from sentinel_client.types import AccessIntent
+
+        intent = AccessIntent(
+            summary=args.intent,
+            description=f"Request via CLI by {args.agent_id}",
+            task_id="cli-manual",
+        )
+        if args.stdin:
+            client = _make_client(
+                args, cache=_open_disk_cache(args), submit_workers=args.concurrency
             )
+            try:
+                failed = _get_from_stdin(args, client, intent)
+            finally:
+                client.close()
+            sys.exit(1 if failed else 0)
 
+        client = _make_client(args, cache=_open_disk_cache(args))
+
+        try:
             # Print status to stderr so stdout is clean for piping
             print(f"Requesting access to '{args.resource_id}'...", file=sys.stderr)
 
@@ -109,6 +529,8 @@ def main():
 
             if args.format == "json":
                 print(json.dumps(secret.model_dump(), indent=2))
+            elif args.format == "ndjson":
+                print(json.dumps(secret.model_dump()))
             elif args.format == "env":
                 # Use resource_id as key since API doesn't return key name
                 print(f"{args.resource_id}={secret.value}")
@@ -128,12 +550,12 @@ def main():
             print("Error: --token or SENTINEL_TOKEN is required.", file=sys.stderr)
             sys.exit(1)
 
-        client = SentinelClient(
-            base_url=args.url, api_token=args.token, agent_id=args.agent_id
-        )
-
         try:
-            resources = client.list_resources(environment=args.environment)
+            if args.cached:
+                resources = _open_catalog(args).resources
+            else:
+                client = _make_client(args)
+                resources = client.list_resources(environment=args.environment)
 
             if args.format == "json":
                 print(json.dumps(resources, indent=2))
@@ -148,6 +570,32 @@ def main():
             print(f"Unexpected Error: {e}", file=sys.stderr)
             sys.exit(1)
 
+    elif args.command == "complete":
+        if args.script:
+            print(COMPLETION_SCRIPTS[args.script])
+            return
+        # Completion must stay quiet: no output at all beats an error message
+        if not args.token:
+            sys.exit(1)
+
+        try:
+            if args.refresh:
+                from sentinel_client.catalog import ResourceCatalog
+
+                client = _make_client(args)
+                try:
+                    ResourceCatalog(args.url, args.environment or "production").refresh(
+                        client, environment=args.environment
+                    )
+                finally:
+                    client.close()
+                return
+            matches = _open_catalog(args).complete(args.prefix, limit=args.limit)
+        except (SentinelError, OSError):
+            sys.exit(1)
+        for resource_id in matches:
+            print(resource_id)
+
     elif args.command == "run":
         if not args.token:
             print("Error: --token or SENTINEL_TOKEN is required.", file=sys.stderr)
@@ -166,14 +614,46 @@ def main():
             print("Error: No command specified after --", file=sys.stderr)
             sys.exit(1)
 
-        client = SentinelClient(
-            base_url=args.url, api_token=args.token, agent_id=args.agent_id
-        )
+        client = _make_client(args)
+
+        if args.supervise:
+            import signal
+
+            from sentinel_client.supervisor import SecretSupervisor
+
+            supervisor = SecretSupervisor(
+                client,
+                cmd_args,
+                environment=args.environment,
+                interval=args.interval,
+                on_change=args.on_change,
+                env_file=args.env_file,
+                reload_signal=signal.Signals[f"SIG{args.reload_signal}"],
+            )
+            try:
+                print("Fetching secrets from Sentinel...", file=sys.stderr)
+                code = supervisor.run()
+            except SentinelError as e:
+                print(f"Sentinel Error: {e}", file=sys.stderr)
+                sys.exit(1)
+            except OSError as e:
+                print(f"Execution Error: {e}", file=sys.stderr)
+                sys.exit(1)
+            finally:
+                client.close()
+            # Mirror the shell: a child killed by signal N exits 128 + N
+            sys.exit(code if code >= 0 else 128 - code)
+
+        disk_cache = _open_disk_cache(args)
+        environment = args.environment or "production"
 
         try:
-            # Fetch secrets
-            print("Fetching secrets from Sentinel...", file=sys.stderr)
-            secrets = client.fetch_secrets(environment=args.environment)
+            secrets = disk_cache.get_secrets(environment) if disk_cache else None
+            if secrets is None:
+                print("Fetching secrets from Sentinel...", file=sys.stderr)
+                secrets = client.fetch_secrets(environment=args.environment)
+                if disk_cache:
+                    disk_cache.put_secrets(environment, secrets, args.cache_ttl)
 
             # Prepare environment
             env = os.environ.copy()
@@ -190,6 +670,107 @@ def main():
             print(f"Execution Error: {e}", file=sys.stderr)
             sys.exit(1)
 
+    elif args.command == "bench":
+        if not args.token:
+            print("Error: --token or SENTINEL_TOKEN is required.", file=sys.stderr)
+            sys.exit(1)
+
+        from dataclasses import asdict
+
+        from sentinel_client.bench import format_report, run_benchmark
+
+        # Measure the server itself: no sidecar, no request sharing
+        client = _make_client(args, prefer_agent=False, single_flight=False)
+        operations = args.operation or ["request"]
+        try:
+            reports = run_benchmark(
+                client,
+                operations,
+                concurrency=args.concurrency,
+                duration=args.duration,
+                warmup=args.warmup,
+                resource_id=args.resource,
+                approval_resource_id=args.approval_resource,
+            )
+        except SentinelError as e:
+            print(f"Sentinel Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        finally:
+            client.close()
+
+        if args.format == "json":
+            result = {
+                "url": args.url,
+                "concurrency": args.concurrency,
+                "duration": args.duration,
+                "operations": [asdict(r) for r in reports],
+            }
+            print(json.dumps(result, indent=2))
+        else:
+            print(
+                f"Sentinel bench: {args.url}, concurrency {args.concurrency}, "
+                f"{args.duration:g}s per operation"
+            )
+            for report in reports:
+                print()
+                print(format_report(report))
+
+    elif args.command == "cache":
+        from sentinel_client.disk_cache import (
+            DiskGrantCache,
+            clear_cache_dir,
+            default_cache_dir,
+        )
+
+        if args.action == "clear":
+            removed = clear_cache_dir()
+            print(f"Removed {removed} cache file(s) from {default_cache_dir()}")
+        elif not args.token:
+            print("Error: --token or SENTINEL_TOKEN is required.", file=sys.stderr)
+            sys.exit(1)
+        else:
+            try:
+                stats = DiskGrantCache(args.url, args.token).stats
+            except SentinelError as e:
+                print(f"Sentinel Error: {e}", file=sys.stderr)
+                sys.exit(1)
+            print(f"Path:    {stats.path}")
+            print(f"Entries: {stats.entries} ({stats.live} live)")
+            print(f"Hits:    {stats.hits}")
+            print(f"Misses:  {stats.misses}")
+            print(f"Size:    {stats.size_bytes} bytes")
+
+    elif args.command == "agent":
+        if not args.token:
+            print("Error: --token or SENTINEL_TOKEN is required.", file=sys.stderr)
+            sys.exit(1)
+
+        import signal
+        import threading
+
+        from sentinel_client.agent import AGENT_SOCKET_ENV, SentinelAgent
+
+        upstream = _make_client(args, prefer_agent=False)
+        agent = SentinelAgent(
+            upstream,
+            socket_path=args.socket or os.environ.get(AGENT_SOCKET_ENV),
+            poll_interval=args.poll_interval,
+            max_wait=args.max_wait,
+        )
+
+        # shutdown() blocks until serve_forever() returns, so call it off-thread
+        signal.signal(
+            signal.SIGTERM,
+            lambda *_: threading.Thread(target=agent.shutdown).start(),
+        )
+        print(f"Sentinel agent listening on {agent.socket_path}", file=sys.stderr)
+        try:
+            agent.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            upstream.close()
+
 
 if __name__ == "__main__":
     main()
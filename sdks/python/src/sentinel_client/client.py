@@ -1,14 +1,36 @@
+import contextlib
+import functools
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+import threading
 import time
 import os
-from typing import Optional, Dict, Any
+import warnings
+from typing import Optional, Callable, Dict, Any, Iterator, Sequence, Tuple, Union
 import httpx
 
+from . import futures
+from .agent import find_agent_socket
+from .batcher import RequestBatcher
+from .futures import SecretFuture
+from .cache import CacheKey, DenialCache, GrantCache, parse_expires_at
+from .codec import (
+    decode_access_item,
+    decode_access_response,
+    encode_access_request,
+    encode_intent,
+)
+from .poller import ApprovalPoller
+from .polling import FixedInterval, PollRun, PollStrategy
+from .refresh import RefreshAheadScheduler
+from .singleflight import SingleFlight
 from .types import (
     AccessIntent,
-    AccessRequest,
     AccessResponse,
     AccessStatus,
+    SecretOutcome,
     SecretPayload,
+    SecretResult,
 )
 from .exceptions import (
     SentinelError,
@@ -19,6 +41,104 @@ from .exceptions import (
 )
 
 
+def _resolve_http2(http2: bool) -> bool:
+    """Return whether HTTP/2 can be enabled, warning when `h2` is missing."""
+    if not http2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        warnings.warn(
+            "http2=True requires the 'h2' package "
+            "(pip install 'sentinel-client[http2]'); falling back to HTTP/1.1.",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return False
+    return True
+
+
+def _split_uds(base_url: str, uds: Optional[str]) -> Tuple[str, Optional[str]]:
+    """Split a "unix://" base URL into an HTTP base URL and a socket path."""
+    if base_url.startswith("unix://"):
+        uds = base_url[len("unix://") :]
+        base_url = "http://localhost"
+    return base_url.rstrip("/"), uds
+
+
+def _resolve_access_response(
+    access_response: AccessResponse,
+) -> Optional[SecretPayload]:
+    """Return the secret of a final response, or None while still pending."""
+    if access_response.status == AccessStatus.APPROVED:
+        if not access_response.secret:
+            raise SentinelError("Approved response missing secret payload")
+        return access_response.secret
+
+    elif access_response.status == AccessStatus.DENIED:
+        raise SentinelDeniedError(
+            f"Request denied: {access_response.reason or 'No reason provided'}"
+        )
+
+    elif access_response.status == AccessStatus.PENDING_APPROVAL:
+        return None
+
+    raise SentinelError(f"Unknown status: {access_response.status}")
+
+
+def _access_request_error(e: httpx.HTTPStatusError) -> SentinelError:
+    """Map an HTTP error from the access request endpoint to a Sentinel error."""
+    if e.response.status_code == 401:
+        return SentinelAuthError("Invalid API Token")
+    elif e.response.status_code == 403:
+        # Try to extract the reason from the response body
+        try:
+            error_data = e.response.json()
+            # The Sentinel server returns the full AccessResponse object on 403,
+            # so we check for 'reason' or 'message'
+            reason = error_data.get("reason") or error_data.get("message")
+            if reason:
+                return SentinelDeniedError(reason)
+        except Exception:
+            # JSON parsing failed or structure unexpected
+            pass
+        return SentinelDeniedError("Access Forbidden")
+    return SentinelError(f"HTTP Error: {e}")
+
+
+def _long_poll_seconds(response: httpx.Response) -> Optional[float]:
+    """Return how long the server will hold a status poll open, or None."""
+    try:
+        seconds = float(response.headers.get("X-Sentinel-Long-Poll", ""))
+    except ValueError:
+        return None
+    return seconds if seconds > 0 else None
+
+
+def _api_error(e: httpx.HTTPStatusError) -> SentinelError:
+    """Map an HTTP error from a read endpoint to a Sentinel error."""
+    if e.response.status_code == 401:
+        return SentinelAuthError("Invalid API Token")
+    return SentinelError(f"HTTP Error: {e}")
+
+
+def _granted_result(resource_id: str, secret: SecretPayload) -> SecretResult:
+    return SecretResult(
+        resource_id=resource_id, outcome=SecretOutcome.GRANTED, secret=secret
+    )
+
+
+def _failed_result(resource_id: str, error: SentinelError) -> SecretResult:
+    """Classify a failed request into a DENIED, TIMED_OUT or ERROR result."""
+    if isinstance(error, SentinelDeniedError):
+        outcome = SecretOutcome.DENIED
+    elif isinstance(error, SentinelTimeoutError):
+        outcome = SecretOutcome.TIMED_OUT
+    else:
+        outcome = SecretOutcome.ERROR
+    return SecretResult(resource_id=resource_id, outcome=outcome, error=str(error))
+
+
 class SentinelClient:
     def __init__(
         self,
@@ -27,19 +147,84 @@ class SentinelClient:
         agent_id: str,
         timeout: float = 30.0,
         environment: Optional[str] = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        uds: Optional[str] = None,
+        prefer_agent: bool = True,
+        cache: Optional[GrantCache] = None,
+        refresh_ahead: Optional[RefreshAheadScheduler] = None,
+        single_flight: bool = True,
+        deny_cache: Optional[DenialCache] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+        multiplex_polling: bool = False,
+        submit_workers: int = 8,
+        batch_window: Optional[float] = None,
+        max_batch_size: int = 100,
+        validate_requests: bool = False,
     ):
         """
         Initialize the Sentinel Client.
 
+        The client owns a pooled, thread-safe HTTP connection pool that is reused
+        across calls. Call `close()` (or use the client as a context manager)
+        to release the connections when done.
+
         Args:
             base_url: The URL of the Sentinel server (e.g., "http://localhost:3000").
+                A "unix:///path/to.sock" URL connects over a Unix domain socket.
             api_token: The API token for authentication.
             agent_id: The ID of the agent using this client.
             timeout: Default request timeout in seconds.
             environment: Default environment to use (defaults to "production" or SENTINEL_ENVIRONMENT env var).
+            max_connections: Maximum number of concurrent connections to the server.
+            max_keepalive_connections: Maximum number of idle connections kept open for reuse.
+            keepalive_expiry: Seconds an idle connection is kept before being closed.
+            http2: Negotiate HTTP/2 so concurrent calls multiplex over one connection.
+                Requires the `http2` extra; servers that do not offer HTTP/2 via
+                TLS ALPN are spoken to over HTTP/1.1.
+            uds: Path of a Unix domain socket to reach a co-located server through,
+                bypassing the TCP stack.
+            prefer_agent: Route requests through a local `sentinel agent` sidecar
+                when no explicit socket was given and this user's agent for
+                the same `base_url` is running.
+            cache: Optional `GrantCache` that serves repeated `request_secret`
+                calls for the same resource until shortly before the grant expires.
+            refresh_ahead: Optional `RefreshAheadScheduler` that re-requests cached
+                grants in the background before they expire. Requires `cache`;
+                the client shuts it down on `close()`.
+            single_flight: Share one in-flight request (and approval poll) among
+                concurrent identical `request_secret` calls.
+            deny_cache: Optional `DenialCache` that remembers denied resources
+                briefly and raises `SentinelDeniedError` without a round trip.
+            poll_strategy: How to pace status polls of pending approvals, e.g.
+                `ExponentialBackoff()`. Defaults to a fixed `polling_interval`.
+            multiplex_polling: Wait on pending approvals through one shared
+                `ApprovalPoller` thread that checks them all in batches, instead
+                of a polling loop per caller. Its tick interval replaces
+                `polling_interval`.
+            submit_workers: Maximum number of `submit_request` calls that run at
+                the same time; further submissions queue.
+            batch_window: Coalesce access requests sent within this many seconds
+                (e.g. 0.003) into one batch request through a `RequestBatcher`.
+                Suits bursts of concurrent `request_secret` calls; each call
+                waits up to the window longer. Off by default.
+            max_batch_size: Send a coalesced batch early once it holds this
+                many requests.
+            validate_requests: Build access request bodies through the
+                `AccessRequest` model, so invalid arguments raise
+                `pydantic.ValidationError` before anything is sent. Off by
+                default: bodies are encoded directly and the server validates
+                them. Responses are validated either way.
         """
-        self.base_url = base_url.rstrip("/")
+        if refresh_ahead is not None and cache is None:
+            raise ValueError("refresh_ahead requires a cache")
+        self.base_url, self.uds = _split_uds(base_url, uds)
+        if self.uds is None and prefer_agent:
+            self.uds = find_agent_socket(self.base_url)
         self.api_token = api_token
+        self.poll_strategy = poll_strategy
         self.agent_id = agent_id
         self.timeout = timeout
         self.environment = (
@@ -50,6 +235,69 @@ class SentinelClient:
             "Content-Type": "application/json",
             "User-Agent": f"SentinelPythonSDK/0.1.1 Agent/{agent_id}",
         }
+        # A client talks to a single Sentinel server, so the pool-wide limits
+        # double as the per-host caps.
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = _resolve_http2(http2)
+        # A custom transport ignores client-level limits, so pass them along.
+        transport = (
+            httpx.HTTPTransport(uds=self.uds, limits=self.limits, http2=self.http2)
+            if self.uds
+            else None
+        )
+        self._http = httpx.Client(
+            limits=self.limits, timeout=timeout, http2=self.http2, transport=transport
+        )
+        self.cache = cache
+        self.refresh_ahead = refresh_ahead
+        self.single_flight = SingleFlight() if single_flight else None
+        self.deny_cache = deny_cache
+        self.approval_poller = ApprovalPoller(self) if multiplex_polling else None
+        self.batcher = (
+            RequestBatcher(self, window=batch_window, max_batch_size=max_batch_size)
+            if batch_window is not None
+            else None
+        )
+        self.submit_workers = submit_workers
+        self.validate_requests = validate_requests
+        self._submit_pool: Optional[ThreadPoolExecutor] = None
+        self._submitted: "set[SecretFuture]" = set()
+        self._submit_lock = threading.Lock()
+        # environment -> (etag, cursor, secrets) from the last fetch_secrets call
+        self._snapshots: Dict[
+            str, Tuple[Optional[str], Optional[str], Dict[str, str]]
+        ] = {}
+        self._snapshots_lock = threading.Lock()
+        # grants this client has cached so far; see _fetch_grant
+        self._grants_cached = 0
+        self._grants_cached_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the underlying connection pool and any background workers."""
+        if self.refresh_ahead is not None:
+            self.refresh_ahead.shutdown()
+        with self._submit_lock:
+            pool, self._submit_pool = self._submit_pool, None
+            submitted, self._submitted = self._submitted, set()
+        for future in submitted:
+            future.cancel()
+        if pool is not None:
+            pool.shutdown(wait=False)
+        if self.batcher is not None:
+            self.batcher.shutdown()
+        if self.approval_poller is not None:
+            self.approval_poller.shutdown()
+        self._http.close()
+
+    def __enter__(self) -> "SentinelClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def request_secret(
         self,
@@ -84,104 +332,560 @@ class SentinelClient:
             SentinelTimeoutError: If polling times out.
             SentinelError: For other API errors.
         """
-        request_body = AccessRequest(
-            agent_id=self.agent_id,
-            resource_id=resource_id,
-            version=version,
-            environment=environment or self.environment,
-            intent=intent,
-            ttl_seconds=ttl_seconds,
+        target_environment = environment or self.environment
+        key = (resource_id, version, target_environment, self.agent_id)
+        grants_cached = self._grants_cached
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                if self.refresh_ahead is not None:
+                    self.refresh_ahead.touch(key)
+                return cached
+        if self.deny_cache is not None:
+            reason = self.deny_cache.get((resource_id, target_environment))
+            if reason is not None:
+                raise SentinelDeniedError(reason)
+
+        request_args = (
+            resource_id,
+            intent,
+            version,
+            target_environment,
+            ttl_seconds,
+            polling_interval,
+            polling_timeout,
+        )
+        if self.single_flight is None:
+            return self._fetch_grant(key, request_args, grants_cached)
+        # Only calls with the same intent are shared, so the audit trail holds.
+        flight_key = key + (
+            ttl_seconds,
+            intent.summary,
+            intent.description,
+            intent.task_id,
         )
+        return self.single_flight.do(
+            flight_key,
+            functools.partial(self._fetch_grant, key, request_args, grants_cached),
+        )
+
+    def request_secrets(
+        self,
+        resource_ids: Sequence[str],
+        intent: AccessIntent,
+        environment: Optional[str] = None,
+        ttl_seconds: int = 3600,
+        polling_interval: float = 2.0,
+        polling_timeout: float = 60.0,
+        max_concurrency: int = 8,
+    ) -> Dict[str, SecretResult]:
+        """
+        Request several secrets concurrently under one intent.
+
+        Up to `max_concurrency` requests are in flight at once and their
+        approval waits overlap, so startup costs roughly the slowest request
+        rather than the sum of all of them. A denial or timeout affects only
+        its own entry.
+
+        Args:
+            resource_ids: The resources to access; duplicates are requested once.
+            intent: The intent details shared by every request.
+            environment: Optional environment to request (defaults to client environment).
+            ttl_seconds: Time-to-live for each secret in seconds.
+            polling_interval: Seconds to wait between polling attempts.
+            polling_timeout: Maximum seconds to wait for each approval.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            Dict[str, SecretResult]: One result per resource ID, in input order,
+                marked GRANTED, DENIED, TIMED_OUT or ERROR.
+        """
+        unique = list(dict.fromkeys(resource_ids))
+        if not unique:
+            return {}
+
+        def fetch(resource_id: str) -> SecretResult:
+            try:
+                secret = self.request_secret(
+                    resource_id,
+                    intent,
+                    environment=environment,
+                    ttl_seconds=ttl_seconds,
+                    polling_interval=polling_interval,
+                    polling_timeout=polling_timeout,
+                )
+            except SentinelError as e:
+                return _failed_result(resource_id, e)
+            return _granted_result(resource_id, secret)
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(unique)),
+            thread_name_prefix="sentinel-bulk",
+        ) as pool:
+            return dict(zip(unique, pool.map(fetch, unique)))
+
+    def request_secrets_batch(
+        self,
+        resource_ids: Sequence[str],
+        intent: AccessIntent,
+        environment: Optional[str] = None,
+        ttl_seconds: int = 3600,
+        polling_interval: float = 2.0,
+        polling_timeout: float = 60.0,
+        batch_size: int = 100,
+        max_concurrency: int = 8,
+    ) -> Dict[str, SecretResult]:
+        """
+        Request several secrets under one intent through the batch endpoint.
+
+        Like `request_secrets`, but each chunk of `batch_size` resources costs
+        one HTTP request, which the server evaluates in a single transaction.
+        Cached grants and denials are answered locally. Requests left pending
+        are waited on concurrently (or through the shared `ApprovalPoller`).
+        Servers without `POST /v1/access/requests/batch` are served by
+        `request_secrets` instead.
+
+        Args:
+            resource_ids: The resources to access; duplicates are requested once.
+            intent: The intent details shared by every request.
+            environment: Optional environment to request (defaults to client environment).
+            ttl_seconds: Time-to-live for each secret in seconds.
+            polling_interval: Seconds to wait between polling attempts.
+            polling_timeout: Maximum seconds to wait for each approval.
+            batch_size: Maximum resources per batch request (the server accepts 100).
+            max_concurrency: Maximum number of approval waits in flight at once.
+
+        Returns:
+            Dict[str, SecretResult]: One result per resource ID, in input order,
+                marked GRANTED, DENIED, TIMED_OUT or ERROR.
+        """
+        unique = list(dict.fromkeys(resource_ids))
+        target_environment = environment or self.environment
+        results: Dict[str, SecretResult] = {}
+        missing = []
+        for resource_id in unique:
+            key = (resource_id, None, target_environment, self.agent_id)
+            cached = self.cache.get(key) if self.cache is not None else None
+            reason = (
+                self.deny_cache.get((resource_id, target_environment))
+                if self.deny_cache is not None
+                else None
+            )
+            if cached is not None:
+                results[resource_id] = _granted_result(resource_id, cached)
+            elif reason is not None:
+                results[resource_id] = _failed_result(
+                    resource_id, SentinelDeniedError(reason)
+                )
+            else:
+                missing.append(resource_id)
+
+        def granted(resource_id: str, secret: SecretPayload) -> SecretResult:
+            key = (resource_id, None, target_environment, self.agent_id)
+            request_args = (
+                resource_id,
+                intent,
+                None,
+                target_environment,
+                ttl_seconds,
+                polling_interval,
+                polling_timeout,
+            )
+            self._cache_grant(key, secret, request_args)
+            return _granted_result(resource_id, secret)
+
+        # request_id -> resource_id of requests still waiting for approval
+        pending: Dict[str, str] = {}
+        long_poll = None
+        for start in range(0, len(missing), batch_size):
+            chunk = missing[start : start + batch_size]
+            try:
+                response = self._post_batch(
+                    intent, target_environment, [(r, ttl_seconds) for r in chunk]
+                )
+            except SentinelError as e:
+                results.update((r, _failed_result(r, e)) for r in chunk)
+                continue
+            if response is None:
+                # older server without the batch endpoint
+                results.update(
+                    self.request_secrets(
+                        missing[start:],
+                        intent,
+                        environment=environment,
+                        ttl_seconds=ttl_seconds,
+                        polling_interval=polling_interval,
+                        polling_timeout=polling_timeout,
+                        max_concurrency=max_concurrency,
+                    )
+                )
+                break
+            long_poll = _long_poll_seconds(response)
+            try:
+                items = response.json().get("responses", [])
+                if not isinstance(items, list):
+                    raise ValueError("'responses' is not a list")
+            except (AttributeError, ValueError) as e:
+                error = SentinelError(f"Unexpected error: {e}")
+                results.update((r, _failed_result(r, error)) for r in chunk)
+                continue
+            for resource_id, item in zip(chunk, items):
+                try:
+                    access_response = decode_access_item(item)
+                    secret = _resolve_access_response(access_response)
+                except SentinelError as e:
+                    results[resource_id] = self._batch_failure(
+                        resource_id, target_environment, e
+                    )
+                    continue
+                except (TypeError, ValueError) as e:
+                    results[resource_id] = _failed_result(
+                        resource_id, SentinelError(f"Unexpected error: {e}")
+                    )
+                    continue
+                if secret is None:
+                    pending[access_response.request_id] = resource_id
+                else:
+                    results[resource_id] = granted(resource_id, secret)
+            for resource_id in chunk[len(items) :]:
+                results[resource_id] = _failed_result(
+                    resource_id, SentinelError("Missing batch response item")
+                )
+
+        def wait(request_id: str) -> SecretResult:
+            resource_id = pending[request_id]
+            try:
+                secret = self._poll_for_approval(
+                    request_id, polling_interval, polling_timeout, long_poll
+                )
+            except SentinelError as e:
+                return self._batch_failure(resource_id, target_environment, e)
+            except (AttributeError, TypeError, ValueError) as e:
+                # a malformed status fails this resource, not the whole batch
+                return _failed_result(
+                    resource_id, SentinelError(f"Unexpected error: {e}")
+                )
+            return granted(resource_id, secret)
+
+        if pending:
+            with ThreadPoolExecutor(
+                max_workers=min(max_concurrency, len(pending)),
+                thread_name_prefix="sentinel-batch",
+            ) as pool:
+                for result in pool.map(wait, pending):
+                    results[result.resource_id] = result
+        return {resource_id: results[resource_id] for resource_id in unique}
+
+    def _post_batch(
+        self,
+        intent: Union[AccessIntent, Dict[str, Any]],
+        environment: Optional[str],
+        items: Sequence[Tuple[str, int]],
+    ) -> Optional[httpx.Response]:
+        """
+        POST one batch access request for `(resource_id, ttl_seconds)` items.
 
+        Returns None if the server lacks the batch endpoint.
+        """
+        body = {
+            "agent_id": self.agent_id,
+            "environment": environment,
+            "intent": encode_intent(intent),
+            "ttl_seconds": items[0][1],
+            "requests": [
+                {"resource_id": resource_id, "ttl_seconds": ttl_seconds}
+                for resource_id, ttl_seconds in items
+            ],
+        }
         try:
-            response = httpx.post(
-                f"{self.base_url}/v1/access/request",
+            response = self._http.post(
+                f"{self.base_url}/v1/access/requests/batch",
                 headers=self.headers,
-                json=request_body.model_dump(),
+                json=body,
                 timeout=self.timeout,
             )
+            if response.status_code in (404, 405):
+                return None
             response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            raise _access_request_error(e) from e
+        except httpx.RequestError as e:
+            raise SentinelNetworkError(f"Network error: {e}") from e
 
-            data = response.json()
-            access_response = AccessResponse(**data)
+    def _batch_failure(
+        self, resource_id: str, environment: str, error: SentinelError
+    ) -> SecretResult:
+        if isinstance(error, SentinelDeniedError) and self.deny_cache is not None:
+            self.deny_cache.put((resource_id, environment), str(error))
+        return _failed_result(resource_id, error)
 
-            if access_response.status == AccessStatus.APPROVED:
-                if not access_response.secret:
-                    raise SentinelError("Approved response missing secret payload")
-                return access_response.secret
+    def submit_request(
+        self,
+        resource_id: str,
+        intent: AccessIntent,
+        version: Optional[int] = None,
+        environment: Optional[str] = None,
+        ttl_seconds: int = 3600,
+        polling_interval: float = 2.0,
+        polling_timeout: float = 60.0,
+    ) -> SecretFuture:
+        """
+        Start a `request_secret` call in the background and return at once.
 
-            elif access_response.status == AccessStatus.DENIED:
-                raise SentinelDeniedError(
-                    f"Request denied: {access_response.reason or 'No reason provided'}"
-                )
+        The call runs on a pool of at most `submit_workers` threads, so
+        callers can overlap approval waits with other work.
 
-            elif access_response.status == AccessStatus.PENDING_APPROVAL:
-                return self._poll_for_approval(
-                    access_response.request_id, polling_interval, polling_timeout
+        Returns:
+            SecretFuture: A `concurrent.futures.Future` resolving to the
+                `SecretPayload`, with the request's approval `status`.
+        """
+        future = SecretFuture(resource_id)
+        call = functools.partial(
+            self.request_secret,
+            resource_id,
+            intent,
+            version=version,
+            environment=environment,
+            ttl_seconds=ttl_seconds,
+            polling_interval=polling_interval,
+            polling_timeout=polling_timeout,
+        )
+        with self._submit_lock:
+            if self._submit_pool is None:
+                self._submit_pool = ThreadPoolExecutor(
+                    max_workers=self.submit_workers,
+                    thread_name_prefix="sentinel-submit",
                 )
+            self._submitted.add(future)
+            self._submit_pool.submit(futures.run, future, call)
+        future.add_done_callback(self._forget_submitted)
+        return future
+
+    def _forget_submitted(self, future: SecretFuture) -> None:
+        with self._submit_lock:
+            self._submitted.discard(future)
+
+    def _fetch_grant(
+        self, key: CacheKey, request_args: Tuple[Any, ...], grants_cached: int
+    ) -> SecretPayload:
+        """
+        Request a grant from the server and cache the outcome.
+
+        `grants_cached` is `self._grants_cached` as read before the caller's
+        cache miss; if it has moved since, the cache is checked again first.
+        """
+        with contextlib.ExitStack() as fill:
+            shared = fill.enter_context(self._filling(key))
+            # Another process sharing the cache, or a flight leader that
+            # retired between our miss and our flight, may have stored it
+            if shared or (
+                self.cache is not None and grants_cached != self._grants_cached
+            ):
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return cached
+            try:
+                # an approval can take minutes: don't make other processes wait on it
+                secret = self._request_secret(*request_args, on_pending=fill.close)
+            except SentinelDeniedError as e:
+                if self.deny_cache is not None:
+                    self.deny_cache.put((key[0], key[2]), str(e))
+                raise
+            self._cache_grant(key, secret, request_args)
+        return secret
+
+    @contextlib.contextmanager
+    def _filling(self, key: CacheKey) -> Iterator[bool]:
+        """Take the cache's cross-process fill lock for `key`, if it has one."""
+        filling = getattr(self.cache, "filling", None)
+        if filling is None:
+            yield False
+            return
+        with filling(key):
+            yield True
+
+    def _cache_grant(
+        self, key: CacheKey, secret: SecretPayload, request_args: Tuple[Any, ...]
+    ) -> None:
+        """Cache a grant and schedule its background refresh, if configured."""
+        if self.cache is None:
+            return
+        self.cache.put(key, secret)
+        with self._grants_cached_lock:
+            self._grants_cached += 1
+        self._schedule_refresh(key, secret, request_args)
+
+    def _schedule_refresh(
+        self, key: CacheKey, secret: SecretPayload, request_args: Tuple[Any, ...]
+    ) -> None:
+        if self.refresh_ahead is None:
+            return
+        expires_at = parse_expires_at(secret.expires_at)
+        if expires_at is not None:
+            self.refresh_ahead.schedule(
+                key,
+                expires_at,
+                functools.partial(self._refresh_grant, key, request_args, expires_at),
+            )
+
+    def _refresh_grant(
+        self, key: CacheKey, request_args: Tuple[Any, ...], expires_at: float
+    ) -> None:
+        """Re-request a cached grant; run by the refresh-ahead scheduler."""
+        with contextlib.ExitStack() as fill:
+            shared = fill.enter_context(self._filling(key))
+            current = self.cache.get(key) if shared else None
+            if (
+                current is not None
+                and (parse_expires_at(current.expires_at) or 0) > expires_at
+            ):
+                # Another process already refreshed it; follow its schedule
+                self._schedule_refresh(key, current, request_args)
+                return
+            secret = self._request_secret(*request_args, on_pending=fill.close)
+            self._cache_grant(key, secret, request_args)
+
+    def _request_secret(
+        self,
+        resource_id: str,
+        intent: AccessIntent,
+        version: Optional[int],
+        environment: str,
+        ttl_seconds: int,
+        polling_interval: float,
+        polling_timeout: float,
+        on_pending: Optional[Callable[[], Any]] = None,
+    ) -> SecretPayload:
+        """
+        Perform one access request against the server, polling if pending.
+
+        `on_pending` is called once the request turns out to need approval,
+        before polling starts.
+        """
+        request_body = encode_access_request(
+            self.agent_id,
+            resource_id,
+            version,
+            environment,
+            intent,
+            ttl_seconds,
+            validate=self.validate_requests,
+        )
 
+        try:
+            batched = None
+            if self.batcher is not None and version is None:
+                queued = self.batcher.submit(request_body)
+                try:
+                    # the window plus one request; never wait on the batcher forever
+                    batched = queued.result(self.batcher.window + self.timeout)
+                except FutureTimeoutError:
+                    # still queued: drop it rather than have it sent once we gave up
+                    if queued.cancel():
+                        raise SentinelNetworkError("Batch request timed out") from None
+                    try:
+                        # already being sent: its POST is bounded by the timeout
+                        batched = queued.result(self.timeout)
+                    except FutureTimeoutError:
+                        raise SentinelNetworkError("Batch request timed out") from None
+            if batched is None:
+                response = self._http.post(
+                    f"{self.base_url}/v1/access/request",
+                    headers=self.headers,
+                    json=request_body,
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+                access_response = decode_access_response(response.content)
+                long_poll = _long_poll_seconds(response)
             else:
-                raise SentinelError(f"Unknown status: {access_response.status}")
+                access_response, long_poll = batched
+
+            secret = _resolve_access_response(access_response)
+            if secret is None:
+                futures.set_phase("PENDING_APPROVAL", access_response.request_id)
+                if on_pending is not None:
+                    on_pending()
+                return self._poll_for_approval(
+                    access_response.request_id,
+                    polling_interval,
+                    polling_timeout,
+                    long_poll,
+                )
+            return secret
 
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise SentinelAuthError("Invalid API Token") from e
-            elif e.response.status_code == 403:
-                # Try to extract the reason from the response body
-                try:
-                    error_data = e.response.json()
-                    # The Sentinel server returns the full AccessResponse object on 403,
-                    # so we check for 'reason' or 'message'
-                    reason = error_data.get("reason") or error_data.get("message")
-                    if reason:
-                        raise SentinelDeniedError(reason) from e
-                except SentinelDeniedError:
-                    raise
-                except Exception:
-                    # JSON parsing failed or structure unexpected
-                    pass
-                raise SentinelDeniedError("Access Forbidden") from e
-            raise SentinelError(f"HTTP Error: {e}") from e
+            raise _access_request_error(e) from e
         except httpx.RequestError as e:
             raise SentinelNetworkError(f"Network error: {e}") from e
         except Exception as e:
-            # re-raise known exceptions
-            if isinstance(e, SentinelError):
+            # re-raise known exceptions, and cancellation by submit_request
+            if isinstance(e, (SentinelError, CancelledError)):
                 raise
             raise SentinelError(f"Unexpected error: {e}") from e
 
-    def fetch_secrets(self, environment: Optional[str] = None) -> Dict[str, str]:
+    def fetch_secrets(
+        self, environment: Optional[str] = None, delta: bool = False
+    ) -> Dict[str, str]:
         """
         Fetch all latest secrets for the current environment/project.
         Useful for injecting secrets into a process environment.
 
+        The client keeps a snapshot of the last result per environment and
+        revalidates it with `If-None-Match`, so an unchanged secret set costs
+        a single 304 response.
+
         Args:
             environment: Optional environment to fetch secrets for (defaults to client environment).
+            delta: Ask only for resources changed since the last sync and merge
+                them into the snapshot. Falls back to a full fetch when there is
+                no snapshot yet or the server does not report a change cursor.
 
         Returns:
             Dict[str, str]: A dictionary mapping resource IDs to secret values.
         """
         target_environment = environment or self.environment
         params = {"environment": target_environment} if target_environment else {}
+        headers = dict(self.headers)
+        with self._snapshots_lock:
+            snapshot = self._snapshots.get(target_environment)
+        if snapshot is not None:
+            etag, cursor, _ = snapshot
+            if etag:
+                headers["If-None-Match"] = etag
+            if delta and cursor:
+                params["since"] = cursor
 
         try:
-            response = httpx.get(
+            response = self._http.get(
                 f"{self.base_url}/v1/secrets",
-                headers=self.headers,
+                headers=headers,
                 params=params,
                 timeout=self.timeout,
             )
+            if response.status_code == 304 and snapshot is not None:
+                return dict(snapshot[2])
             response.raise_for_status()
-            return response.json()
+            if "since" in params:
+                secrets = {**snapshot[2], **response.json()["secrets"]}
+            else:
+                secrets = response.json()
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise SentinelAuthError("Invalid API Token") from e
-            raise SentinelError(f"HTTP Error: {e}") from e
+            raise _api_error(e) from e
         except httpx.RequestError as e:
             raise SentinelNetworkError(f"Network error: {e}") from e
         except Exception as e:
             raise SentinelError(f"Unexpected error: {e}") from e
 
+        with self._snapshots_lock:
+            self._snapshots[target_environment] = (
+                response.headers.get("ETag"),
+                response.headers.get("X-Sentinel-Cursor"),
+                secrets,
+            )
+        return dict(secrets)
+
     def list_resources(self, environment: Optional[str] = None) -> list[str]:
         """
         List all available resource IDs that can be requested.
@@ -196,7 +900,7 @@ class SentinelClient:
         params = {"environment": target_environment} if target_environment else {}
 
         try:
-            response = httpx.get(
+            response = self._http.get(
                 f"{self.base_url}/v1/resources",
                 headers=self.headers,
                 params=params,
@@ -205,51 +909,89 @@ class SentinelClient:
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise SentinelAuthError("Invalid API Token") from e
-            raise SentinelError(f"HTTP Error: {e}") from e
+            raise _api_error(e) from e
         except httpx.RequestError as e:
             raise SentinelNetworkError(f"Network error: {e}") from e
         except Exception as e:
             raise SentinelError(f"Unexpected error: {e}") from e
 
     def _poll_for_approval(
-        self, request_id: str, interval: float, timeout: float
+        self,
+        request_id: str,
+        interval: float,
+        timeout: float,
+        long_poll: Optional[float] = None,
     ) -> SecretPayload:
-        """Poll the request status until approved, denied, or timeout."""
-        start_time = time.time()
-
-        while (time.time() - start_time) < timeout:
-            time.sleep(interval)
+        """
+        Poll the request status until approved, denied, or timeout.
 
+        When the server advertises long-polling, each status request is held
+        open by the server for up to `long_poll` seconds and answered as soon
+        as the request is resolved; the poll strategy then only paces retries
+        after errors.
+        """
+        if self.approval_poller is not None:
+            watch = self.approval_poller.watch(request_id, timeout)
+            current = futures.current_future()
+            if current is not None:
+                current._on_abort(watch.cancel)
             try:
-                response = httpx.get(
-                    f"{self.base_url}/v1/access/requests/{request_id}",
-                    headers=self.headers,
-                    timeout=self.timeout,
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                access_response = AccessResponse(**data)
-
-                if access_response.status == AccessStatus.APPROVED:
-                    if not access_response.secret:
-                        raise SentinelError("Approved response missing secret payload")
-                    return access_response.secret
+                # the poller expires the watch itself; this only bounds the wait
+                return watch.result(timeout + self.approval_poller.interval)
+            except FutureTimeoutError:
+                watch.cancel()
+                raise SentinelTimeoutError(
+                    f"Polling timed out after {timeout} seconds"
+                ) from None
+        run = PollRun(self.poll_strategy or FixedInterval(interval), timeout)
+        try:
+            while True:
+                wait = run.next_wait()
+                if wait is None:
+                    break
+                params = {}
+                if long_poll is None:
+                    futures.wait(wait)
+                else:
+                    remaining = run.deadline - time.monotonic()
+                    params["wait"] = f"{max(min(long_poll, remaining), 0.001):.3f}"
 
-                elif access_response.status == AccessStatus.DENIED:
-                    raise SentinelDeniedError(
-                        f"Request denied: {access_response.reason or 'No reason provided'}"
+                try:
+                    response = self._http.get(
+                        f"{self.base_url}/v1/access/requests/{request_id}",
+                        headers=self.headers,
+                        params=params,
+                        timeout=self.timeout + (long_poll or 0),
                     )
+                except httpx.RequestError:
+                    # transient network errors back off like any other poll
+                    run.failed()
+                    if long_poll is not None:
+                        futures.wait(wait)
+                    continue
+                if run.retry_later(response):
+                    if long_poll is not None:
+                        futures.wait(wait)
+                    continue
 
-                # If still PENDING_APPROVAL, continue loop
+                try:
+                    response.raise_for_status()
+                except httpx.HTTPStatusError as e:
+                    # 404 or other non-transient errors should abort
+                    raise SentinelError(f"Error during polling: {e}") from e
 
-            except httpx.RequestError:
-                # transient network errors during polling can be ignored or counted
-                continue
-            except httpx.HTTPStatusError as e:
-                # 404 or other non-transient errors should abort
-                raise SentinelError(f"Error during polling: {e}") from e
+                secret = _resolve_access_response(
+                    decode_access_response(response.content)
+                )
+                if secret is not None:
+                    return secret
+                futures.raise_if_cancelled()
+
+                # If still PENDING_APPROVAL, continue loop; a server that stops
+                # advertising long-polling is polled on the strategy's schedule
+                if long_poll is not None:
+                    long_poll = _long_poll_seconds(response)
+        finally:
+            run.finish()
 
         raise SentinelTimeoutError(f"Polling timed out after {timeout} seconds")
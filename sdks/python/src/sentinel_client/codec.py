@@ -0,0 +1,69 @@
+"""Wire encoding of access requests and decoding of access responses.
+
+Request bodies are built as plain dicts and responses are decoded with
+pydantic's compiled JSON validator, which parses and validates the raw bytes
+in one pass instead of going through `response.json()` and the model's
+`__init__`. Responses are always validated; passing `validate=True` to
+`encode_access_request` also runs the arguments through `AccessRequest`.
+"""
+
+from typing import Any, Dict, Optional, Union
+
+from .types import AccessIntent, AccessRequest, AccessResponse
+
+
+def encode_intent(intent: Union[AccessIntent, Dict[str, Any]]) -> Dict[str, str]:
+    """Return the JSON body of an intent."""
+    if not isinstance(intent, AccessIntent):
+        intent = AccessIntent.model_validate(intent)
+    return {
+        "summary": intent.summary,
+        "description": intent.description,
+        "task_id": intent.task_id,
+    }
+
+
+def encode_access_request(
+    agent_id: str,
+    resource_id: str,
+    version: Optional[int],
+    environment: Optional[str],
+    intent: AccessIntent,
+    ttl_seconds: int,
+    validate: bool = False,
+) -> Dict[str, Any]:
+    """
+    Return the JSON body of `POST /v1/access/request`.
+
+    With `validate=True` the body is built through the `AccessRequest` model,
+    so a malformed argument (e.g. a non-positive `ttl_seconds`) raises
+    `pydantic.ValidationError` before anything is sent; otherwise the server
+    is left to reject it.
+    """
+    if validate:
+        return AccessRequest(
+            agent_id=agent_id,
+            resource_id=resource_id,
+            version=version,
+            environment=environment,
+            intent=intent,
+            ttl_seconds=ttl_seconds,
+        ).model_dump()
+    return {
+        "agent_id": agent_id,
+        "resource_id": resource_id,
+        "version": version,
+        "environment": environment,
+        "intent": encode_intent(intent),
+        "ttl_seconds": ttl_seconds,
+    }
+
+
+def decode_access_response(content: Union[bytes, str]) -> AccessResponse:
+    """Parse and validate a raw `AccessResponse` JSON body."""
+    return AccessResponse.model_validate_json(content)
+
+
+def decode_access_item(data: Dict[str, Any]) -> AccessResponse:
+    """Validate one already parsed `AccessResponse`, e.g. a batch item."""
+    return AccessResponse.model_validate(data)
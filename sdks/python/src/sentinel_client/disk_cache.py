@@ -0,0 +1,256 @@
+"""Encrypted, per-user on-disk grant cache for repeated CLI invocations.
+
+Each (server URL, API token) pair gets its own Fernet-encrypted file under
+the user's cache directory, keyed by a hash of the pair and encrypted with
+a key derived from it, so only a caller holding the same token can read it.
+Updates run under an exclusive `flock` and replace the file atomically, so
+concurrent `sentinel` processes never corrupt or lose each other's entries;
+lookups only take a shared lock and never rewrite the file. Hit and miss
+counters live in a small side file that is bumped in place. Requires the
+`cache` extra.
+"""
+
+import base64
+import contextlib
+import hashlib
+import json
+import os
+import struct
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
+
+from .cache import CacheKey, parse_expires_at
+from .exceptions import SentinelError
+
+if TYPE_CHECKING:
+    from .types import SecretPayload
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+CACHE_DIR_ENV = "SENTINEL_CACHE_DIR"
+
+# hits, then misses, in the `.stats` side file
+_COUNTER = struct.Struct("<Q")
+
+
+def default_cache_dir() -> str:
+    """Return the directory holding the CLI's on-disk cache files."""
+    if os.environ.get(CACHE_DIR_ENV):
+        return os.environ[CACHE_DIR_ENV]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "sentinel")
+
+
+def clear_cache_dir(directory: Optional[str] = None) -> int:
+    """Delete every cache file in `directory`; return how many were removed."""
+    directory = directory or default_cache_dir()
+    removed = 0
+    if not os.path.isdir(directory):
+        return removed
+    for name in os.listdir(directory):
+        if name.startswith(("grants-", "catalog-")) and name.endswith(
+            (".bin", ".json", ".lock", ".stats")
+        ):
+            os.unlink(os.path.join(directory, name))
+            removed += name.endswith((".bin", ".json"))
+    return removed
+
+
+@dataclass
+class DiskCacheStats:
+    path: str
+    entries: int = 0
+    live: int = 0
+    hits: int = 0
+    misses: int = 0
+    size_bytes: int = 0
+
+
+class DiskGrantCache:
+    def __init__(
+        self,
+        base_url: str,
+        api_token: str,
+        directory: Optional[str] = None,
+        safety_margin: float = 30.0,
+    ):
+        """
+        Initialize the on-disk cache for one server and token.
+
+        Implements the `get`/`put`/`invalidate`/`stats` interface of
+        `GrantCache`, so it can be passed to `SentinelClient(cache=...)`.
+
+        Args:
+            base_url: Sentinel server URL the cached grants came from.
+            api_token: API token; the encryption key is derived from it.
+            directory: Cache directory (defaults to `default_cache_dir()`).
+            safety_margin: Seconds before `expires_at` at which a grant stops being served.
+
+        Raises:
+            SentinelError: If the `cryptography` package is not installed.
+        """
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError as e:
+            raise SentinelError(
+                "The on-disk cache requires the 'cache' extra "
+                "(pip install 'sentinel-client[cache]')"
+            ) from e
+
+        self.directory = directory or default_cache_dir()
+        self.safety_margin = safety_margin
+        identity = f"{base_url.rstrip('/')}\0{api_token}".encode()
+        name = hashlib.sha256(b"sentinel-cache-name\0" + identity).hexdigest()[:16]
+        key = hashlib.sha256(b"sentinel-cache-key\0" + identity).digest()
+        self._fernet = Fernet(base64.urlsafe_b64encode(key))
+        self.path = os.path.join(self.directory, f"grants-{name}.bin")
+        self._lock_path = os.path.join(self.directory, f"grants-{name}.lock")
+        self._stats_path = os.path.join(self.directory, f"grants-{name}.stats")
+
+    def get(self, key: CacheKey) -> Optional["SecretPayload"]:
+        """Return a still-valid grant for `key`, or None."""
+        # imported here so the catalog and `cache clear` need not load pydantic
+        from .types import SecretPayload
+
+        with self._locked(exclusive=False):
+            data = self._load()
+        entry = data["grants"].get(_encode_key(key))
+        hit = entry is not None and entry["serve_until"] > time.time()
+        self._count(hit)
+        return SecretPayload(**entry["secret"]) if hit else None
+
+    def put(self, key: CacheKey, secret: "SecretPayload") -> None:
+        """Store a grant until shortly before it expires."""
+        expires_at = parse_expires_at(secret.expires_at)
+        if expires_at is None or expires_at - self.safety_margin <= time.time():
+            return
+        with self._locked(exclusive=True):
+            data = self._load()
+            _prune(data)
+            data["grants"][_encode_key(key)] = {
+                "secret": secret.model_dump(),
+                "serve_until": expires_at - self.safety_margin,
+            }
+            self._store(data)
+
+    def get_secrets(self, environment: str) -> Optional[Dict[str, str]]:
+        """Return a cached `fetch_secrets` result for `environment`, or None."""
+        with self._locked(exclusive=False):
+            data = self._load()
+        entry = data["secrets"].get(environment)
+        hit = entry is not None and entry["serve_until"] > time.time()
+        self._count(hit)
+        return dict(entry["values"]) if hit else None
+
+    def put_secrets(
+        self, environment: str, secrets: Dict[str, str], ttl: float
+    ) -> None:
+        """Cache a `fetch_secrets` result for `ttl` seconds."""
+        with self._locked(exclusive=True):
+            data = self._load()
+            _prune(data)
+            data["secrets"][environment] = {
+                "values": secrets,
+                "serve_until": time.time() + ttl,
+            }
+            self._store(data)
+
+    def invalidate(self, resource_id: Optional[str] = None) -> None:
+        """Drop cached grants for `resource_id`, or everything when omitted."""
+        with self._locked(exclusive=True):
+            data = self._load()
+            if resource_id is None:
+                data["grants"].clear()
+                data["secrets"].clear()
+            else:
+                for name in [
+                    k for k in data["grants"] if json.loads(k)[0] == resource_id
+                ]:
+                    del data["grants"][name]
+            self._store(data)
+
+    @property
+    def stats(self) -> DiskCacheStats:
+        with self._locked(exclusive=False):
+            data = self._load()
+        hits, misses = self._counters()
+        now = time.time()
+        entries = list(data["grants"].values()) + list(data["secrets"].values())
+        return DiskCacheStats(
+            path=self.path,
+            entries=len(entries),
+            live=sum(1 for e in entries if e["serve_until"] > now),
+            hits=hits,
+            misses=misses,
+            size_bytes=os.path.getsize(self.path) if os.path.exists(self.path) else 0,
+        )
+
+    @contextlib.contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            os.close(fd)  # closing the descriptor releases the lock
+
+    def _count(self, hit: bool) -> None:
+        """Bump the hit or miss counter in place, without touching the cache file."""
+        offset = 0 if hit else _COUNTER.size
+        fd = os.open(self._stats_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.lockf(fd, fcntl.LOCK_EX, _COUNTER.size, offset)
+            raw = os.pread(fd, _COUNTER.size, offset)
+            count = _COUNTER.unpack(raw)[0] if len(raw) == _COUNTER.size else 0
+            os.pwrite(fd, _COUNTER.pack(count + 1), offset)
+        finally:
+            os.close(fd)  # closing the descriptor releases the lock
+
+    def _counters(self) -> Tuple[int, int]:
+        try:
+            with open(self._stats_path, "rb") as f:
+                raw = f.read(2 * _COUNTER.size)
+        except FileNotFoundError:
+            return 0, 0
+        raw = raw.ljust(2 * _COUNTER.size, b"\0")
+        return _COUNTER.unpack_from(raw, 0)[0], _COUNTER.unpack_from(raw, 8)[0]
+
+    def _load(self) -> Dict[str, Any]:
+        from cryptography.fernet import InvalidToken
+
+        empty: Dict[str, Any] = {"grants": {}, "secrets": {}}
+        try:
+            with open(self.path, "rb") as f:
+                return json.loads(self._fernet.decrypt(f.read()))
+        except FileNotFoundError:
+            return empty
+        except (InvalidToken, ValueError):
+            # Corrupt, or written under a different key: start over
+            return empty
+
+    def _store(self, data: Dict[str, Any]) -> None:
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(self._fernet.encrypt(json.dumps(data).encode()))
+        os.replace(tmp_path, self.path)
+
+
+def _encode_key(key: CacheKey) -> str:
+    return json.dumps(list(key))
+
+
+def _prune(data: Dict[str, Any]) -> None:
+    now = time.time()
+    for section in ("grants", "secrets"):
+        for name in [k for k, e in data[section].items() if e["serve_until"] <= now]:
+            del data[section][name]
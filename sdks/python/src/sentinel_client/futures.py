@@ -0,0 +1,138 @@
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+from typing import Any, Callable, List, Optional
+
+from .exceptions import SentinelDeniedError, SentinelTimeoutError
+
+# The SecretFuture whose request the current worker thread is running
+_submitted = threading.local()
+
+
+class SecretFuture(Future):
+    """
+    Handle for a secret request started with `SentinelClient.submit_request`.
+
+    A `concurrent.futures.Future`: `result()` returns the `SecretPayload`,
+    callbacks and `concurrent.futures.wait` work as usual. `status` tracks
+    the request through the server's approval flow. `cancel()` also works
+    once the request has started: a request waiting for approval, or for
+    another caller's identical request, stops at once, and one whose POST is
+    in flight is abandoned when it returns. Either way `result()` raises
+    `CancelledError`.
+    """
+
+    def __init__(self, resource_id: str):
+        super().__init__()
+        self.resource_id = resource_id
+        self.request_id: Optional[str] = None
+        self._phase = "QUEUED"
+        self._abort = threading.Event()
+        self._abort_callbacks: List[Callable[[], Any]] = []
+        self._abort_lock = threading.Lock()
+        self._settling = False
+
+    @property
+    def status(self) -> str:
+        """
+        One of QUEUED, REQUESTING, PENDING_APPROVAL, APPROVED, DENIED,
+        TIMED_OUT, CANCELLED or FAILED.
+        """
+        if self.cancelled():
+            return "CANCELLED"
+        if not self.done():
+            return self._phase
+        error = self.exception()
+        if error is None:
+            return "APPROVED"
+        if isinstance(error, SentinelDeniedError):
+            return "DENIED"
+        if isinstance(error, SentinelTimeoutError):
+            return "TIMED_OUT"
+        if isinstance(error, CancelledError):
+            return "CANCELLED"
+        return "FAILED"
+
+    def cancel(self) -> bool:
+        """Cancel the request unless it has already been settled."""
+        if super().cancel():
+            return True
+        with self._abort_lock:
+            if self._settling or self.done():
+                return False
+            self._abort.set()
+            callbacks, self._abort_callbacks = self._abort_callbacks, []
+        for callback in callbacks:
+            callback()
+        return True
+
+    def cancelled(self) -> bool:
+        """Return True if `cancel()` took effect, before or after the start."""
+        return super().cancelled() or (self.done() and self._abort.is_set())
+
+    def _on_abort(self, callback: Callable[[], Any]) -> None:
+        with self._abort_lock:
+            if not self._abort.is_set():
+                self._abort_callbacks.append(callback)
+                return
+        callback()
+
+
+def current_future() -> Optional[SecretFuture]:
+    """Return the SecretFuture being run by this thread, if any."""
+    return getattr(_submitted, "future", None)
+
+
+def set_phase(phase: str, request_id: Optional[str] = None) -> None:
+    """Record progress of the submitted request this thread is running."""
+    future = current_future()
+    if future is not None:
+        future._phase = phase
+        if request_id is not None:
+            future.request_id = request_id
+
+
+def wait(seconds: float) -> None:
+    """Sleep between polls; raise `CancelledError` if the submitter cancelled."""
+    future = current_future()
+    if future is None:
+        time.sleep(seconds)
+    elif future._abort.wait(seconds):
+        raise CancelledError()
+
+
+def on_cancel(callback: Callable[[], Any]) -> None:
+    """Call `callback` when the submitted request this thread runs is cancelled."""
+    future = current_future()
+    if future is not None:
+        future._on_abort(callback)
+
+
+def raise_if_cancelled() -> None:
+    future = current_future()
+    if future is not None and future._abort.is_set():
+        raise CancelledError()
+
+
+def run(future: SecretFuture, fn: Callable[[], Any]) -> None:
+    """Run `fn` on a worker thread on behalf of `future` and settle it."""
+    if not future.set_running_or_notify_cancel():
+        return
+    future._phase = "REQUESTING"
+    _submitted.future = future
+    error: Optional[BaseException] = None
+    try:
+        result = fn()
+    except BaseException as e:
+        error = e
+    finally:
+        _submitted.future = None
+    with future._abort_lock:
+        # from here on cancel() returns False; before, it wins over the outcome
+        future._settling = True
+        if future._abort.is_set():
+            error = CancelledError()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
@@ -0,0 +1,251 @@
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from .codec import decode_access_item
+from .exceptions import SentinelError, SentinelTimeoutError
+from .polling import _RETRYABLE_STATUSES, parse_retry_after
+
+if TYPE_CHECKING:
+    from .client import SentinelClient
+
+
+@dataclass
+class PollerStats:
+    watched: int = 0
+    resolved: int = 0
+    requests: int = 0
+    errors: int = 0
+    pending: int = 0
+
+
+class ApprovalPoller:
+    def __init__(
+        self,
+        client: "SentinelClient",
+        interval: float = 1.0,
+        batch_size: int = 100,
+    ):
+        """
+        Poll every pending approval of a client from one background thread.
+
+        Each `watch()` returns a `Future` that resolves to the granted
+        `SecretPayload`, or fails with `SentinelDeniedError` or
+        `SentinelTimeoutError`. On every tick the pending request IDs are
+        fetched in batches from `GET /v1/access/requests?ids=...`; servers
+        without that endpoint are polled one ID at a time, still from the one
+        thread. A server `Retry-After` postpones the next tick.
+
+        Args:
+            client: Client whose connection pool and credentials are used.
+            interval: Seconds between polling ticks.
+            batch_size: Maximum request IDs per batch status request.
+        """
+        self._client = client
+        self.interval = interval
+        self.batch_size = batch_size
+        self._condition = threading.Condition()
+        self._pending: Dict[str, List[Tuple[Future, Optional[float]]]] = {}
+        self._batch_supported: Optional[bool] = None
+        self._next_poll = 0.0
+        self._stats = PollerStats()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, request_id: str, timeout: Optional[float] = None) -> Future:
+        """
+        Start tracking a pending request.
+
+        Args:
+            request_id: ID returned by a `PENDING_APPROVAL` access response.
+            timeout: Seconds after which the future fails with `SentinelTimeoutError`.
+
+        Returns:
+            Future: Resolves to the `SecretPayload` once the request is approved.
+        """
+        future: Future = Future()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            if self._closed:
+                raise SentinelError("Approval poller is shut down")
+            if not self._pending:
+                self._next_poll = time.monotonic() + self.interval
+            self._pending.setdefault(request_id, []).append((future, deadline))
+            self._stats.watched += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sentinel-approval-poller", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return future
+
+    def shutdown(self) -> None:
+        """Stop polling; futures still pending fail with `SentinelError`."""
+        with self._condition:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+            self._condition.notify()
+        for watchers in pending.values():
+            for future, _ in watchers:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(SentinelError("Approval poller shut down"))
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    @property
+    def stats(self) -> PollerStats:
+        with self._condition:
+            stats = PollerStats(**vars(self._stats))
+            stats.pending = len(self._pending)
+            return stats
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    now = time.monotonic()
+                    self._expire(now)
+                    if self._pending and self._next_poll <= now:
+                        break
+                    deadlines = [
+                        d for w in self._pending.values() for _, d in w if d is not None
+                    ]
+                    wake = min([self._next_poll] + deadlines) if self._pending else None
+                    self._condition.wait(None if wake is None else wake - now)
+                if self._closed:
+                    return
+                request_ids = list(self._pending)
+            try:
+                retry_after = self._poll(request_ids)
+            except Exception:
+                # this thread alone enforces the watchers' deadlines: keep it alive
+                self._count_error()
+                retry_after = None
+            with self._condition:
+                self._next_poll = time.monotonic() + max(
+                    self.interval, retry_after or 0
+                )
+
+    def _expire(self, now: float) -> None:
+        """Drop cancelled watchers and fail the ones past their deadline."""
+        for request_id in list(self._pending):
+            watchers = self._pending[request_id]
+            for future, deadline in list(watchers):
+                expired = deadline is not None and deadline <= now
+                if expired or future.cancelled():
+                    watchers.remove((future, deadline))
+                if expired and future.set_running_or_notify_cancel():
+                    future.set_exception(
+                        SentinelTimeoutError(f"Approval of {request_id} timed out")
+                    )
+            if not watchers:
+                del self._pending[request_id]
+
+    def _poll(self, request_ids: List[str]) -> Optional[float]:
+        """Fetch and settle `request_ids`; return any `Retry-After` in seconds."""
+        if self._batch_supported is not False:
+            retry_after = self._poll_batches(request_ids)
+            if self._batch_supported is not False:
+                return retry_after
+        return self._poll_each(request_ids)
+
+    def _poll_batches(self, request_ids: List[str]) -> Optional[float]:
+        for start in range(0, len(request_ids), self.batch_size):
+            chunk = request_ids[start : start + self.batch_size]
+            response = self._get("/v1/access/requests", {"ids": ",".join(chunk)})
+            if response is None:
+                return None
+            if response.status_code in (404, 405) and not self._batch_supported:
+                self._batch_supported = False  # older server: poll one by one
+                return None
+            if response.status_code in _RETRYABLE_STATUSES:
+                return parse_retry_after(response)
+            if response.status_code != 200:
+                self._count_error()
+                continue
+            self._batch_supported = True
+            try:
+                statuses = response.json().get("requests", {})
+                if not isinstance(statuses, dict):
+                    raise ValueError("'requests' is not an object")
+            except (AttributeError, ValueError):
+                self._count_error()
+                continue
+            for request_id in chunk:
+                if request_id in statuses:
+                    self._settle(request_id, statuses[request_id])
+                else:
+                    self._fail(request_id, SentinelError("Request not found"))
+        return None
+
+    def _poll_each(self, request_ids: List[str]) -> Optional[float]:
+        for request_id in request_ids:
+            response = self._get(f"/v1/access/requests/{request_id}")
+            if response is None:
+                continue
+            if response.status_code in _RETRYABLE_STATUSES:
+                return parse_retry_after(response)
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                self._fail(request_id, SentinelError(f"Error during polling: {e}"))
+                continue
+            try:
+                data = response.json()
+            except ValueError as e:
+                self._fail(request_id, SentinelError(f"Unexpected error: {e}"))
+                continue
+            self._settle(request_id, data)
+        return None
+
+    def _get(
+        self, path: str, params: Optional[Dict[str, str]] = None
+    ) -> Optional[httpx.Response]:
+        client = self._client
+        with self._condition:
+            self._stats.requests += 1
+        try:
+            return client._http.get(
+                f"{client.base_url}{path}",
+                headers=client.headers,
+                params=params,
+                timeout=client.timeout,
+            )
+        except httpx.RequestError:
+            # transient network errors are retried on the next tick
+            self._count_error()
+            return None
+
+    def _settle(self, request_id: str, data: Dict[str, Any]) -> None:
+        from .client import _resolve_access_response
+
+        try:
+            secret = _resolve_access_response(decode_access_item(data))
+        except SentinelError as e:
+            self._fail(request_id, e)
+            return
+        except (TypeError, ValueError) as e:
+            self._fail(request_id, SentinelError(f"Unexpected error: {e}"))
+            return
+        if secret is not None:
+            self._finish(request_id, lambda f: f.set_result(secret))
+
+    def _fail(self, request_id: str, error: SentinelError) -> None:
+        self._finish(request_id, lambda f: f.set_exception(error))
+
+    def _finish(self, request_id: str, settle: Any) -> None:
+        with self._condition:
+            watchers = self._pending.pop(request_id, [])
+            self._stats.resolved += bool(watchers)
+        for future, _ in watchers:
+            if future.set_running_or_notify_cancel():
+                settle(future)
+
+    def _count_error(self) -> None:
+        with self._condition:
+            self._stats.errors += 1
@@ -0,0 +1,169 @@
+import abc
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+import httpx
+
+# Statuses that mean "ask again later" rather than "this request is broken"
+_RETRYABLE_STATUSES = (429, 502, 503, 504)
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Return the seconds a `Retry-After` header asks to wait, or None."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class PollStats:
+    approvals: int = 0
+    polls: int = 0
+    errors: int = 0
+    throttled: int = 0
+    max_polls: int = 0
+
+    @property
+    def polls_per_approval(self) -> float:
+        return self.polls / self.approvals if self.approvals else 0.0
+
+
+class PollStrategy(abc.ABC):
+    """
+    Decides how long to wait before each status poll of a pending approval.
+
+    Subclasses implement `delay`. One strategy may be shared by every
+    approval a client waits on; `stats` aggregates over all of them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = PollStats()
+
+    @abc.abstractmethod
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before poll number `attempt` (starting at 0)."""
+
+    def record(self, polls: int, errors: int, throttled: int) -> None:
+        """Account for one finished approval wait."""
+        with self._lock:
+            self._stats.approvals += 1
+            self._stats.polls += polls
+            self._stats.errors += errors
+            self._stats.throttled += throttled
+            self._stats.max_polls = max(self._stats.max_polls, polls)
+
+    @property
+    def stats(self) -> PollStats:
+        with self._lock:
+            return PollStats(**vars(self._stats))
+
+
+class FixedInterval(PollStrategy):
+    def __init__(self, interval: float = 2.0):
+        """Poll every `interval` seconds."""
+        super().__init__()
+        self.interval = interval
+
+    def delay(self, attempt: int) -> float:
+        return self.interval
+
+
+class ExponentialBackoff(PollStrategy):
+    def __init__(
+        self,
+        initial: float = 0.5,
+        maximum: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        rng: Callable[[], float] = random.random,
+    ):
+        """
+        Capped exponential backoff with full jitter.
+
+        Poll `attempt` waits a random time between zero and
+        `min(maximum, initial * multiplier ** attempt)`, so approvals granted
+        quickly are picked up quickly while long waits settle at one poll per
+        `maximum / 2` seconds on average, and a fleet of waiting agents does
+        not poll in lockstep.
+
+        Args:
+            initial: Upper bound of the first delay, in seconds.
+            maximum: Cap on the delay bound, in seconds.
+            multiplier: Growth factor of the bound per poll.
+            jitter: Draw each delay uniformly below the bound; when False the
+                bound itself is used.
+            rng: Source of uniform numbers in [0, 1), overridable for tests.
+        """
+        super().__init__()
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self._rng = rng
+
+    def delay(self, attempt: int) -> float:
+        # Stop growing once the cap is reached so huge attempts cannot overflow
+        bound = self.initial
+        for _ in range(attempt):
+            bound *= self.multiplier
+            if bound >= self.maximum:
+                break
+        bound = min(bound, self.maximum)
+        return self._rng() * bound if self.jitter else bound
+
+
+class PollRun:
+    """Bookkeeping for one approval wait: next sleep, deadline and counters."""
+
+    def __init__(self, strategy: PollStrategy, timeout: float):
+        self.strategy = strategy
+        self.deadline = time.monotonic() + timeout
+        self.polls = 0
+        self.errors = 0
+        self.throttled = 0
+        self._next = strategy.delay(0)
+
+    def next_wait(self) -> Optional[float]:
+        """Seconds to sleep before the next poll, or None once the deadline passed."""
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        self.polls += 1
+        wait, self._next = self._next, self.strategy.delay(self.polls)
+        return min(wait, remaining)
+
+    def failed(self) -> None:
+        """Record a poll that did not reach the server."""
+        self.errors += 1
+
+    def retry_later(self, response: httpx.Response) -> bool:
+        """
+        Apply any `Retry-After` from `response` to the next wait.
+
+        Returns:
+            bool: True if the server asked to be polled again later
+                (429 or a 5xx gateway/availability error).
+        """
+        retry_after = parse_retry_after(response)
+        if retry_after is not None:
+            self._next = max(self._next, retry_after)
+        if response.status_code in _RETRYABLE_STATUSES:
+            self.throttled += 1
+            return True
+        return False
+
+    def finish(self) -> None:
+        self.strategy.record(self.polls, self.errors, self.throttled)
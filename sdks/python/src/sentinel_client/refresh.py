@@ -0,0 +1,158 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+
+@dataclass
+class RefreshStats:
+    scheduled: int = 0
+    refreshed: int = 0
+    failed: int = 0
+    dropped_idle: int = 0
+
+
+class RefreshAheadScheduler:
+    def __init__(
+        self,
+        refresh_fraction: float = 0.75,
+        jitter: float = 0.1,
+        max_retries: int = 3,
+        max_workers: int = 4,
+    ):
+        """
+        Re-request grants in the background before they expire.
+
+        A grant with `ttl` seconds left is refreshed after roughly
+        `refresh_fraction * ttl` seconds, brought forward by up to `jitter * ttl`
+        at random so a fleet of clients does not refresh in lockstep. Only
+        grants that were read since they were last scheduled are refreshed;
+        idle ones are allowed to lapse. Refreshes run on a small worker pool,
+        so a refresh waiting on human approval never delays the others.
+
+        Args:
+            refresh_fraction: Fraction of the remaining lifetime after which to refresh.
+            jitter: Maximum fraction of the remaining lifetime to refresh early by.
+            max_retries: Failed refreshes retried before giving up on a grant.
+            max_workers: Number of refreshes that may run at the same time.
+        """
+        if not 0 < refresh_fraction < 1:
+            raise ValueError("refresh_fraction must be between 0 and 1")
+        self.refresh_fraction = refresh_fraction
+        self.jitter = jitter
+        self.max_retries = max_retries
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="sentinel-refresh"
+        )
+        self._condition = threading.Condition()
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._jobs: Dict[Hashable, Tuple[int, float, Callable[[], None], int]] = {}
+        self._touched: Set[Hashable] = set()
+        self._counter = itertools.count()
+        self._stats = RefreshStats()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(
+        self,
+        key: Hashable,
+        expires_at: float,
+        refresh: Callable[[], None],
+        attempt: int = 0,
+    ) -> None:
+        """
+        Schedule `refresh` to run ahead of `expires_at` (seconds since the epoch).
+
+        Scheduling a key again replaces its pending refresh.
+        """
+        remaining = expires_at - time.time()
+        if remaining <= 0:
+            return
+        delay = remaining * (self.refresh_fraction - self.jitter * random.random())
+        with self._condition:
+            if self._closed:
+                return
+            seq = next(self._counter)
+            due = time.monotonic() + max(delay, 0.0)
+            self._jobs[key] = (seq, expires_at, refresh, attempt)
+            heapq.heappush(self._heap, (due, seq, key))
+            self._stats.scheduled += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sentinel-refresh-scheduler", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def touch(self, key: Hashable) -> None:
+        """Record that a cached grant was read, keeping it eligible for refresh."""
+        with self._condition:
+            if key in self._jobs:
+                self._touched.add(key)
+
+    def cancel(self, key: Optional[Hashable] = None) -> None:
+        """Cancel the pending refresh for `key`, or all of them when omitted."""
+        with self._condition:
+            if key is None:
+                self._jobs.clear()
+                self._touched.clear()
+            else:
+                self._jobs.pop(key, None)
+                self._touched.discard(key)
+
+    def shutdown(self) -> None:
+        """Stop scheduling refreshes and wait for running ones to finish."""
+        with self._condition:
+            self._closed = True
+            self._jobs.clear()
+            self._condition.notify()
+        self._executor.shutdown(wait=True)
+
+    @property
+    def stats(self) -> RefreshStats:
+        with self._condition:
+            return RefreshStats(**vars(self._stats))
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._heap:
+                        timeout = self._heap[0][0] - time.monotonic()
+                        if timeout <= 0:
+                            break
+                    else:
+                        timeout = None
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+                _, seq, key = heapq.heappop(self._heap)
+                job = self._jobs.get(key)
+                if job is None or job[0] != seq:
+                    continue  # cancelled or superseded by a newer schedule
+                del self._jobs[key]
+                if key not in self._touched:
+                    self._stats.dropped_idle += 1
+                    continue
+                self._touched.discard(key)
+            self._executor.submit(self._refresh, key, job)
+
+    def _refresh(
+        self, key: Hashable, job: Tuple[int, float, Callable[[], None], int]
+    ) -> None:
+        _, expires_at, refresh, attempt = job
+        try:
+            refresh()
+        except Exception:
+            with self._condition:
+                self._stats.failed += 1
+            if attempt < self.max_retries:
+                self.schedule(key, expires_at, refresh, attempt + 1)
+                self.touch(key)
+            return
+        with self._condition:
+            self._stats.refreshed += 1
@@ -0,0 +1,289 @@
+"""Shared-memory grant cache for pre-forked worker processes.
+
+Every worker on a host maps the same file (under /dev/shm when available),
+so a grant fetched by one worker is served to all of them. The file is a
+fixed table of slots, which bounds its size. Readers never lock: each slot
+carries a sequence number that writers make odd while they update it, and a
+reader retries if the number was odd or changed under it (a seqlock).
+Writers serialize on a POSIX byte-range lock over the slot, and
+`filling(key)` gives one process at a time the right to fetch a missing
+grant, so concurrent misses across workers cost one upstream request.
+"""
+
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import stat
+import struct
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .cache import CacheKey, CacheStats, parse_expires_at
+from .types import SecretPayload
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+_MAGIC = b"SNTLSHM1"
+# magic, slot count, slot size
+_HEADER = struct.Struct("<8sII")
+# sequence number, key hash (0 = empty), serve-until timestamp, payload length
+_SLOT = struct.Struct("<QQdI")
+_SEQ = struct.Struct("<Q")
+# Slots examined for a key, starting at its home slot
+_PROBES = 8
+# Seqlock read attempts before treating a slot as a miss
+_READ_RETRIES = 100
+# Fill lock bytes live past the table at an offset taken from the key hash
+_FILL_LOCK_MASK = (1 << 62) - 1
+
+
+def default_shm_path() -> str:
+    """Return the per-user file backing the shared cache by default."""
+    directory = os.environ.get("XDG_RUNTIME_DIR")
+    if not directory:
+        directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(directory, f"sentinel-grants-{os.getuid()}")
+
+
+def _open_private(path: str) -> int:
+    """
+    Open or create `path` for reading and writing, refusing files others control.
+
+    The default directories are shared and sticky, so another user may have
+    created the file first: it must not be a symlink, must belong to this
+    user, and must not be accessible to anyone else.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    st = os.fstat(fd)
+    if not stat.S_ISREG(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        os.close(fd)
+        raise PermissionError(
+            f"Refusing to use {path}: it must be a regular file owned by this "
+            "user with mode 0600"
+        )
+    return fd
+
+
+def _hash_key(key: CacheKey) -> int:
+    digest = hashlib.blake2b(json.dumps(list(key)).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+class _FillLock:
+    """In-process lock for one key, dropped once nobody holds or awaits it."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+class SharedGrantCache:
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        slots: int = 1024,
+        slot_size: int = 1024,
+        safety_margin: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Grant cache shared by every process that opens the same file.
+
+        Implements the `get`/`put`/`invalidate`/`stats` interface of
+        `GrantCache`, so it can be passed to `SentinelClient(cache=...)`.
+        Create it before forking, or in each worker with the same `path`.
+        If the file already exists, its slot geometry is used.
+
+        Args:
+            path: Backing file (defaults to `default_shm_path()`); created with
+                mode 0600. An existing file must be owned by this user and not
+                accessible to others, or `PermissionError` is raised.
+            slots: Number of grants the table holds.
+            slot_size: Bytes per slot; grants that do not fit are not cached.
+            safety_margin: Seconds before `expires_at` at which a grant stops being served.
+            clock: Wall-clock source, overridable for tests.
+        """
+        if fcntl is None:  # pragma: no cover - Windows
+            raise OSError("SharedGrantCache requires POSIX file locking")
+        self.path = path or default_shm_path()
+        self.safety_margin = safety_margin
+        self._clock = clock
+        self._fd = _open_private(self.path)
+        with self._range_locked(0, _HEADER.size):
+            header = os.pread(self._fd, _HEADER.size, 0)
+            if len(header) == _HEADER.size and header[:8] == _MAGIC:
+                _, slots, slot_size = _HEADER.unpack(header)
+            else:
+                if slot_size <= _SLOT.size:
+                    raise ValueError(f"slot_size must exceed {_SLOT.size} bytes")
+                os.ftruncate(self._fd, _HEADER.size + slots * slot_size)
+                os.pwrite(self._fd, _HEADER.pack(_MAGIC, slots, slot_size), 0)
+        self.slots = slots
+        self.slot_size = slot_size
+        self._size = _HEADER.size + slots * slot_size
+        self._mm = mmap.mmap(self._fd, self._size)
+        # POSIX record locks do not exclude threads of the same process
+        self._lock = threading.Lock()
+        self._fill_locks: Dict[int, _FillLock] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: CacheKey) -> Optional[SecretPayload]:
+        """Return a still-valid grant for `key`, or None."""
+        key_hash = _hash_key(key)
+        now = self._clock()
+        for index in self._probe(key_hash):
+            entry = self._read(index)
+            if entry is None or entry[0] != key_hash or entry[1] <= now:
+                continue
+            try:
+                data = json.loads(entry[2])
+            except ValueError:
+                continue
+            if data["key"] == list(key):
+                self._hits += 1
+                return SecretPayload(**data["secret"])
+        self._misses += 1
+        return None
+
+    def put(self, key: CacheKey, secret: SecretPayload) -> None:
+        """Store a grant until shortly before it expires."""
+        expires_at = parse_expires_at(secret.expires_at)
+        if expires_at is None:
+            return
+        serve_until = expires_at - self.safety_margin
+        now = self._clock()
+        if serve_until <= now:
+            return
+        payload = json.dumps({"key": list(key), "secret": secret.model_dump()})
+        data = payload.encode()
+        if len(data) > self.slot_size - _SLOT.size:
+            return
+        key_hash = _hash_key(key)
+        index, evicting = self._victim(key_hash, now)
+        with self._lock, self._range_locked(self._offset(index), self.slot_size):
+            self._write(index, key_hash, serve_until, data)
+            self._evictions += evicting
+
+    def invalidate(self, resource_id: Optional[str] = None) -> None:
+        """Drop cached grants for `resource_id`, or every grant when omitted."""
+        for index in range(self.slots):
+            entry = self._read(index)
+            if entry is None or entry[0] == 0:
+                continue
+            if resource_id is not None:
+                try:
+                    if json.loads(entry[2])["key"][0] != resource_id:
+                        continue
+                except (ValueError, KeyError, IndexError):
+                    pass
+            with self._lock, self._range_locked(self._offset(index), self.slot_size):
+                self._write(index, 0, 0.0, b"")
+
+    @contextlib.contextmanager
+    def filling(self, key: CacheKey) -> Iterator[None]:
+        """
+        Hold the right to fetch `key` from the server, across processes.
+
+        Processes that miss on the same key queue here; once the holder has
+        stored the grant, the next one finds it with `get`. Different keys
+        never wait on each other, even when they share a home slot.
+        """
+        key_hash = _hash_key(key)
+        with self._lock:
+            local = self._fill_locks.setdefault(key_hash, _FillLock())
+            local.users += 1
+        try:
+            # One lock byte per key, past the end of the mapped table
+            offset = self._size + (key_hash & _FILL_LOCK_MASK)
+            with local.lock, self._range_locked(offset, 1):
+                yield
+        finally:
+            with self._lock:
+                local.users -= 1
+                if not local.users:
+                    del self._fill_locks[key_hash]
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hits, misses and evictions seen by this process; size of the shared table."""
+        now = self._clock()
+        size = 0
+        for index in range(self.slots):
+            entry = self._read(index)
+            size += entry is not None and entry[0] != 0 and entry[1] > now
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=size,
+        )
+
+    def close(self) -> None:
+        """Unmap the table. The backing file is left for other processes."""
+        self._mm.close()
+        os.close(self._fd)
+
+    def _offset(self, index: int) -> int:
+        return _HEADER.size + index * self.slot_size
+
+    def _probe(self, key_hash: int) -> List[int]:
+        home = key_hash % self.slots
+        return [(home + i) % self.slots for i in range(min(_PROBES, self.slots))]
+
+    def _read(self, index: int) -> Optional[Tuple[int, float, bytes]]:
+        offset = self._offset(index)
+        for _ in range(_READ_RETRIES):
+            seq, key_hash, serve_until, length = _SLOT.unpack_from(self._mm, offset)
+            if seq & 1:
+                continue  # a writer is mid-update
+            start = offset + _SLOT.size
+            payload = self._mm[start : start + min(length, self.slot_size - _SLOT.size)]
+            if _SEQ.unpack_from(self._mm, offset)[0] == seq:
+                return key_hash, serve_until, payload
+        return None
+
+    def _victim(self, key_hash: int, now: float) -> Tuple[int, bool]:
+        """Pick the slot to write: this key's, a free one, or the soonest to expire."""
+        candidates = []
+        for index in self._probe(key_hash):
+            entry = self._read(index)
+            if entry is None:
+                continue
+            if entry[0] == key_hash:
+                return index, False
+            if entry[0] == 0 or entry[1] <= now:
+                candidates.append((0.0, index))
+            else:
+                candidates.append((entry[1], index))
+        if not candidates:
+            return self._probe(key_hash)[0], True
+        serve_until, index = min(candidates)
+        return index, serve_until > 0
+
+    def _write(
+        self, index: int, key_hash: int, serve_until: float, payload: bytes
+    ) -> None:
+        offset = self._offset(index)
+        seq = _SEQ.unpack_from(self._mm, offset)[0]
+        _SEQ.pack_into(self._mm, offset, seq + 1)
+        _SLOT.pack_into(self._mm, offset, seq + 1, key_hash, serve_until, len(payload))
+        start = offset + _SLOT.size
+        self._mm[start : start + len(payload)] = payload
+        _SEQ.pack_into(self._mm, offset, seq + 2)
+
+    @contextlib.contextmanager
+    def _range_locked(self, start: int, length: int) -> Iterator[None]:
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, length, start)
+        try:
+            yield
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, length, start)
@@ -0,0 +1,82 @@
+import threading
+from concurrent.futures import CancelledError
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from . import futures
+
+T = TypeVar("T")
+
+
+@dataclass
+class FlightStats:
+    executed: int = 0
+    shared: int = 0
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = False
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls that share a key into a single execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive the same result or exception. Once
+    the call finishes the key is forgotten, so later calls run again. A
+    leader that is cancelled (raises `CancelledError`) only gives up its own
+    call: its waiters run the function again, one of them as the new leader.
+    A waiter running a `SecretFuture` stops waiting with `CancelledError` as
+    soon as that future is cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._finished = threading.Condition(self._lock)
+        self._calls: Dict[Hashable, _Call] = {}
+        self._stats = FlightStats()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        futures.on_cancel(self._wake_waiters)
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+                    self._stats.executed += 1
+                    break
+                self._stats.shared += 1
+                while not call.done:
+                    futures.raise_if_cancelled()
+                    self._finished.wait()
+            if isinstance(call.error, CancelledError):
+                continue  # the leader's own caller gave up, not this one
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                call.done = True
+                self._finished.notify_all()
+        return call.result
+
+    def _wake_waiters(self) -> None:
+        with self._lock:
+            self._finished.notify_all()
+
+    @property
+    def stats(self) -> FlightStats:
+        with self._lock:
+            return FlightStats(executed=self._stats.executed, shared=self._stats.shared)
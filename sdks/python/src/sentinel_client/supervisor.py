@@ -0,0 +1,211 @@
+"""Supervisor for `sentinel run --supervise`.
+
+Instead of exec'ing the command, the CLI stays behind as a small parent
+process. It revalidates the environment's secrets every few seconds with a
+conditional delta fetch, which costs a 304 while nothing changed. When a
+secret is rotated it either rewrites an env file and signals the child to
+reload it, or restarts the child with the new environment.
+"""
+
+import os
+import shlex
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .exceptions import SentinelError
+
+if TYPE_CHECKING:
+    from .client import SentinelClient
+
+ENV_FILE_ENV = "SENTINEL_ENV_FILE"
+
+RESTART = "restart"
+SIGNAL = "signal"
+
+
+@dataclass
+class SupervisorStats:
+    checks: int = 0
+    changes: int = 0
+    reloads: int = 0
+    restarts: int = 0
+    errors: int = 0
+
+
+def write_env_file(path: str, secrets: Dict[str, str]) -> None:
+    """Atomically write `secrets` as shell-quoted KEY=value lines, mode 0600."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".sentinel-env-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            for key, value in sorted(secrets.items()):
+                f.write(f"{key}={shlex.quote(value)}\n")
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class SecretSupervisor:
+    def __init__(
+        self,
+        client: "SentinelClient",
+        command: List[str],
+        environment: Optional[str] = None,
+        interval: float = 30.0,
+        on_change: str = RESTART,
+        env_file: Optional[str] = None,
+        reload_signal: int = signal.SIGHUP,
+        grace_period: float = 10.0,
+        base_env: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Run `command` with secrets in its environment and follow rotations.
+
+        Every `interval` seconds the secrets are revalidated with
+        `fetch_secrets(delta=True)`, so unchanged secrets are never
+        re-downloaded. On a change, `on_change="restart"` stops the child
+        (SIGTERM, then SIGKILL after `grace_period`) and starts it again
+        with the new values; `on_change="signal"` rewrites the env file and
+        sends `reload_signal` to the child, which should re-read the file
+        named by `$SENTINEL_ENV_FILE`.
+
+        Args:
+            client: Client used to fetch secrets.
+            command: Program and arguments to run.
+            environment: Environment to fetch secrets for (defaults to the client's).
+            interval: Seconds between revalidations.
+            on_change: "restart" or "signal".
+            env_file: Path of a dotenv file kept in sync with the secrets. In
+                "signal" mode a private temporary file is used when omitted.
+            reload_signal: Signal sent to the child in "signal" mode.
+            grace_period: Seconds a stopping child gets before SIGKILL.
+            base_env: Environment the secrets are layered over (defaults to `os.environ`).
+        """
+        if on_change not in (RESTART, SIGNAL):
+            raise ValueError(f"on_change must be {RESTART!r} or {SIGNAL!r}")
+        self._client = client
+        self.command = command
+        self.environment = environment
+        self.interval = interval
+        self.on_change = on_change
+        self.env_file = env_file
+        self.reload_signal = reload_signal
+        self.grace_period = grace_period
+        self._base_env = dict(os.environ if base_env is None else base_env)
+        self._owns_env_file = False
+        self._secrets: Dict[str, str] = {}
+        self._child: Optional[subprocess.Popen] = None
+        self._stopping: Optional[int] = None
+        self._lock = threading.Lock()
+        self._stats = SupervisorStats()
+
+    @property
+    def stats(self) -> SupervisorStats:
+        with self._lock:
+            return SupervisorStats(**vars(self._stats))
+
+    def run(self) -> int:
+        """
+        Start the child and supervise it until it exits.
+
+        SIGTERM and SIGINT received by the supervisor are forwarded to the
+        child. Raises `SentinelError` if the initial fetch fails.
+
+        Returns:
+            int: The child's exit status (negative if killed by a signal).
+        """
+        self._secrets = self._client.fetch_secrets(self.environment, delta=True)
+        if self.env_file is None and self.on_change == SIGNAL:
+            fd, self.env_file = tempfile.mkstemp(prefix="sentinel-env-")
+            os.close(fd)
+            self._owns_env_file = True
+        if self.env_file is not None:
+            write_env_file(self.env_file, self._secrets)
+        previous = self._forward_signals()
+        try:
+            self._start()
+            while True:
+                try:
+                    return self._child.wait(
+                        None if self._stopping is not None else self.interval
+                    )
+                except subprocess.TimeoutExpired:
+                    self.check()
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+            if self._child is not None and self._child.poll() is None:
+                self._terminate(self._child)
+            if self._owns_env_file:
+                os.unlink(self.env_file)
+
+    def check(self) -> bool:
+        """Revalidate the secrets now and apply any change; True if they changed."""
+        with self._lock:
+            self._stats.checks += 1
+        try:
+            secrets = self._client.fetch_secrets(self.environment, delta=True)
+        except SentinelError as e:
+            # keep the child running on the old values and try again next tick
+            with self._lock:
+                self._stats.errors += 1
+            print(f"Warning: secret check failed: {e}", file=sys.stderr)
+            return False
+        if secrets == self._secrets:
+            return False
+        self._secrets = secrets
+        with self._lock:
+            self._stats.changes += 1
+        if self.env_file is not None:
+            write_env_file(self.env_file, secrets)
+        if self.on_change == SIGNAL:
+            print("Secrets changed; signalling child to reload.", file=sys.stderr)
+            self._child.send_signal(self.reload_signal)
+            with self._lock:
+                self._stats.reloads += 1
+        else:
+            print("Secrets changed; restarting child.", file=sys.stderr)
+            self._terminate(self._child)
+            self._start()
+            with self._lock:
+                self._stats.restarts += 1
+        return True
+
+    def stop(self, signum: int = signal.SIGTERM) -> None:
+        """Ask the child to exit with `signum`; `run()` then returns its status."""
+        self._stopping = signum
+        child = self._child
+        if child is not None and child.poll() is None:
+            child.send_signal(signum)
+
+    def _start(self) -> None:
+        if self._stopping is not None:
+            return  # stopped mid-restart: let run() return the old status
+        env = dict(self._base_env)
+        env.update(self._secrets)
+        if self.env_file is not None:
+            env[ENV_FILE_ENV] = os.path.abspath(self.env_file)
+        self._child = subprocess.Popen(self.command, env=env)
+
+    def _terminate(self, child: subprocess.Popen) -> None:
+        child.terminate()
+        try:
+            child.wait(self.grace_period)
+        except subprocess.TimeoutExpired:
+            child.kill()
+            child.wait()
+
+    def _forward_signals(self) -> Dict[int, Any]:
+        """Forward SIGTERM/SIGINT to the child; only possible on the main thread."""
+        if threading.current_thread() is not threading.main_thread():
+            return {}
+        previous = {}
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            previous[signum] = signal.signal(signum, lambda s, _: self.stop(s))
+        return previous
@@ -37,3 +37,21 @@ class AccessResponse(BaseModel):
     message: Optional[str] = None
     polling_url: Optional[str] = None
     reason: Optional[str] = None
+
+
+class SecretOutcome(str, Enum):
+    GRANTED = "GRANTED"
+    DENIED = "DENIED"
+    TIMED_OUT = "TIMED_OUT"
+    ERROR = "ERROR"
+
+
+class SecretResult(BaseModel):
+    resource_id: str
+    outcome: SecretOutcome
+    secret: Optional[SecretPayload] = None
+    error: Optional[str] = None
+
+    @property
+    def granted(self) -> bool:
+        return self.outcome == SecretOutcome.GRANTED
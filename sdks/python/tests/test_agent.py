@@ -0,0 +1,296 @@
+import json
+import os
+import tempfile
+import threading
+import time
+
+import httpx
+import pytest
+
+from sentinel_client import SentinelClient, AccessIntent
+from sentinel_client.agent import (
+    SentinelAgent,
+    default_agent_socket,
+    find_agent_socket,
+)
+from sentinel_client.exceptions import SentinelAuthError, SentinelDeniedError
+
+
+@pytest.fixture
+def intent():
+    return AccessIntent(
+        summary="Test Access", description="Testing the SDK", task_id="task-123"
+    )
+
+
+class Upstream:
+    """Scripted upstream server that records every request it receives."""
+
+    def __init__(self):
+        self.calls = []
+        self.polls_until_approved = 2
+        self.poll_errors = []  # responses served before the scripted polls
+        self.hold_posts = None  # an Event that POSTs wait for, if set
+
+    def __call__(self, request):
+        self.calls.append((request.method, request.url.path))
+        if request.method == "POST":
+            resource_id = json.loads(request.content)["resource_id"]
+            if resource_id.startswith("prod"):
+                return httpx.Response(
+                    202, json={"request_id": "req_prod", "status": "PENDING_APPROVAL"}
+                )
+            if resource_id.startswith("forbidden"):
+                return httpx.Response(
+                    403,
+                    json={"request_id": "r", "status": "DENIED", "reason": "Blocked"},
+                )
+            if self.hold_posts is not None:
+                self.hold_posts.wait(5)
+            time.sleep(0.05)  # give concurrent callers time to pile up
+            return httpx.Response(200, json=_approved("req_dev"))
+        if request.url.path == "/v1/access/requests/req_prod":
+            if self.poll_errors:
+                return self.poll_errors.pop(0)
+            self.polls_until_approved -= 1
+            if self.polls_until_approved > 0:
+                return httpx.Response(
+                    200, json={"request_id": "req_prod", "status": "PENDING_APPROVAL"}
+                )
+            return httpx.Response(200, json=_approved("req_prod"))
+        return httpx.Response(200, json=["dev-db"])
+
+
+def _approved(request_id):
+    return {
+        "request_id": request_id,
+        "status": "APPROVED",
+        "secret": {
+            "type": "managed_secret",
+            "value": f"value-{request_id}",
+            "expires_at": "2099-01-01T00:00:00.000Z",
+        },
+    }
+
+
+@pytest.fixture
+def upstream():
+    return Upstream()
+
+
+@pytest.fixture
+def agent(tmp_path, upstream, monkeypatch):
+    socket_path = str(tmp_path / "agent.sock")
+    monkeypatch.setenv("SENTINEL_AGENT_SOCKET", socket_path)
+    upstream_client = SentinelClient(
+        base_url="http://upstream",
+        api_token="test-token",
+        agent_id="sidecar",
+        prefer_agent=False,
+    )
+    upstream_client._http = httpx.Client(transport=httpx.MockTransport(upstream))
+    agent = SentinelAgent(upstream_client, socket_path=socket_path, poll_interval=0.01)
+    thread = threading.Thread(target=agent.serve_forever, daemon=True)
+    thread.start()
+    while find_agent_socket("http://upstream") is None:
+        time.sleep(0.01)
+    yield agent
+    agent.shutdown()
+    thread.join()
+
+
+def _client(token="test-token"):
+    return SentinelClient(
+        base_url="http://upstream", api_token=token, agent_id="test-agent"
+    )
+
+
+def test_client_prefers_running_agent(agent):
+    with _client() as client:
+        assert client.uds == agent.socket_path
+
+
+def test_client_ignores_agent_for_another_server(agent):
+    with SentinelClient(
+        base_url="http://other-server", api_token="test-token", agent_id="test-agent"
+    ) as client:
+        assert client.uds is None
+
+
+def test_agent_socket_of_another_user_is_ignored(agent, monkeypatch):
+    uid = os.getuid()
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+    assert find_agent_socket("http://upstream") is None
+
+
+def test_agent_socket_in_shared_directory_is_ignored(agent):
+    directory = os.path.dirname(agent.socket_path)
+    os.chmod(directory, 0o777)
+    try:
+        assert find_agent_socket("http://upstream") is None
+    finally:
+        os.chmod(directory, 0o700)
+
+
+def test_default_socket_is_not_in_temp_dir(monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    assert not default_agent_socket().startswith(tempfile.gettempdir())
+
+
+def test_agent_caches_approved_grants(agent, upstream, intent):
+    with _client() as client:
+        first = client.request_secret("dev-db", intent)
+        second = client.request_secret("dev-db", intent)
+
+    assert first.value == second.value == "value-req_dev"
+    assert upstream.calls == [("POST", "/v1/access/request")]
+
+
+def test_agent_collapses_concurrent_requests(agent, upstream, intent):
+    results = []
+
+    def worker():
+        with _client() as client:
+            results.append(client.request_secret("dev-db", intent).value)
+
+    threads = [threading.Thread(target=worker) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["value-req_dev"] * 10
+    assert upstream.calls == [("POST", "/v1/access/request")]
+
+
+def test_agent_polls_pending_approval_once(agent, upstream, intent):
+    results = []
+
+    def worker():
+        with _client() as client:
+            secret = client.request_secret("prod-db", intent, polling_interval=0.01)
+            results.append(secret.value)
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == ["value-req_prod"] * 5
+    posts = [c for c in upstream.calls if c[0] == "POST"]
+    polls = [c for c in upstream.calls if c[0] == "GET"]
+    assert len(posts) == 1
+    assert len(polls) == 2
+
+
+def test_agent_passes_through_denials_and_reads(agent, upstream, intent):
+    with _client() as client:
+        with pytest.raises(SentinelDeniedError, match="Blocked"):
+            client.request_secret("forbidden-db", intent)
+        assert client.list_resources() == ["dev-db"]
+
+
+def test_agent_rejects_unknown_token(agent, intent):
+    with _client(token="other-token") as client:
+        with pytest.raises(SentinelAuthError):
+            client.request_secret("dev-db", intent)
+
+
+def test_agent_rechecks_cache_after_leader_retires(agent, upstream, intent):
+    with _client() as client:
+        client.request_secret("dev-db", intent)
+        # A miss taken just before the previous leader cached its grant and retired
+        real_get = agent.cache.get
+        stale = [True]
+
+        def get(key):
+            if stale:
+                stale.pop()
+                return None
+            return real_get(key)
+
+        agent.cache.get = get
+        assert client.request_secret("dev-db", intent).value == "value-req_dev"
+
+    assert upstream.calls == [("POST", "/v1/access/request")]
+
+
+def test_agent_accepts_bursts_of_local_connections(agent, intent):
+    with _client() as client:
+        client.request_secret("dev-db", intent)  # cached from now on
+    count = 32
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def worker():
+        with _client() as client:
+            barrier.wait()
+            try:
+                client.request_secret("dev-db", intent)
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+
+
+def test_agent_retries_throttled_polls(agent, upstream, intent):
+    upstream.poll_errors = [
+        httpx.Response(503, headers={"Retry-After": "0"}),
+        httpx.Response(429),
+    ]
+    with _client() as client:
+        secret = client.request_secret(
+            "prod-db", intent, polling_interval=0.01, polling_timeout=2
+        )
+
+    assert secret.value == "value-req_prod"
+    assert [c[0] for c in upstream.calls] == ["POST"] + ["GET"] * 4
+
+
+def test_agent_hands_back_polling_after_malformed_response(agent, upstream, intent):
+    upstream.poll_errors = [httpx.Response(200, text="<html>")]
+    with _client() as client:
+        secret = client.request_secret(
+            "prod-db", intent, polling_interval=0.01, polling_timeout=2
+        )
+        assert secret.value == "value-req_prod"
+        # the request is no longer in flight, so a new one goes upstream
+        upstream.polls_until_approved = 1
+        client.request_secret("prod-db", intent, polling_interval=0.01)
+
+    assert [c for c in upstream.calls if c[0] == "POST"] == [
+        ("POST", "/v1/access/request")
+    ] * 2
+
+
+def test_agent_does_not_share_requests_across_intents(agent, upstream, intent):
+    upstream.hold_posts = threading.Event()
+    other = AccessIntent(summary="Other", description="Another task", task_id="t-2")
+
+    def posts():
+        return [c for c in upstream.calls if c[0] == "POST"]
+
+    def worker(worker_intent):
+        with _client() as client:
+            client.request_secret("dev-db", worker_intent)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in (intent, other)]
+    threads[0].start()
+    while not posts():
+        time.sleep(0.01)
+    threads[1].start()
+    deadline = time.monotonic() + 2
+    while len(posts()) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    upstream.hold_posts.set()
+    for t in threads:
+        t.join()
+
+    assert len(posts()) == 2
@@ -0,0 +1,144 @@
+import asyncio
+import json
+
+import pytest
+import respx
+from httpx import Response
+
+from sentinel_client import AsyncSentinelClient, AccessIntent
+from sentinel_client.exceptions import (
+    SentinelAuthError,
+    SentinelDeniedError,
+    SentinelTimeoutError,
+)
+
+
+@pytest.fixture
+def intent():
+    return AccessIntent(
+        summary="Test Access", description="Testing the SDK", task_id="task-123"
+    )
+
+
+def _approved(request_id="req_123", value="super_secret_value"):
+    return {
+        "request_id": request_id,
+        "status": "APPROVED",
+        "secret": {
+            "type": "managed_secret",
+            "value": value,
+            "expires_at": "2024-01-01T00:00:00Z",
+        },
+    }
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_request_secret_approved(intent):
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(200, json=_approved())
+    )
+
+    async with AsyncSentinelClient(
+        base_url="http://test-server", api_token="test-token", agent_id="test-agent"
+    ) as client:
+        secret = await client.request_secret("resource-1", intent)
+
+    assert secret.value == "super_secret_value"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_request_secret_denied(intent):
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(
+            403, json={"request_id": "req_1", "status": "DENIED", "reason": "Nope"}
+        )
+    )
+
+    async with AsyncSentinelClient(
+        base_url="http://test-server", api_token="test-token", agent_id="test-agent"
+    ) as client:
+        with pytest.raises(SentinelDeniedError, match="Nope"):
+            await client.request_secret("forbidden", intent)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_concurrent_pending_approvals(intent):
+    respx.post("http://test-server/v1/access/request").mock(
+        side_effect=lambda request: Response(
+            202,
+            json={
+                "request_id": "req_" + json.loads(request.content)["resource_id"],
+                "status": "PENDING_APPROVAL",
+            },
+        )
+    )
+    polls = {}
+
+    def poll(request, request_id):
+        polls[request_id] = polls.get(request_id, 0) + 1
+        if polls[request_id] < 2:
+            return Response(
+                200, json={"request_id": request_id, "status": "PENDING_APPROVAL"}
+            )
+        return Response(200, json=_approved(request_id, value=request_id))
+
+    respx.get(
+        url__regex=r"http://test-server/v1/access/requests/(?P<request_id>\w+)"
+    ).mock(side_effect=poll)
+
+    async with AsyncSentinelClient(
+        base_url="http://test-server", api_token="test-token", agent_id="test-agent"
+    ) as client:
+        secrets = await asyncio.gather(
+            *(
+                client.request_secret(str(n), intent, polling_interval=0.01)
+                for n in range(1, 51)
+            )
+        )
+
+    assert [s.value for s in secrets] == [f"req_{n}" for n in range(1, 51)]
+    assert all(count == 2 for count in polls.values())
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_polling_timeout(intent):
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(
+            202, json={"request_id": "req_timeout", "status": "PENDING_APPROVAL"}
+        )
+    )
+    respx.get("http://test-server/v1/access/requests/req_timeout").mock(
+        return_value=Response(
+            200, json={"request_id": "req_timeout", "status": "PENDING_APPROVAL"}
+        )
+    )
+
+    async with AsyncSentinelClient(
+        base_url="http://test-server", api_token="test-token", agent_id="test-agent"
+    ) as client:
+        with pytest.raises(SentinelTimeoutError):
+            await client.request_secret(
+                "prod-db", intent, polling_interval=0.01, polling_timeout=0.05
+            )
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_fetch_and_list():
+    respx.get("http://test-server/v1/secrets").mock(
+        return_value=Response(200, json={"resource-1": "value-1"})
+    )
+    respx.get("http://test-server/v1/resources").mock(
+        return_value=Response(401, json={"error": "Unauthorized"})
+    )
+
+    async with AsyncSentinelClient(
+        base_url="http://test-server", api_token="test-token", agent_id="test-agent"
+    ) as client:
+        assert await client.fetch_secrets() == {"resource-1": "value-1"}
+        with pytest.raises(SentinelAuthError):
+            await client.list_resources()
@@ -0,0 +1,259 @@
+import json
+import threading
+import time
+
+import pytest
+import respx
+from httpx import Response
+
+from sentinel_client import (
+    AccessIntent,
+    AccessRequest,
+    SentinelClient,
+    SentinelDeniedError,
+    SentinelError,
+)
+
+INTENT = AccessIntent(summary="s", description="d", task_id="t")
+
+
+def _secret(resource_id):
+    return {
+        "type": "managed_secret",
+        "value": f"value-{resource_id}",
+        "expires_at": "2099-01-01T00:00:00Z",
+    }
+
+
+def _respond_batch(request):
+    responses = []
+    for n, item in enumerate(json.loads(request.content)["requests"]):
+        resource_id = item["resource_id"]
+        if resource_id.startswith("forbidden"):
+            responses.append(
+                {"request_id": f"r{n}", "status": "DENIED", "reason": "No"}
+            )
+        elif resource_id.startswith("prod"):
+            responses.append({"request_id": "req_prod", "status": "PENDING_APPROVAL"})
+        else:
+            responses.append(
+                {
+                    "request_id": f"r{n}",
+                    "status": "APPROVED",
+                    "secret": _secret(resource_id),
+                }
+            )
+    return Response(200, json={"responses": responses})
+
+
+def _client(**kwargs):
+    return SentinelClient(
+        base_url="http://test-server",
+        api_token="t",
+        agent_id="a",
+        prefer_agent=False,
+        **kwargs,
+    )
+
+
+def _burst(client, resource_ids, intent=INTENT):
+    """Call request_secret for every resource at once; return values or errors."""
+    results = {}
+    barrier = threading.Barrier(len(resource_ids))
+
+    def call(resource_id):
+        barrier.wait()
+        try:
+            results[resource_id] = client.request_secret(
+                resource_id, intent, polling_interval=0.01
+            ).value
+        except Exception as e:
+            results[resource_id] = e
+
+    threads = [threading.Thread(target=call, args=(r,)) for r in resource_ids]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+@respx.mock
+def test_concurrent_requests_share_one_batch():
+    route = respx.post("http://test-server/v1/access/requests/batch").mock(
+        side_effect=_respond_batch
+    )
+    respx.get("http://test-server/v1/access/requests/req_prod").mock(
+        return_value=Response(
+            200,
+            json={
+                "request_id": "req_prod",
+                "status": "APPROVED",
+                "secret": _secret("prod"),
+            },
+        )
+    )
+
+    with _client(batch_window=0.2) as client:
+        results = _burst(client, ["db", "cache", "prod-db", "forbidden-key"])
+        stats = client.batcher.stats
+
+    assert route.call_count == 1
+    sent = json.loads(route.calls[0].request.content)["requests"]
+    assert sorted(item["resource_id"] for item in sent) == [
+        "cache",
+        "db",
+        "forbidden-key",
+        "prod-db",
+    ]
+    assert results["db"] == "value-db"
+    assert results["cache"] == "value-cache"
+    assert results["prod-db"] == "value-prod"
+    assert isinstance(results["forbidden-key"], SentinelDeniedError)
+    assert stats.batches == 1
+    assert stats.items == 4
+    assert stats.mean_batch_size == 4
+    assert 0 < stats.max_queue_delay <= 0.5
+
+
+@respx.mock
+def test_full_batches_are_sent_before_the_window_closes():
+    route = respx.post("http://test-server/v1/access/requests/batch").mock(
+        side_effect=_respond_batch
+    )
+
+    with _client(batch_window=5.0, max_batch_size=2) as client:
+        results = _burst(client, ["a", "b", "c", "d"])
+        stats = client.batcher.stats
+
+    assert route.call_count == 2
+    assert all(value.startswith("value-") for value in results.values())
+    assert stats.max_batch_size == 2
+    assert stats.max_queue_delay < 5.0
+
+
+@respx.mock
+def test_requests_with_different_intents_are_not_batched_together():
+    route = respx.post("http://test-server/v1/access/requests/batch").mock(
+        side_effect=_respond_batch
+    )
+    other = AccessIntent(summary="other", description="d", task_id="t2")
+
+    with _client(batch_window=0.05) as client:
+        client.request_secret("db", INTENT)
+        client.request_secret("db", other)
+
+    intents = [json.loads(c.request.content)["intent"] for c in route.calls]
+    assert intents == [INTENT.model_dump(), other.model_dump()]
+
+
+@respx.mock
+def test_falls_back_to_single_requests_without_batch_endpoint():
+    batch = respx.post("http://test-server/v1/access/requests/batch").mock(
+        return_value=Response(404, json={"error": "Not Found"})
+    )
+    single = respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(
+            200,
+            json={"request_id": "r", "status": "APPROVED", "secret": _secret("db")},
+        )
+    )
+
+    with _client(batch_window=0.01) as client:
+        assert client.request_secret("db", INTENT).value == "value-db"
+        assert client.request_secret("other", INTENT).value == "value-db"
+        stats = client.batcher.stats
+
+    assert batch.call_count == 1
+    assert single.call_count == 2
+    assert stats.fallbacks == 2
+
+
+def test_batching_is_off_by_default():
+    with _client() as client:
+        assert client.batcher is None
+
+
+def test_shutdown_fails_queued_requests():
+    with _client(batch_window=60.0) as client:
+        future = client.batcher.submit(
+            AccessRequest(agent_id="a", resource_id="db", intent=INTENT, ttl_seconds=60)
+        )
+    with pytest.raises(SentinelError, match="shut down"):
+        future.result(timeout=1)
+
+
+@respx.mock
+def test_malformed_batch_response_fails_callers_and_batcher_recovers():
+    route = respx.post("http://test-server/v1/access/requests/batch").mock(
+        return_value=Response(200, json=["not", "an", "object"])
+    )
+    with _client(batch_window=0.001) as client:
+        with pytest.raises(SentinelError, match="Unexpected error"):
+            client.request_secret("db", INTENT)
+        route.mock(side_effect=_respond_batch)
+        assert client.request_secret("db", INTENT).value == "value-db"
+
+
+def test_wait_on_batcher_is_bounded(monkeypatch):
+    stuck = threading.Event()
+    with _client(batch_window=0.001, timeout=0.2) as client:
+        monkeypatch.setattr(client.batcher, "_send", lambda items: stuck.wait(5))
+        with pytest.raises(SentinelError, match="timed out"):
+            client.request_secret("db", INTENT)
+        stuck.set()
+
+
+@respx.mock
+def test_batches_of_a_burst_are_sent_concurrently():
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def slow(request):
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        time.sleep(0.1)
+        with lock:
+            running.pop()
+        return _respond_batch(request)
+
+    route = respx.post("http://test-server/v1/access/requests/batch").mock(
+        side_effect=slow
+    )
+    with _client(batch_window=0.05, max_batch_size=2) as client:
+        results = _burst(client, [f"db-{n}" for n in range(8)])
+
+    assert results == {f"db-{n}": f"value-db-{n}" for n in range(8)}
+    assert route.call_count == 4
+    assert max(peak) > 1
+
+
+@respx.mock
+def test_request_is_not_sent_after_its_caller_timed_out():
+    sending = threading.Event()
+    release = threading.Event()
+
+    def held(request):
+        sending.set()
+        release.wait(5)
+        return _respond_batch(request)
+
+    route = respx.post("http://test-server/v1/access/requests/batch").mock(
+        side_effect=held
+    )
+    with _client(batch_window=0.001, timeout=0.2) as client:
+        client.batcher.max_concurrent_batches = 1
+        first = threading.Thread(target=_burst, args=(client, ["db-1"]))
+        first.start()
+        assert sending.wait(2)
+        # queued behind the held batch until this caller gives up
+        with pytest.raises(SentinelError, match="timed out"):
+            client.request_secret("db-2", INTENT)
+        release.set()
+        first.join()
+        time.sleep(0.1)  # room for a late send before shutdown
+
+    sent = [json.loads(c.request.content)["requests"] for c in route.calls]
+    assert sent == [[{"resource_id": "db-1", "ttl_seconds": 3600}]]
@@ -0,0 +1,131 @@
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+import respx
+from httpx import Response
+
+from sentinel_client import SentinelClient
+from sentinel_client.bench import percentile, run_benchmark, summarize
+from sentinel_client.cli import main
+
+APPROVED = {
+    "request_id": "r",
+    "status": "APPROVED",
+    "secret": {
+        "type": "managed_secret",
+        "value": "v",
+        "expires_at": "2099-01-01T00:00:00Z",
+    },
+}
+
+
+@pytest.fixture
+def client():
+    with SentinelClient(
+        base_url="http://test-server",
+        api_token="t",
+        agent_id="a",
+        prefer_agent=False,
+        single_flight=False,
+    ) as client:
+        yield client
+
+
+def test_percentiles_and_histogram():
+    samples = [n / 1000 for n in range(1, 101)]  # 1ms .. 100ms
+    report = summarize("request", samples, {"SentinelNetworkError": 5}, 2.0)
+
+    assert percentile(sorted(samples), 0.5) == 0.05
+    assert report.latency_ms["p50"] == pytest.approx(50)
+    assert report.latency_ms["p90"] == pytest.approx(90)
+    assert report.latency_ms["p99"] == pytest.approx(99)
+    assert report.latency_ms["max"] == pytest.approx(100)
+    assert report.requests == 105
+    assert report.throughput == 52.5
+    assert report.histogram["<=1ms"] == 1
+    assert report.histogram["<=100ms"] == 50
+    assert report.histogram[">5000ms"] == 0
+    assert sum(report.histogram.values()) == 100
+
+
+@respx.mock
+def test_run_benchmark_drives_each_operation(client):
+    respx.post("http://test-server/v1/access/request").mock(
+        side_effect=lambda request: (
+            Response(202, json={"request_id": "req_p", "status": "PENDING_APPROVAL"})
+            if json.loads(request.content)["resource_id"] == "prod-bench"
+            else Response(200, json=APPROVED)
+        )
+    )
+    secrets = respx.get("http://test-server/v1/secrets").mock(
+        return_value=Response(200, json={"A": "1"}, headers={"ETag": '"v1"'})
+    )
+    respx.get("http://test-server/v1/resources").mock(
+        return_value=Response(503, json={"error": "down"})
+    )
+    poll = respx.get("http://test-server/v1/access/requests/req_p").mock(
+        return_value=Response(
+            200, json={"request_id": "req_p", "status": "PENDING_APPROVAL"}
+        )
+    )
+
+    reports = run_benchmark(
+        client,
+        ["request", "fetch", "revalidate", "list", "poll"],
+        concurrency=2,
+        duration=0.1,
+        warmup=0.0,
+    )
+
+    assert [r.operation for r in reports] == [
+        "request",
+        "fetch",
+        "revalidate",
+        "list",
+        "poll",
+    ]
+    request, fetch, revalidate, listing, polls = reports
+    assert request.requests > 0 and not request.errors
+    assert fetch.latency_ms["p99"] >= fetch.latency_ms["p50"]
+    conditional = ["If-None-Match" in c.request.headers for c in secrets.calls]
+    # every fetch is a full one; revalidate sends the ETag once it has a snapshot
+    assert not any(conditional[: fetch.requests])
+    assert len(conditional) == fetch.requests + revalidate.requests
+    assert sum(conditional) >= revalidate.requests - 2
+    assert listing.errors == {"SentinelError": listing.requests}
+    assert listing.latency_ms == {}
+    assert polls.requests == poll.call_count
+
+
+@respx.mock
+def test_bench_command_prints_json(capsys):
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(200, json=APPROVED)
+    )
+    argv = ["sentinel", "--token", "t", "--url", "http://test-server", "bench"]
+    argv += ["-c", "2", "-d", "0.1", "--warmup", "0", "--format", "json"]
+    with patch.object(sys, "argv", argv):
+        main()
+
+    result = json.loads(capsys.readouterr().out)
+    assert result["concurrency"] == 2
+    (report,) = result["operations"]
+    assert report["operation"] == "request"
+    assert set(report["latency_ms"]) == {"p50", "p90", "p99", "max", "mean"}
+    assert report["errors"] == {}
+
+
+@respx.mock
+def test_bench_poll_requires_a_pending_resource(capsys):
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(200, json=APPROVED)
+    )
+    argv = ["sentinel", "--token", "t", "--url", "http://test-server", "bench"]
+    with patch.object(sys, "argv", argv + ["-o", "poll", "-d", "0.1"]):
+        with pytest.raises(SystemExit) as e:
+            main()
+
+    assert e.value.code == 1
+    assert "does not require approval" in capsys.readouterr().err
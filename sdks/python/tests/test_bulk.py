@@ -0,0 +1,233 @@
+import json
+import threading
+import time
+
+import pytest
+import respx
+from httpx import Response
+
+from sentinel_client import AccessIntent, SecretOutcome, SentinelClient
+
+
+@pytest.fixture
+def intent():
+    return AccessIntent(summary="s", description="d", task_id="t")
+
+
+@pytest.fixture
+def client():
+    with SentinelClient(
+        base_url="http://test-server",
+        api_token="t",
+        agent_id="a",
+        prefer_agent=False,
+    ) as client:
+        yield client
+
+
+def _respond(request):
+    resource_id = json.loads(request.content)["resource_id"]
+    if resource_id.startswith("forbidden"):
+        return Response(
+            403, json={"request_id": "r", "status": "DENIED", "reason": "No"}
+        )
+    if resource_id.startswith("prod"):
+        return Response(
+            202, json={"request_id": "req_prod", "status": "PENDING_APPROVAL"}
+        )
+    if resource_id.startswith("broken"):
+        return Response(500, json={"error": "boom"})
+    time.sleep(0.1)
+    return Response(
+        200,
+        json={
+            "request_id": "r",
+            "status": "APPROVED",
+            "secret": {
+                "type": "managed_secret",
+                "value": f"value-{resource_id}",
+                "expires_at": "2099-01-01T00:00:00Z",
+            },
+        },
+    )
+
+
+@respx.mock
+def test_request_secrets_reports_each_outcome(client, intent):
+    respx.post("http://test-server/v1/access/request").mock(side_effect=_respond)
+    respx.get("http://test-server/v1/access/requests/req_prod").mock(
+        return_value=Response(
+            200, json={"request_id": "req_prod", "status": "PENDING_APPROVAL"}
+        )
+    )
+
+    results = client.request_secrets(
+        ["db", "forbidden-key", "prod-db", "broken", "db"],
+        intent,
+        polling_interval=0.01,
+        polling_timeout=0.05,
+    )
+
+    assert list(results) == ["db", "forbidden-key", "prod-db", "broken"]
+    assert results["db"].granted
+    assert results["db"].secret.value == "value-db"
+    assert results["forbidden-key"].outcome == SecretOutcome.DENIED
+    assert results["prod-db"].outcome == SecretOutcome.TIMED_OUT
+    assert results["broken"].outcome == SecretOutcome.ERROR
+    assert results["broken"].secret is None
+
+
+@respx.mock
+def test_request_secrets_runs_concurrently_within_limit(client, intent):
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def respond(request):
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        try:
+            return _respond(request)
+        finally:
+            with lock:
+                in_flight.pop()
+
+    respx.post("http://test-server/v1/access/request").mock(side_effect=respond)
+
+    start = time.monotonic()
+    results = client.request_secrets(
+        [f"db-{n}" for n in range(8)], intent, max_concurrency=4
+    )
+
+    assert all(r.granted for r in results.values())
+    assert max(peak) == 4
+    assert time.monotonic() - start < 0.1 * 8 / 2
+
+
+def _respond_batch(request):
+    body = json.loads(request.content)
+    responses = []
+    for n, item in enumerate(body["requests"]):
+        resource_id = item["resource_id"]
+        if resource_id.startswith("forbidden"):
+            responses.append(
+                {"request_id": f"r{n}", "status": "DENIED", "reason": "No"}
+            )
+        elif resource_id.startswith("prod"):
+            responses.append({"request_id": "req_prod", "status": "PENDING_APPROVAL"})
+        else:
+            responses.append(
+                {
+                    "request_id": f"r{n}",
+                    "status": "APPROVED",
+                    "secret": {
+                        "type": "managed_secret",
+                        "value": f"value-{resource_id}",
+                        "expires_at": "2099-01-01T00:00:00Z",
+                    },
+                }
+            )
+    return Response(200, json={"responses": responses})
+
+
+@respx.mock
+def test_request_secrets_batch_uses_one_request_per_chunk(client, intent):
+    route = respx.post("http://test-server/v1/access/requests/batch").mock(
+        side_effect=_respond_batch
+    )
+    respx.get("http://test-server/v1/access/requests/req_prod").mock(
+        return_value=Response(
+            200,
+            json={
+                "request_id": "req_prod",
+                "status": "APPROVED",
+                "secret": {
+                    "type": "managed_secret",
+                    "value": "value-prod",
+                    "expires_at": "2099-01-01T00:00:00Z",
+                },
+            },
+        )
+    )
+
+    results = client.request_secrets_batch(
+        ["db", "forbidden-key", "prod-db", "cache", "db"],
+        intent,
+        polling_interval=0.01,
+        batch_size=2,
+    )
+
+    assert route.call_count == 2
+    sent = [json.loads(call.request.content) for call in route.calls]
+    assert [[r["resource_id"] for r in b["requests"]] for b in sent] == [
+        ["db", "forbidden-key"],
+        ["prod-db", "cache"],
+    ]
+    assert sent[0]["intent"] == intent.model_dump()
+    assert list(results) == ["db", "forbidden-key", "prod-db", "cache"]
+    assert results["db"].secret.value == "value-db"
+    assert results["forbidden-key"].outcome == SecretOutcome.DENIED
+    assert results["prod-db"].secret.value == "value-prod"
+    assert results["cache"].granted
+
+
+@respx.mock
+def test_request_secrets_batch_serves_cached_grants(intent):
+    from sentinel_client import GrantCache
+
+    with SentinelClient(
+        base_url="http://test-server",
+        api_token="t",
+        agent_id="a",
+        prefer_agent=False,
+        cache=GrantCache(),
+    ) as client:
+        route = respx.post("http://test-server/v1/access/requests/batch").mock(
+            side_effect=_respond_batch
+        )
+        client.request_secrets_batch(["db", "cache"], intent)
+        results = client.request_secrets_batch(["db", "cache", "other"], intent)
+        assert client.request_secret("db", intent).value == "value-db"
+
+    assert route.call_count == 2
+    assert json.loads(route.calls[1].request.content)["requests"] == [
+        {"resource_id": "other", "ttl_seconds": 3600}
+    ]
+    assert all(r.granted for r in results.values())
+
+
+@respx.mock
+def test_request_secrets_batch_falls_back_without_endpoint(client, intent):
+    respx.post("http://test-server/v1/access/requests/batch").mock(
+        return_value=Response(404, json={"error": "Not Found"})
+    )
+    single = respx.post("http://test-server/v1/access/request").mock(
+        side_effect=_respond
+    )
+
+    results = client.request_secrets_batch(["db", "forbidden-key"], intent)
+
+    assert single.call_count == 2
+    assert results["db"].granted
+    assert results["forbidden-key"].outcome == SecretOutcome.DENIED
+
+
+@respx.mock
+def test_request_secrets_batch_isolates_malformed_responses(client, intent):
+    route = respx.post("http://test-server/v1/access/requests/batch").mock(
+        return_value=Response(200, json=["not", "an", "object"])
+    )
+    results = client.request_secrets_batch(["db", "cache"], intent, batch_size=1)
+    assert {r.outcome for r in results.values()} == {SecretOutcome.ERROR}
+
+    route.mock(side_effect=_respond_batch)
+    respx.get("http://test-server/v1/access/requests/req_prod").mock(
+        return_value=Response(200, text="<html>oops</html>")
+    )
+    results = client.request_secrets_batch(
+        ["db", "prod-db"], intent, polling_interval=0.01
+    )
+    assert results["db"].granted
+    assert results["prod-db"].outcome == SecretOutcome.ERROR
+    assert "Unexpected error" in results["prod-db"].error
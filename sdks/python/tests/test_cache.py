@@ -0,0 +1,144 @@
+import pytest
+import respx
+from httpx import Response
+
+from sentinel_client import (
+    AccessIntent,
+    DenialCache,
+    GrantCache,
+    SecretPayload,
+    SentinelClient,
+)
+from sentinel_client.exceptions import SentinelDeniedError
+
+NOW = 1_700_000_000.0  # 2023-11-14T22:13:20Z
+
+
+@pytest.fixture
+def intent():
+    return AccessIntent(
+        summary="Test Access", description="Testing the SDK", task_id="task-123"
+    )
+
+
+def _secret(value="s", expires_at="2023-11-14T23:13:20.000Z"):
+    return SecretPayload(type="managed_secret", value=value, expires_at=expires_at)
+
+
+def test_cache_serves_until_safety_margin():
+    clock = [NOW]
+    cache = GrantCache(safety_margin=60, clock=lambda: clock[0])
+    key = ("db", None, "production", "agent")
+    cache.put(key, _secret())  # expires one hour after NOW
+
+    assert cache.get(key).value == "s"
+    clock[0] = NOW + 3600 - 61
+    assert cache.get(key) is not None
+    clock[0] = NOW + 3600 - 60
+    assert cache.get(key) is None
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.size) == (2, 1, 0)
+
+
+def test_cache_skips_unparseable_or_expiring_grants():
+    cache = GrantCache(safety_margin=60, clock=lambda: NOW)
+    cache.put(("a", None, "p", "x"), _secret(expires_at="t"))
+    cache.put(("b", None, "p", "x"), _secret(expires_at="2023-11-14T22:14:00Z"))
+
+    assert cache.stats.size == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = GrantCache(max_entries=2, clock=lambda: NOW)
+    for name in ("a", "b"):
+        cache.put((name, None, "p", "x"), _secret(name))
+    cache.get(("a", None, "p", "x"))
+    cache.put(("c", None, "p", "x"), _secret("c"))
+
+    assert cache.get(("b", None, "p", "x")) is None
+    assert cache.get(("a", None, "p", "x")).value == "a"
+    assert cache.stats.evictions == 1
+
+
+def test_cache_invalidate_by_resource():
+    cache = GrantCache(clock=lambda: NOW)
+    cache.put(("a", None, "p", "x"), _secret())
+    cache.put(("a", 2, "p", "x"), _secret())
+    cache.put(("b", None, "p", "x"), _secret())
+
+    cache.invalidate("a")
+    assert cache.stats.size == 1
+    cache.invalidate()
+    assert cache.stats.size == 0
+
+
+@respx.mock
+def test_client_uses_cache_for_identical_requests(intent):
+    route = respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(
+            200,
+            json={
+                "request_id": "req_123",
+                "status": "APPROVED",
+                "secret": {
+                    "type": "managed_secret",
+                    "value": "cached-value",
+                    "expires_at": "2099-01-01T00:00:00.000Z",
+                },
+            },
+        )
+    )
+    client = SentinelClient(
+        base_url="http://test-server",
+        api_token="test-token",
+        agent_id="test-agent",
+        cache=GrantCache(),
+    )
+
+    assert client.request_secret("resource-1", intent).value == "cached-value"
+    assert client.request_secret("resource-1", intent).value == "cached-value"
+    client.request_secret("resource-1", intent, environment="staging")
+
+    assert route.call_count == 2
+    assert client.cache.stats.hits == 1
+
+
+def test_denial_cache_expires():
+    clock = [0.0]
+    cache = DenialCache(ttl=10, clock=lambda: clock[0])
+    cache.put(("forbidden", "production"), "Blocked")
+
+    assert cache.get(("forbidden", "production")) == "Blocked"
+    assert cache.get(("forbidden", "staging")) is None
+    clock[0] = 10
+    assert cache.get(("forbidden", "production")) is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+@respx.mock
+def test_client_remembers_denials(intent):
+    route = respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(
+            403,
+            json={"request_id": "r", "status": "DENIED", "reason": "Blocked by policy"},
+        )
+    )
+    client = SentinelClient(
+        base_url="http://test-server",
+        api_token="test-token",
+        agent_id="test-agent",
+        deny_cache=DenialCache(ttl=60),
+    )
+
+    for _ in range(3):
+        with pytest.raises(SentinelDeniedError, match="Blocked by policy"):
+            client.request_secret("forbidden-db", intent)
+
+    assert route.call_count == 1
+    assert client.deny_cache.stats.hits == 2
+
+    client.deny_cache.invalidate("forbidden-db")
+    with pytest.raises(SentinelDeniedError):
+        client.request_secret("forbidden-db", intent)
+    assert route.call_count == 2
@@ -0,0 +1,93 @@
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sentinel_client.catalog import ResourceCatalog
+from sentinel_client.cli import main
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SENTINEL_CACHE_DIR", str(tmp_path))
+    return str(tmp_path)
+
+
+def test_complete_returns_sorted_prefix_matches(cache_dir):
+    catalog = ResourceCatalog("http://test-server")
+    catalog.update(["prod/db", "dev/db", "prod/api", "prod", "production/x"])
+
+    assert catalog.complete("prod/") == ["prod/api", "prod/db"]
+    assert catalog.complete("prod") == ["prod", "prod/api", "prod/db", "production/x"]
+    assert catalog.complete("prod", limit=2) == ["prod", "prod/api"]
+    assert catalog.complete("staging") == []
+
+
+def test_catalog_is_persisted_per_server_and_environment(cache_dir):
+    ResourceCatalog("http://test-server").update(["a", "b"])
+
+    assert ResourceCatalog("http://test-server/").resources == ["a", "b"]
+    assert ResourceCatalog("http://test-server", "staging").exists is False
+    assert ResourceCatalog("http://other-server").exists is False
+    assert os.stat(ResourceCatalog("http://test-server").path).st_mode & 0o777 == 0o600
+
+
+def test_catalog_goes_stale_after_max_age(cache_dir):
+    catalog = ResourceCatalog("http://test-server", max_age=60)
+    assert catalog.stale
+    catalog.update(["a"])
+    assert not ResourceCatalog("http://test-server", max_age=60).stale
+
+    with open(catalog.path) as f:
+        data = json.load(f)
+    data["fetched_at"] -= 120
+    with open(catalog.path, "w") as f:
+        json.dump(data, f)
+    assert ResourceCatalog("http://test-server", max_age=60).stale
+
+
+def test_refresh_lists_resources_from_client(cache_dir):
+    client = MagicMock()
+    client.list_resources.return_value = ["b", "a"]
+
+    assert ResourceCatalog("http://test-server").refresh(client) is True
+    assert ResourceCatalog("http://test-server").resources == ["a", "b"]
+
+
+def test_complete_command_builds_catalog_then_answers_locally(cache_dir, capsys):
+    argv = ["sentinel", "--token", "t", "--url", "http://test-server"]
+    with patch("sentinel_client.client.SentinelClient") as MockClient:
+        MockClient.return_value.list_resources.return_value = ["prod/api", "prod/db"]
+        with patch.object(sys, "argv", argv + ["complete", "prod/a"]):
+            main()
+        with patch.object(sys, "argv", argv + ["complete", "prod/"]):
+            main()
+
+    assert capsys.readouterr().out.split() == ["prod/api", "prod/api", "prod/db"]
+    MockClient.return_value.list_resources.assert_called_once()
+
+
+def test_complete_command_revalidates_stale_catalog_in_background(cache_dir, capsys):
+    ResourceCatalog("http://test-server").update(["prod/api"])
+    argv = ["sentinel", "--token", "t", "--url", "http://test-server"]
+    with patch("sentinel_client.catalog.time.time", return_value=10**10), patch(
+        "subprocess.Popen"
+    ) as popen, patch.object(sys, "argv", argv + ["complete", "prod"]):
+        main()
+
+    assert capsys.readouterr().out.split() == ["prod/api"]
+    cmd = popen.call_args.args[0]
+    assert cmd[-2:] == ["complete", "--refresh"]
+    assert "t" not in cmd
+    assert popen.call_args.kwargs["env"]["SENTINEL_TOKEN"] == "t"
+
+
+def test_complete_command_prints_shell_script(capsys):
+    with patch.object(sys, "argv", ["sentinel", "complete", "--script", "bash"]):
+        main()
+
+    assert (
+        "complete -o default -F _sentinel_complete sentinel" in capsys.readouterr().out
+    )
@@ -10,7 +10,7 @@ from sentinel_client.types import SecretPayload
 
 @pytest.fixture
 def mock_client():
-    with patch("sentinel_client.cli.SentinelClient") as MockClient:
+    with patch("sentinel_client.client.SentinelClient") as MockClient:
         client_instance = MockClient.return_value
         yield client_instance
 
@@ -186,3 +186,230 @@ def test_run_command_no_cmd_after_dash(capsys):
         assert e.value.code == 1
         captured = capsys.readouterr()
         assert "Error: No command specified after --" in captured.err
+
+
+def test_uds_option_is_passed_to_client():
+    with patch("sentinel_client.client.SentinelClient") as MockClient:
+        MockClient.return_value.list_resources.return_value = []
+
+        with patch.object(
+            sys,
+            "argv",
+            [
+                "sentinel-cli",
+                "--token",
+                "fake-token",
+                "--uds",
+                "/run/sentinel.sock",
+                "resources",
+            ],
+        ):
+            main()
+
+    assert MockClient.call_args.kwargs["uds"] == "/run/sentinel.sock"
+
+
+def _modules_loaded_by(code, env=None):
+    """Run `code` in a fresh interpreter and return the modules it imported."""
+    import subprocess
+
+    src = os.path.join(os.path.dirname(__file__), "..", "src")
+    script = f"{code}\nimport sys, json\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=dict(os.environ, PYTHONPATH=src, **(env or {})),
+    )
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+def test_package_import_is_lazy():
+    loaded = _modules_loaded_by("import sentinel_client")
+    assert "httpx" not in loaded
+    assert "pydantic" not in loaded
+
+    loaded = _modules_loaded_by("from sentinel_client import SentinelClient")
+    assert "httpx" in loaded
+
+
+def test_complete_does_not_import_httpx(tmp_path):
+    from sentinel_client.catalog import ResourceCatalog
+
+    ResourceCatalog("http://test-server", directory=str(tmp_path)).update(
+        ["prod/api", "prod/db"]
+    )
+    loaded = _modules_loaded_by(
+        "import sys\n"
+        "from sentinel_client.cli import main\n"
+        "sys.argv = ['sentinel', '--token', 't', '--url', 'http://test-server',"
+        " 'complete', 'prod/']\n"
+        "main()",
+        env={"SENTINEL_CACHE_DIR": str(tmp_path)},
+    )
+    assert "httpx" not in loaded
+    assert "pydantic" not in loaded
+
+
+def _respond_get(request):
+    from httpx import Response
+
+    body = json.loads(request.content)
+    if body["resource_id"].startswith("forbidden"):
+        return Response(
+            403, json={"request_id": "r", "status": "DENIED", "reason": "No"}
+        )
+    value = f"{body['resource_id']}@{body['version']}@{body['environment']}"
+    return Response(
+        200,
+        json={
+            "request_id": "r",
+            "status": "APPROVED",
+            "secret": {
+                "type": "t",
+                "value": value,
+                "expires_at": "2099-01-01T00:00:00Z",
+            },
+        },
+    )
+
+
+def test_get_stdin_streams_ndjson_and_summarizes_failures(capsys):
+    import io
+
+    import respx
+
+    stdin = io.StringIO(
+        "db\n"
+        "\n"
+        "# comment\n"
+        "forbidden-key\n"
+        "cache version=2 environment=staging\n"
+        '{"resource_id": "queue", "version": 3}\n'
+        "bad version=x\n"
+    )
+    argv = ["sentinel", "--token", "t", "--url", "http://test-server"]
+    argv += ["get", "--stdin", "--format", "ndjson", "-c", "2"]
+    with respx.mock, patch.object(sys, "argv", argv), patch.object(sys, "stdin", stdin):
+        respx.post("http://test-server/v1/access/request").mock(
+            side_effect=_respond_get
+        )
+        with pytest.raises(SystemExit) as e:
+            main()
+
+    assert e.value.code == 1
+    captured = capsys.readouterr()
+    results = {r["resource_id"]: r for r in map(json.loads, captured.out.splitlines())}
+    assert results["db"]["outcome"] == "GRANTED"
+    assert results["db"]["secret"]["value"] == "db@None@production"
+    assert results["cache"]["secret"]["value"] == "cache@2@staging"
+    assert results["queue"]["secret"]["value"] == "queue@3@production"
+    assert results["forbidden-key"]["outcome"] == "DENIED"
+    assert results["bad version=x"]["outcome"] == "ERROR"
+    assert "line 7" in results["bad version=x"]["error"]
+    assert "3/5 secrets granted (1 denied, 1 error)" in captured.err
+
+
+def test_get_stdin_prints_dotenv(mock_client, capsys):
+    import io
+    from concurrent.futures import Future
+
+    def submit(resource_id, intent, **kwargs):
+        future = Future()
+        future.set_result(
+            SecretPayload(value=f"v-{resource_id}", type="t", expires_at="x")
+        )
+        return future
+
+    mock_client.submit_request.side_effect = submit
+    argv = ["sentinel", "--token", "t", "get", "--stdin", "--format", "env"]
+    with patch.object(sys, "argv", argv), patch.object(
+        sys, "stdin", io.StringIO("A\nB\n")
+    ):
+        with pytest.raises(SystemExit) as e:
+            main()
+
+    assert e.value.code == 0
+    captured = capsys.readouterr()
+    assert sorted(captured.out.splitlines()) == ["A=v-A", "B=v-B"]
+    assert "2/2 secrets granted" in captured.err
+
+
+def test_get_stdin_defaults_to_version_and_environment_flags(mock_client, capsys):
+    import io
+    from concurrent.futures import Future
+
+    def submit(resource_id, intent, version=None, environment=None, **kwargs):
+        future = Future()
+        future.set_result(
+            SecretPayload(
+                value=f"{resource_id}@{version}@{environment}",
+                type="t",
+                expires_at="x",
+            )
+        )
+        return future
+
+    mock_client.submit_request.side_effect = submit
+    argv = ["sentinel", "--token", "t", "--environment", "staging", "get"]
+    argv += ["--stdin", "--format", "env", "--version", "4"]
+    with patch.object(sys, "argv", argv), patch.object(
+        sys, "stdin", io.StringIO("A\nB version=2 environment=prod\n")
+    ):
+        with pytest.raises(SystemExit) as e:
+            main()
+
+    assert e.value.code == 0
+    assert sorted(capsys.readouterr().out.splitlines()) == [
+        "A=A@4@staging",
+        "B=B@2@prod",
+    ]
+
+
+def test_get_requires_resource_id_or_stdin(capsys):
+    with patch.object(sys, "argv", ["sentinel", "--token", "t", "get"]):
+        with pytest.raises(SystemExit) as e:
+            main()
+    assert e.value.code == 1
+    assert "resource_id or --stdin" in capsys.readouterr().err
+
+
+def test_get_stdin_prints_results_before_eof(mock_client):
+    from concurrent.futures import Future
+
+    import sentinel_client.cli as cli
+
+    events = []
+
+    def submit(resource_id, intent, **kwargs):
+        future = Future()
+        future.set_result(SecretPayload(value="v", type="t", expires_at="x"))
+        return future
+
+    def stdin():
+        yield "A\n"
+        yield "B\n"
+        events.append("eof")
+
+    def record(args, result):
+        events.append(result.resource_id)
+
+    mock_client.submit_request.side_effect = submit
+    argv = ["sentinel", "--token", "t", "get", "--stdin"]
+    with patch.object(sys, "argv", argv), patch.object(sys, "stdin", stdin()):
+        with patch.object(cli, "_print_stdin_result", record):
+            with pytest.raises(SystemExit) as e:
+                main()
+
+    assert e.value.code == 0
+    assert events == ["A", "B", "eof"]
+
+
+def test_get_stdin_rejects_non_positive_concurrency(capsys):
+    argv = ["sentinel", "--token", "t", "get", "--stdin", "-c", "0"]
+    with patch.object(sys, "argv", argv):
+        with pytest.raises(SystemExit) as e:
+            main()
+    assert e.value.code == 2
+    assert "must be at least 1" in capsys.readouterr().err
@@ -1,3 +1,9 @@
+import json
+import socketserver
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler
+
 import pytest
 import respx
 from httpx import Response
@@ -140,6 +146,43 @@ def test_fetch_secrets(client):
     }
 
 
+@respx.mock
+def test_fetch_secrets_revalidates_with_etag(client):
+    route = respx.get("http://test-server/v1/secrets")
+    route.side_effect = [
+        Response(200, json={"resource-1": "v1"}, headers={"ETag": '"secrets-4"'}),
+        Response(304, headers={"ETag": '"secrets-4"'}),
+    ]
+
+    assert client.fetch_secrets() == {"resource-1": "v1"}
+    assert client.fetch_secrets() == {"resource-1": "v1"}
+    assert route.calls[1].request.headers["If-None-Match"] == '"secrets-4"'
+
+
+@respx.mock
+def test_fetch_secrets_delta_merges_into_snapshot(client):
+    route = respx.get("http://test-server/v1/secrets")
+    route.side_effect = [
+        Response(
+            200,
+            json={"resource-1": "v1", "resource-2": "v1"},
+            headers={"ETag": '"secrets-4"', "X-Sentinel-Cursor": "4"},
+        ),
+        Response(
+            200,
+            json={"cursor": 5, "secrets": {"resource-2": "v2"}},
+            headers={"ETag": '"secrets-5"', "X-Sentinel-Cursor": "5"},
+        ),
+    ]
+
+    client.fetch_secrets(delta=True)
+    secrets = client.fetch_secrets(delta=True)
+
+    assert secrets == {"resource-1": "v1", "resource-2": "v2"}
+    assert route.calls[0].request.url.params.get("since") is None
+    assert route.calls[1].request.url.params["since"] == "4"
+
+
 @respx.mock
 def test_list_resources(client):
     respx.get("http://test-server/v1/resources").mock(
@@ -151,3 +194,86 @@ def test_list_resources(client):
 
     resources = client.list_resources()
     assert resources == ["resource-1", "resource-2", "resource-3"]
+
+
+@respx.mock
+def test_client_reuses_connection_pool(intent):
+    route = respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(
+            200,
+            json={
+                "request_id": "req_123",
+                "status": "APPROVED",
+                "secret": {"type": "v", "value": "s", "expires_at": "t"},
+            },
+        )
+    )
+
+    with SentinelClient(
+        base_url="http://test-server",
+        api_token="test-token",
+        agent_id="test-agent",
+        max_connections=4,
+        keepalive_expiry=10.0,
+    ) as pooled:
+        http = pooled._http
+        pooled.request_secret("resource-1", intent)
+        pooled.request_secret("resource-1", intent)
+        assert pooled._http is http
+        assert pooled.limits.max_connections == 4
+        assert pooled.limits.keepalive_expiry == 10.0
+
+    assert route.call_count == 2
+    assert http.is_closed
+
+
+def test_http2_falls_back_without_h2(monkeypatch):
+    monkeypatch.setitem(sys.modules, "h2", None)
+
+    with pytest.warns(RuntimeWarning, match="falling back to HTTP/1.1"):
+        fallback = SentinelClient(
+            base_url="http://test-server",
+            api_token="test-token",
+            agent_id="test-agent",
+            http2=True,
+        )
+
+    assert fallback.http2 is False
+    fallback.close()
+
+
+def test_unix_base_url_uses_socket_transport(tmp_path, intent):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = json.dumps(
+                {
+                    "request_id": "req_uds",
+                    "status": "APPROVED",
+                    "secret": {"type": "v", "value": "over-uds", "expires_at": "t"},
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    socket_path = str(tmp_path / "sentinel.sock")
+    server = socketserver.UnixStreamServer(socket_path, Handler)
+    threading.Thread(target=server.handle_request, daemon=True).start()
+
+    try:
+        with SentinelClient(
+            base_url=f"unix://{socket_path}",
+            api_token="test-token",
+            agent_id="test-agent",
+        ) as uds_client:
+            assert uds_client.uds == socket_path
+            secret = uds_client.request_secret("resource-1", intent)
+    finally:
+        server.server_close()
+
+    assert secret.value == "over-uds"
@@ -0,0 +1,105 @@
+import json
+
+import pytest
+import respx
+from httpx import Response
+from pydantic import ValidationError
+
+from sentinel_client import AccessIntent, AccessRequest, AccessStatus, SentinelClient
+from sentinel_client.codec import (
+    decode_access_item,
+    decode_access_response,
+    encode_access_request,
+)
+from sentinel_client.exceptions import SentinelError
+
+INTENT = AccessIntent(summary="Test", description="Testing the codec", task_id="t-1")
+
+APPROVED = {
+    "request_id": "req_1",
+    "status": "APPROVED",
+    "secret": {"type": "api_key", "value": "v", "expires_at": "2030-01-01T00:00:00Z"},
+}
+
+
+def _client(**kwargs):
+    return SentinelClient(
+        "http://test-server", "token", "agent", prefer_agent=False, **kwargs
+    )
+
+
+def test_fast_encoding_matches_the_model():
+    expected = AccessRequest(
+        agent_id="agent",
+        resource_id="db",
+        version=2,
+        environment="staging",
+        intent=INTENT,
+        ttl_seconds=60,
+    ).model_dump()
+    args = ("agent", "db", 2, "staging", INTENT, 60)
+    assert encode_access_request(*args) == expected
+    assert encode_access_request(*args, validate=True) == expected
+
+
+def test_fast_encoding_accepts_an_intent_dict():
+    body = encode_access_request(
+        "agent", "db", None, None, INTENT.model_dump(), 60, validate=False
+    )
+    assert body["intent"] == INTENT.model_dump()
+
+
+def test_validation_is_opt_in():
+    body = encode_access_request("agent", "db", None, None, INTENT, 0)
+    assert body["ttl_seconds"] == 0
+    with pytest.raises(ValidationError):
+        encode_access_request("agent", "db", None, None, INTENT, 0, validate=True)
+
+
+def test_decode_validates_responses():
+    response = decode_access_response(json.dumps(APPROVED).encode())
+    assert response.status == AccessStatus.APPROVED
+    assert response.secret.value == "v"
+    assert decode_access_item(APPROVED) == response
+    with pytest.raises(ValueError):
+        decode_access_response(b'{"request_id": "req_1", "status": "MAYBE"}')
+    with pytest.raises(ValueError):
+        decode_access_item({"status": "APPROVED"})
+
+
+@respx.mock
+def test_client_sends_directly_encoded_body():
+    route = respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(200, json=APPROVED)
+    )
+    with _client() as client:
+        assert client.request_secret("db", INTENT, ttl_seconds=60).value == "v"
+    assert json.loads(route.calls.last.request.content) == {
+        "agent_id": "agent",
+        "resource_id": "db",
+        "version": None,
+        "environment": "production",
+        "intent": INTENT.model_dump(),
+        "ttl_seconds": 60,
+    }
+
+
+@respx.mock
+def test_client_validate_requests_rejects_before_sending():
+    route = respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(200, json=APPROVED)
+    )
+    with _client(validate_requests=True) as client:
+        with pytest.raises(ValidationError):
+            client.request_secret("db", INTENT, ttl_seconds=0)
+    assert not route.called
+
+
+@respx.mock
+def test_client_reports_malformed_response():
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(200, json={"request_id": "req_1"})
+    )
+    with _client() as client:
+        with pytest.raises(SentinelError, match="Unexpected error"):
+            client.request_secret("db", INTENT)
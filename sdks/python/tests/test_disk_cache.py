@@ -0,0 +1,119 @@
+import os
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from sentinel_client.cli import main
+from sentinel_client.disk_cache import DiskGrantCache, clear_cache_dir
+from sentinel_client.types import SecretPayload
+
+
+def _secret(value="disk-secret", expires_at="2099-01-01T00:00:00.000Z"):
+    return SecretPayload(type="managed_secret", value=value, expires_at=expires_at)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SENTINEL_CACHE_DIR", str(tmp_path))
+    return str(tmp_path)
+
+
+def test_disk_cache_round_trip_is_encrypted(cache_dir):
+    cache = DiskGrantCache("http://server", "token-a", directory=cache_dir)
+    key = ("db", None, "production", "agent")
+    cache.put(key, _secret())
+
+    assert cache.get(key).value == "disk-secret"
+    with open(cache.path, "rb") as f:
+        assert b"disk-secret" not in f.read()
+    assert oct(os.stat(cache.path).st_mode & 0o777) == "0o600"
+
+    stats = cache.stats
+    assert (stats.entries, stats.live, stats.hits) == (1, 1, 1)
+
+
+def test_disk_cache_lookups_do_not_rewrite_the_file(cache_dir):
+    cache = DiskGrantCache("http://server", "token-a", directory=cache_dir)
+    key = ("db", None, "production", "agent")
+    cache.put(key, _secret())
+    before = os.stat(cache.path)
+
+    assert cache.get(key).value == "disk-secret"
+    assert cache.get(("other", None, "production", "agent")) is None
+    assert cache.get_secrets("production") is None
+
+    after = os.stat(cache.path)
+    assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+    stats = DiskGrantCache("http://server", "token-a", directory=cache_dir).stats
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_disk_cache_is_scoped_to_token(cache_dir):
+    key = ("db", None, "production", "agent")
+    DiskGrantCache("http://server", "token-a", directory=cache_dir).put(key, _secret())
+
+    other = DiskGrantCache("http://server", "token-b", directory=cache_dir)
+    assert other.get(key) is None
+
+
+def test_disk_cache_skips_expired_grants(cache_dir):
+    cache = DiskGrantCache("http://server", "token-a", directory=cache_dir)
+    key = ("db", None, "production", "agent")
+    cache.put(key, _secret(expires_at="2000-01-01T00:00:00Z"))
+
+    assert cache.get(key) is None
+
+
+def test_disk_cache_concurrent_writers_keep_all_entries(cache_dir):
+    def writer(n):
+        cache = DiskGrantCache("http://server", "token-a", directory=cache_dir)
+        cache.put((f"db-{n}", None, "production", "agent"), _secret(f"v{n}"))
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    cache = DiskGrantCache("http://server", "token-a", directory=cache_dir)
+    assert cache.stats.entries == 8
+    assert clear_cache_dir(cache_dir) == 1
+    assert cache.stats.entries == 0
+
+
+def test_cli_get_passes_disk_cache_to_client(cache_dir):
+    with patch("sentinel_client.client.SentinelClient") as MockClient:
+        MockClient.return_value.request_secret.return_value = _secret()
+        argv = ["sentinel-cli", "--token", "t", "--cache", "get", "db"]
+        with patch.object(sys, "argv", argv):
+            main()
+
+    assert isinstance(MockClient.call_args.kwargs["cache"], DiskGrantCache)
+
+
+def test_cli_run_reuses_cached_secrets(cache_dir):
+    argv = ["sentinel-cli", "--token", "t", "--cache", "run", "--", "env"]
+    with patch("sentinel_client.client.SentinelClient") as MockClient:
+        MockClient.return_value.fetch_secrets.return_value = {"DB_PASS": "s3cret"}
+        with patch.object(sys, "argv", argv), patch("os.execvpe") as mock_exec:
+            main()
+            main()
+
+    assert MockClient.return_value.fetch_secrets.call_count == 1
+    assert mock_exec.call_args[0][2]["DB_PASS"] == "s3cret"
+
+
+def test_cli_cache_stats_and_clear(cache_dir, capsys):
+    DiskGrantCache("http://localhost:3000", "t").put(
+        ("db", None, "production", "cli-user"), _secret()
+    )
+
+    with patch.object(sys, "argv", ["sentinel-cli", "--token", "t", "cache", "stats"]):
+        main()
+    assert "Entries: 1 (1 live)" in capsys.readouterr().out
+
+    with patch.object(sys, "argv", ["sentinel-cli", "cache", "clear"]):
+        main()
+    assert "Removed 1 cache file(s)" in capsys.readouterr().out
@@ -0,0 +1,246 @@
+import threading
+import time
+from concurrent.futures import CancelledError, wait
+
+import pytest
+import respx
+from httpx import Response
+
+from sentinel_client import AccessIntent, SentinelClient
+from sentinel_client.futures import SecretFuture
+
+
+def _approved(request_id):
+    return {
+        "request_id": request_id,
+        "status": "APPROVED",
+        "secret": {
+            "type": "managed_secret",
+            "value": f"value-{request_id}",
+            "expires_at": "2099-01-01T00:00:00Z",
+        },
+    }
+
+
+@pytest.fixture
+def intent():
+    return AccessIntent(summary="s", description="d", task_id="t")
+
+
+def _client(**kwargs):
+    return SentinelClient(
+        base_url="http://test-server",
+        api_token="t",
+        agent_id="a",
+        prefer_agent=False,
+        **kwargs,
+    )
+
+
+@respx.mock
+def test_submit_request_returns_a_future(intent):
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(200, json=_approved("req_1"))
+    )
+    seen = []
+
+    with _client() as client:
+        future = client.submit_request("db", intent)
+        future.add_done_callback(lambda f: seen.append(f.status))
+        assert isinstance(future, SecretFuture)
+        assert future.result(timeout=2).value == "value-req_1"
+
+    assert future.status == "APPROVED"
+    assert seen == ["APPROVED"]
+
+
+@respx.mock
+def test_status_follows_the_approval_flow(intent):
+    approved = threading.Event()
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(
+            202, json={"request_id": "req_1", "status": "PENDING_APPROVAL"}
+        )
+    )
+    respx.get("http://test-server/v1/access/requests/req_1").mock(
+        side_effect=lambda request: Response(
+            200,
+            json=(
+                _approved("req_1")
+                if approved.is_set()
+                else {"request_id": "req_1", "status": "PENDING_APPROVAL"}
+            ),
+        )
+    )
+
+    with _client() as client:
+        future = client.submit_request("prod-db", intent, polling_interval=0.01)
+        while future.status != "PENDING_APPROVAL":
+            time.sleep(0.01)
+        assert future.request_id == "req_1"
+        approved.set()
+        future.result(timeout=2)
+
+    assert future.status == "APPROVED"
+
+
+@respx.mock
+def test_cancel_stops_a_request_waiting_for_approval(intent):
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(
+            202, json={"request_id": "req_1", "status": "PENDING_APPROVAL"}
+        )
+    )
+    respx.get("http://test-server/v1/access/requests/req_1").mock(
+        return_value=Response(
+            200, json={"request_id": "req_1", "status": "PENDING_APPROVAL"}
+        )
+    )
+
+    with _client() as client:
+        future = client.submit_request("prod-db", intent, polling_interval=10)
+        while future.status != "PENDING_APPROVAL":
+            time.sleep(0.01)
+        start = time.monotonic()
+        assert future.cancel()
+        with pytest.raises(CancelledError):
+            future.result(timeout=2)
+
+    assert time.monotonic() - start < 1
+    assert future.status == "CANCELLED"
+
+
+@respx.mock
+def test_worker_pool_is_bounded(intent):
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def slow(request):
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+        return Response(200, json=_approved("req_1"))
+
+    respx.post("http://test-server/v1/access/request").mock(side_effect=slow)
+
+    with _client(submit_workers=2, single_flight=False) as client:
+        submitted = [client.submit_request(f"db-{n}", intent) for n in range(6)]
+        done, _ = wait(submitted, timeout=5)
+
+    assert len(done) == 6
+    assert max(peak) == 2
+
+
+@respx.mock
+def test_cancelling_a_shared_request_spares_other_callers(intent):
+    approved = threading.Event()
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(
+            202, json={"request_id": "req_1", "status": "PENDING_APPROVAL"}
+        )
+    )
+    respx.get("http://test-server/v1/access/requests/req_1").mock(
+        side_effect=lambda request: Response(
+            200,
+            json=(
+                _approved("req_1")
+                if approved.is_set()
+                else {"request_id": "req_1", "status": "PENDING_APPROVAL"}
+            ),
+        )
+    )
+    results = []
+
+    with _client() as client:
+        future = client.submit_request("prod-db", intent, polling_interval=0.01)
+        while future.status != "PENDING_APPROVAL":
+            time.sleep(0.01)
+        follower = threading.Thread(
+            target=lambda: results.append(
+                client.request_secret("prod-db", intent, polling_interval=0.01)
+            )
+        )
+        follower.start()
+        while client.single_flight.stats.shared == 0:
+            time.sleep(0.01)
+        future.cancel()
+        with pytest.raises(CancelledError):
+            future.result(timeout=2)
+        approved.set()
+        follower.join(timeout=5)
+
+    assert [secret.value for secret in results] == ["value-req_1"]
+
+
+@respx.mock
+def test_cancel_during_the_initial_request_discards_its_result(intent):
+    sent = threading.Event()
+    release = threading.Event()
+
+    def slow(request):
+        sent.set()
+        release.wait(5)
+        return Response(200, json=_approved("req_1"))
+
+    respx.post("http://test-server/v1/access/request").mock(side_effect=slow)
+
+    with _client() as client:
+        future = client.submit_request("db", intent)
+        assert sent.wait(2)
+        assert future.status == "REQUESTING"
+        assert future.cancel()
+        release.set()
+        with pytest.raises(CancelledError):
+            future.result(timeout=2)
+
+    assert future.cancelled()
+    assert future.status == "CANCELLED"
+    assert not future.cancel()
+
+
+@respx.mock
+def test_cancel_stops_a_caller_waiting_on_a_shared_request(intent):
+    approved = threading.Event()
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(
+            202, json={"request_id": "req_1", "status": "PENDING_APPROVAL"}
+        )
+    )
+    respx.get("http://test-server/v1/access/requests/req_1").mock(
+        side_effect=lambda request: Response(
+            200,
+            json=(
+                _approved("req_1")
+                if approved.is_set()
+                else {"request_id": "req_1", "status": "PENDING_APPROVAL"}
+            ),
+        )
+    )
+    results = []
+
+    with _client() as client:
+        leader = threading.Thread(
+            target=lambda: results.append(
+                client.request_secret("prod-db", intent, polling_interval=0.01)
+            )
+        )
+        leader.start()
+        while client.single_flight.stats.executed == 0:
+            time.sleep(0.01)
+        future = client.submit_request("prod-db", intent, polling_interval=0.01)
+        while client.single_flight.stats.shared == 0:
+            time.sleep(0.01)
+        start = time.monotonic()
+        assert future.cancel()
+        with pytest.raises(CancelledError):
+            future.result(timeout=2)
+        assert time.monotonic() - start < 1
+        approved.set()
+        leader.join(timeout=5)
+
+    assert future.status == "CANCELLED"
+    assert [secret.value for secret in results] == ["value-req_1"]
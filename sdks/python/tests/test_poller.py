@@ -0,0 +1,192 @@
+import threading
+
+import pytest
+import respx
+from httpx import Response
+
+from sentinel_client import AccessIntent, SentinelClient
+from sentinel_client.exceptions import (
+    SentinelDeniedError,
+    SentinelError,
+    SentinelTimeoutError,
+)
+from sentinel_client.poller import ApprovalPoller
+
+
+def _pending(request_id):
+    return {"request_id": request_id, "status": "PENDING_APPROVAL"}
+
+
+def _approved(request_id):
+    return {
+        "request_id": request_id,
+        "status": "APPROVED",
+        "secret": {
+            "type": "managed_secret",
+            "value": f"value-{request_id}",
+            "expires_at": "2099-01-01T00:00:00Z",
+        },
+    }
+
+
+@pytest.fixture
+def client():
+    with SentinelClient(
+        base_url="http://test-server",
+        api_token="t",
+        agent_id="a",
+        prefer_agent=False,
+    ) as client:
+        yield client
+
+
+@respx.mock
+def test_poller_checks_all_pending_requests_in_one_batch(client):
+    ticks = []
+
+    def batch(request):
+        ids = request.url.params["ids"].split(",")
+        ticks.append(ids)
+        if len(ticks) == 1:
+            return Response(200, json={"requests": {i: _pending(i) for i in ids}})
+        return Response(
+            200,
+            json={
+                "requests": {
+                    "req_1": _approved("req_1"),
+                    "req_2": {"request_id": "req_2", "status": "DENIED"},
+                    "req_3": _pending("req_3"),
+                }
+            },
+        )
+
+    respx.get("http://test-server/v1/access/requests").mock(side_effect=batch)
+    poller = ApprovalPoller(client, interval=0.01)
+    futures = [poller.watch(f"req_{n}") for n in (1, 2, 3)]
+
+    assert futures[0].result(timeout=2).value == "value-req_1"
+    with pytest.raises(SentinelDeniedError):
+        futures[1].result(timeout=2)
+    assert sorted(ticks[0]) == ["req_1", "req_2", "req_3"]
+    assert not futures[2].done()
+    poller.shutdown()
+    with pytest.raises(SentinelError, match="shut down"):
+        futures[2].result(timeout=2)
+    assert poller.stats.resolved == 2
+
+
+@respx.mock
+def test_poller_falls_back_to_per_request_polls(client):
+    batch = respx.get("http://test-server/v1/access/requests").mock(
+        return_value=Response(404, json={"error": "Not Found"})
+    )
+    single = respx.get("http://test-server/v1/access/requests/req_1").mock(
+        side_effect=[Response(200, json=_pending("req_1"))]
+        + [Response(200, json=_approved("req_1"))]
+    )
+    poller = ApprovalPoller(client, interval=0.01)
+
+    assert poller.watch("req_1").result(timeout=2).value == "value-req_1"
+    assert batch.call_count == 1
+    assert single.call_count == 2
+    poller.shutdown()
+
+
+@respx.mock
+def test_poller_times_out_and_skips_cancelled_watchers(client):
+    route = respx.get("http://test-server/v1/access/requests").mock(
+        return_value=Response(200, json={"requests": {"req_1": _pending("req_1")}})
+    )
+    poller = ApprovalPoller(client, interval=0.01)
+
+    with pytest.raises(SentinelTimeoutError):
+        poller.watch("req_1", timeout=0.05).result(timeout=2)
+    cancelled = poller.watch("req_2", timeout=5)
+    assert cancelled.cancel()
+    calls = route.call_count
+    poller.shutdown()
+
+    assert poller.stats.pending == 0
+    assert all("req_2" not in c.request.url.params["ids"] for c in route.calls[calls:])
+
+
+@respx.mock
+def test_client_multiplexes_concurrent_approvals():
+    posts = iter(range(20))
+    respx.post("http://test-server/v1/access/request").mock(
+        side_effect=lambda request: Response(202, json=_pending(f"req_{next(posts)}"))
+    )
+    batch = respx.get("http://test-server/v1/access/requests").mock(
+        side_effect=lambda request: Response(
+            200,
+            json={
+                "requests": {
+                    i: _approved(i) for i in request.url.params["ids"].split(",")
+                }
+            },
+        )
+    )
+    intent = AccessIntent(summary="s", description="d", task_id="t")
+    results = []
+
+    with SentinelClient(
+        base_url="http://test-server",
+        api_token="t",
+        agent_id="a",
+        prefer_agent=False,
+        single_flight=False,
+        multiplex_polling=True,
+    ) as client:
+        client.approval_poller.interval = 0.2
+
+        def worker(n):
+            results.append(client.request_secret(f"prod-{n}", intent).value)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert len(results) == 20
+    assert batch.call_count < 20
+
+
+@respx.mock
+def test_poller_survives_malformed_responses(client):
+    respx.get("http://test-server/v1/access/requests").mock(
+        return_value=Response(200, json=["not", "an", "object"])
+    )
+    poller = ApprovalPoller(client, interval=0.01)
+    future = poller.watch("req_1", timeout=0.2)
+
+    with pytest.raises(SentinelTimeoutError):
+        future.result(timeout=2)
+    assert poller.stats.errors >= 1
+    poller.shutdown()
+
+
+@respx.mock
+def test_poller_fails_request_with_non_json_status(client):
+    respx.get("http://test-server/v1/access/requests").mock(return_value=Response(404))
+    respx.get("http://test-server/v1/access/requests/req_1").mock(
+        return_value=Response(200, text="<html>oops</html>")
+    )
+    poller = ApprovalPoller(client, interval=0.01)
+
+    with pytest.raises(SentinelError, match="Unexpected error"):
+        poller.watch("req_1", timeout=2).result(timeout=2)
+    poller.shutdown()
+
+
+def test_client_bounds_wait_on_a_stuck_poller(client):
+    client.approval_poller = ApprovalPoller(client, interval=0.05)
+    # a poller whose thread is gone: only the client can enforce the deadline
+    dead = threading.Thread(target=lambda: None)
+    dead.start()
+    dead.join()
+    client.approval_poller._thread = dead
+
+    with pytest.raises(SentinelTimeoutError):
+        client._poll_for_approval("req_1", 0.05, 0.2, None)
+    client.approval_poller.shutdown()
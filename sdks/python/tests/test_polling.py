@@ -0,0 +1,156 @@
+from email.utils import formatdate
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+from httpx import Response
+
+from sentinel_client import AccessIntent, SentinelClient
+from sentinel_client.exceptions import SentinelTimeoutError
+from sentinel_client.polling import (
+    ExponentialBackoff,
+    FixedInterval,
+    PollRun,
+    PollStrategy,
+    parse_retry_after,
+)
+
+PENDING = {"request_id": "req_1", "status": "PENDING_APPROVAL"}
+APPROVED = {
+    "request_id": "req_1",
+    "status": "APPROVED",
+    "secret": {
+        "type": "managed_secret",
+        "value": "v",
+        "expires_at": "2099-01-01T00:00:00Z",
+    },
+}
+
+
+@pytest.fixture
+def intent():
+    return AccessIntent(summary="s", description="d", task_id="t")
+
+
+def _client(strategy):
+    return SentinelClient(
+        base_url="http://test-server",
+        api_token="t",
+        agent_id="a",
+        prefer_agent=False,
+        poll_strategy=strategy,
+    )
+
+
+def test_exponential_backoff_is_capped_with_full_jitter():
+    exact = ExponentialBackoff(initial=0.5, maximum=4.0, jitter=False)
+    assert [exact.delay(n) for n in range(6)] == [0.5, 1.0, 2.0, 4.0, 4.0, 4.0]
+    assert exact.delay(10_000) == 4.0
+
+    jittered = ExponentialBackoff(initial=0.5, maximum=4.0, rng=lambda: 0.25)
+    assert jittered.delay(3) == 1.0
+
+
+def test_parse_retry_after_accepts_seconds_and_dates():
+    assert parse_retry_after(Response(503, headers={"Retry-After": "3"})) == 3.0
+    future = formatdate(time.time() + 60, usegmt=True)
+    assert 55 < parse_retry_after(Response(503, headers={"Retry-After": future})) <= 60
+    assert parse_retry_after(Response(503, headers={"Retry-After": "soon"})) is None
+    assert parse_retry_after(Response(503)) is None
+
+
+def test_poll_run_honours_retry_after_and_deadline():
+    run = PollRun(FixedInterval(0.01), timeout=0.5)
+    assert run.next_wait() == 0.01
+    assert run.retry_later(Response(429, headers={"Retry-After": "2"})) is True
+    assert run.next_wait() <= 0.5  # never sleeps past the deadline
+    assert run.retry_later(Response(200)) is False
+
+
+@respx.mock
+def test_client_backs_off_through_throttling_and_errors(intent):
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(202, json=PENDING)
+    )
+    respx.get("http://test-server/v1/access/requests/req_1").mock(
+        side_effect=[
+            httpx.ConnectError("boom"),
+            Response(503, headers={"Retry-After": "0"}),
+            Response(200, json=PENDING),
+            Response(200, json=APPROVED),
+        ]
+    )
+    strategy = ExponentialBackoff(initial=0.01, maximum=0.02)
+
+    with _client(strategy) as client:
+        assert client.request_secret("db", intent).value == "v"
+
+    stats = strategy.stats
+    assert (stats.approvals, stats.polls, stats.errors, stats.throttled) == (1, 4, 1, 1)
+    assert stats.polls_per_approval == 4.0
+
+
+@respx.mock
+def test_timeout_is_recorded(intent):
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(202, json=PENDING)
+    )
+    respx.get("http://test-server/v1/access/requests/req_1").mock(
+        return_value=Response(200, json=PENDING)
+    )
+    strategy = FixedInterval(0.01)
+
+    with _client(strategy) as client:
+        with pytest.raises(SentinelTimeoutError):
+            client.request_secret("db", intent, polling_timeout=0.05)
+
+    assert strategy.stats.approvals == 1
+    assert strategy.stats.polls >= 2
+
+
+@respx.mock
+def test_long_poll_returns_as_soon_as_the_request_is_approved(intent):
+    approved = threading.Event()
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(202, json=PENDING, headers={"X-Sentinel-Long-Poll": "30"})
+    )
+
+    def hold(request):
+        # Stand-in for the server holding the poll open until an admin acts
+        assert float(request.url.params["wait"]) > 0
+        approved.wait(float(request.url.params["wait"]))
+        return Response(200, json=APPROVED, headers={"X-Sentinel-Long-Poll": "30"})
+
+    route = respx.get("http://test-server/v1/access/requests/req_1").mock(
+        side_effect=hold
+    )
+    threading.Timer(0.2, approved.set).start()
+
+    # A 10s polling interval would add up to 10s of latency without long-polling
+    start = time.monotonic()
+    with _client(FixedInterval(10)) as client:
+        client.request_secret("db", intent, polling_timeout=5)
+    assert time.monotonic() - start < 0.2 + 0.1
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_long_poll_falls_back_when_server_stops_advertising(intent):
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(202, json=PENDING, headers={"X-Sentinel-Long-Poll": "30"})
+    )
+    route = respx.get("http://test-server/v1/access/requests/req_1").mock(
+        side_effect=[Response(200, json=PENDING), Response(200, json=APPROVED)]
+    )
+
+    with _client(FixedInterval(0.01)) as client:
+        assert client.request_secret("db", intent).value == "v"
+    assert "wait" in route.calls[0].request.url.params
+    assert "wait" not in route.calls[1].request.url.params
+
+
+def test_poll_strategy_requires_delay():
+    with pytest.raises(TypeError):
+        PollStrategy()
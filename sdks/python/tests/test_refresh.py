@@ -0,0 +1,110 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import respx
+from httpx import Response
+
+from sentinel_client import (
+    AccessIntent,
+    GrantCache,
+    RefreshAheadScheduler,
+    SentinelClient,
+)
+
+
+@pytest.fixture
+def intent():
+    return AccessIntent(
+        summary="Test Access", description="Testing the SDK", task_id="task-123"
+    )
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+def test_scheduler_refreshes_touched_keys_only():
+    scheduler = RefreshAheadScheduler(refresh_fraction=0.5, jitter=0)
+    refreshed = []
+    try:
+        expires_at = time.time() + 0.2
+        scheduler.schedule("hot", expires_at, lambda: refreshed.append("hot"))
+        scheduler.schedule("idle", expires_at, lambda: refreshed.append("idle"))
+        scheduler.touch("hot")
+
+        _wait_for(lambda: scheduler.stats.dropped_idle == 1 and refreshed)
+    finally:
+        scheduler.shutdown()
+
+    assert refreshed == ["hot"]
+    assert scheduler.stats.refreshed == 1
+
+
+def test_scheduler_retries_failed_refresh():
+    scheduler = RefreshAheadScheduler(refresh_fraction=0.5, jitter=0, max_retries=1)
+    attempts = []
+
+    def failing():
+        attempts.append(1)
+        raise RuntimeError("upstream down")
+
+    try:
+        scheduler.schedule("key", time.time() + 0.4, failing)
+        scheduler.touch("key")
+        _wait_for(lambda: scheduler.stats.failed == 2)
+    finally:
+        scheduler.shutdown()
+
+    assert len(attempts) == 2
+
+
+def test_refresh_ahead_requires_cache():
+    with pytest.raises(ValueError, match="requires a cache"):
+        SentinelClient(
+            base_url="http://test-server",
+            api_token="test-token",
+            agent_id="test-agent",
+            refresh_ahead=RefreshAheadScheduler(),
+        )
+
+
+@respx.mock
+def test_client_refreshes_grant_in_background(intent):
+    issued = []
+
+    def grant(request):
+        issued.append(1)
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=0.6)
+        return Response(
+            200,
+            json={
+                "request_id": f"req_{len(issued)}",
+                "status": "APPROVED",
+                "secret": {
+                    "type": "managed_secret",
+                    "value": f"value-{len(issued)}",
+                    "expires_at": expires_at.isoformat(),
+                },
+            },
+        )
+
+    respx.post("http://test-server/v1/access/request").mock(side_effect=grant)
+
+    with SentinelClient(
+        base_url="http://test-server",
+        api_token="test-token",
+        agent_id="test-agent",
+        cache=GrantCache(safety_margin=0),
+        refresh_ahead=RefreshAheadScheduler(refresh_fraction=0.5, jitter=0),
+    ) as client:
+        assert client.request_secret("resource-1", intent).value == "value-1"
+        assert client.request_secret("resource-1", intent).value == "value-1"
+
+        _wait_for(lambda: client.refresh_ahead.stats.refreshed == 1)
+        assert client.request_secret("resource-1", intent).value == "value-2"
+        assert client.cache.stats.misses == 1
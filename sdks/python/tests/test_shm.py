@@ -0,0 +1,227 @@
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+import respx
+from httpx import Response
+
+from sentinel_client import AccessIntent, SecretPayload, SentinelClient
+from sentinel_client.shm import SharedGrantCache, default_shm_path
+
+NOW = 1_700_000_000.0  # 2023-11-14T22:13:20Z
+KEY = ("db", None, "production", "agent")
+
+
+def _secret(value="s", expires_at="2023-11-14T23:13:20.000Z"):
+    return SecretPayload(type="managed_secret", value=value, expires_at=expires_at)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "grants.shm")
+
+
+def _cache(path, clock=None, **kwargs):
+    return SharedGrantCache(path, clock=clock or (lambda: NOW), **kwargs)
+
+
+def test_shared_cache_serves_until_safety_margin(path):
+    clock = [NOW]
+    cache = _cache(path, clock=lambda: clock[0], safety_margin=60)
+    cache.put(KEY, _secret())
+
+    assert cache.get(KEY).value == "s"
+    clock[0] = NOW + 3600 - 60
+    assert cache.get(KEY) is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_grants_are_visible_to_other_processes(path):
+    _cache(path).put(KEY, _secret("from-parent"))
+
+    def child(queue):
+        queue.put(_cache(path).get(KEY).value)
+        _cache(path).put(("api", None, "production", "agent"), _secret("from-child"))
+
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    process = ctx.Process(target=child, args=(queue,))
+    process.start()
+    process.join()
+
+    assert queue.get() == "from-parent"
+    assert _cache(path).get(("api", None, "production", "agent")).value == "from-child"
+
+
+def test_table_size_is_bounded(path):
+    cache = _cache(path, slots=4)
+    for i in range(20):
+        cache.put((f"res-{i}", None, "production", "agent"), _secret(str(i)))
+
+    assert cache.stats.size == 4
+    assert cache.stats.evictions == 16
+    assert cache.get(("res-19", None, "production", "agent")).value == "19"
+
+
+def test_existing_table_geometry_wins(path):
+    _cache(path, slots=8, slot_size=512)
+    cache = _cache(path, slots=64)
+
+    assert (cache.slots, cache.slot_size) == (8, 512)
+
+
+def test_oversized_grants_and_invalidate(path):
+    cache = _cache(path, slot_size=256)
+    cache.put(KEY, _secret("x" * 512))
+    assert cache.get(KEY) is None
+
+    cache.put(KEY, _secret())
+    cache.put(("api", None, "production", "agent"), _secret())
+    cache.invalidate("db")
+    assert cache.get(KEY) is None
+    assert cache.get(("api", None, "production", "agent")) is not None
+    cache.invalidate()
+    assert cache.stats.size == 0
+
+
+def test_filling_excludes_other_processes(path):
+    def child(held):
+        with _cache(path).filling(KEY):
+            held.set()
+            time.sleep(0.3)
+
+    ctx = multiprocessing.get_context("fork")
+    held = ctx.Event()
+    process = ctx.Process(target=child, args=(held,))
+    process.start()
+    held.wait()
+    start = time.monotonic()
+    with _cache(path).filling(KEY):
+        waited = time.monotonic() - start
+    process.join()
+
+    assert waited >= 0.2
+
+
+@respx.mock
+def test_client_uses_grant_filled_by_another_process(path):
+    intent = AccessIntent(summary="s", description="d", task_id="t")
+    route = respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(
+            200,
+            json={
+                "request_id": "req_1",
+                "status": "APPROVED",
+                "secret": _secret("fresh", "2099-01-01T00:00:00Z").model_dump(),
+            },
+        )
+    )
+    cache = SharedGrantCache(path)
+    client = SentinelClient(
+        base_url="http://test-server",
+        api_token="t",
+        agent_id="agent",
+        environment="production",
+        prefer_agent=False,
+        cache=cache,
+    )
+    # Simulate a worker that filled the grant between our miss and our turn
+    original = cache.filling
+
+    def filling(key):
+        SharedGrantCache(path).put(key, _secret("shared", "2099-01-01T00:00:00Z"))
+        return original(key)
+
+    cache.filling = filling
+    with client:
+        assert client.request_secret("db", intent).value == "shared"
+    assert not route.called
+
+
+def test_refuses_file_accessible_to_others(path):
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    os.fchmod(fd, 0o666)
+    os.close(fd)
+    with pytest.raises(PermissionError):
+        _cache(path)
+
+
+def test_refuses_file_of_another_user(path, monkeypatch):
+    _cache(path).close()
+    uid = os.getuid()
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+    with pytest.raises(PermissionError):
+        _cache(path)
+
+
+def test_refuses_symlink(path, tmp_path):
+    target = tmp_path / "elsewhere"
+    os.symlink(target, path)
+    with pytest.raises(OSError):
+        _cache(path)
+    assert not target.exists()
+
+
+def test_default_path_prefers_runtime_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert default_shm_path().startswith(str(tmp_path))
+
+
+def test_filling_is_per_key_not_per_slot(path):
+    cache = _cache(path, slots=1)  # every key shares one home slot
+    held, release = threading.Event(), threading.Event()
+
+    def hold():
+        with cache.filling(KEY):
+            held.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    held.wait()
+    start = time.monotonic()
+    with _cache(path).filling(("api", None, "production", "agent")):
+        waited = time.monotonic() - start
+    release.set()
+    thread.join()
+
+    assert waited < 0.2
+
+
+@respx.mock
+def test_pending_approval_releases_fill_lock(path):
+    intent = AccessIntent(summary="s", description="d", task_id="t")
+    respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(
+            202, json={"request_id": "req_1", "status": "PENDING_APPROVAL"}
+        )
+    )
+    respx.get("http://test-server/v1/access/requests/req_1").mock(
+        return_value=Response(
+            200, json={"request_id": "req_1", "status": "PENDING_APPROVAL"}
+        )
+    )
+    cache = SharedGrantCache(path)
+    client = SentinelClient(
+        base_url="http://test-server",
+        api_token="t",
+        agent_id="agent",
+        environment="production",
+        prefer_agent=False,
+        cache=cache,
+    )
+    with client:
+        future = client.submit_request(
+            "db", intent, polling_interval=0.05, polling_timeout=5
+        )
+        while future.status != "PENDING_APPROVAL":
+            time.sleep(0.01)
+        start = time.monotonic()
+        with _cache(path).filling(("db", None, "production", "agent")):
+            waited = time.monotonic() - start
+        future.cancel()
+
+    assert waited < 0.5
@@ -0,0 +1,183 @@
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+import respx
+from httpx import Response
+
+from sentinel_client import (
+    AccessIntent,
+    GrantCache,
+    SecretPayload,
+    SentinelClient,
+    SingleFlight,
+)
+from sentinel_client.exceptions import SentinelDeniedError
+
+
+@pytest.fixture
+def intent():
+    return AccessIntent(
+        summary="Test Access", description="Testing the SDK", task_id="task-123"
+    )
+
+
+def _run_concurrently(fn, count):
+    results, errors = [], []
+    barrier = threading.Barrier(count)
+
+    def worker():
+        barrier.wait()
+        try:
+            results.append(fn())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, errors
+
+
+def test_single_flight_shares_result_and_error():
+    group = SingleFlight()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.1)
+        return "value"
+
+    results, _ = _run_concurrently(lambda: group.do("key", slow), 10)
+    assert results == ["value"] * 10
+    assert len(calls) == 1
+    assert group.stats.executed == 1
+    assert group.stats.shared == 9
+
+    def failing():
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    _, errors = _run_concurrently(lambda: group.do("key", failing), 5)
+    assert len(errors) == 5
+    assert all(isinstance(e, ValueError) for e in errors)
+
+
+def test_cancelled_leader_does_not_cancel_waiters():
+    group = SingleFlight()
+    leading, follow = threading.Event(), threading.Event()
+    results = []
+
+    def cancelled():
+        leading.set()
+        follow.wait(5)
+        time.sleep(0.05)  # let the waiter block on this call
+        raise CancelledError()
+
+    def leader():
+        with pytest.raises(CancelledError):
+            group.do("key", cancelled)
+
+    thread = threading.Thread(target=leader)
+    thread.start()
+    leading.wait()
+    follow.set()
+    results.append(group.do("key", lambda: "value"))
+    thread.join()
+
+    assert results == ["value"]
+    assert group.stats.executed == 2
+
+
+@respx.mock
+def test_concurrent_request_secret_shares_one_approval(intent):
+    def pending(request):
+        time.sleep(0.1)
+        return Response(
+            202, json={"request_id": "req_shared", "status": "PENDING_APPROVAL"}
+        )
+
+    post = respx.post("http://test-server/v1/access/request").mock(side_effect=pending)
+    poll = respx.get("http://test-server/v1/access/requests/req_shared").mock(
+        side_effect=[
+            Response(
+                200, json={"request_id": "req_shared", "status": "PENDING_APPROVAL"}
+            ),
+            Response(
+                200,
+                json={
+                    "request_id": "req_shared",
+                    "status": "APPROVED",
+                    "secret": {"type": "v", "value": "shared", "expires_at": "t"},
+                },
+            ),
+        ]
+    )
+    client = SentinelClient(
+        base_url="http://test-server", api_token="test-token", agent_id="test-agent"
+    )
+
+    results, errors = _run_concurrently(
+        lambda: client.request_secret(
+            "payment_provider_key", intent, polling_interval=0.05
+        ).value,
+        50,
+    )
+
+    assert not errors
+    assert results == ["shared"] * 50
+    assert post.call_count == 1
+    assert poll.call_count == 2
+
+
+@respx.mock
+def test_concurrent_denials_reach_every_caller(intent):
+    def denied(request):
+        time.sleep(0.1)
+        return Response(
+            403, json={"request_id": "r", "status": "DENIED", "reason": "Blocked"}
+        )
+
+    post = respx.post("http://test-server/v1/access/request").mock(side_effect=denied)
+    client = SentinelClient(
+        base_url="http://test-server", api_token="test-token", agent_id="test-agent"
+    )
+
+    _, errors = _run_concurrently(
+        lambda: client.request_secret("forbidden_key", intent), 10
+    )
+
+    assert len(errors) == 10
+    assert all(isinstance(e, SentinelDeniedError) for e in errors)
+    assert post.call_count == 1
+
+
+@respx.mock
+def test_new_leader_rechecks_cache_after_previous_leader_retires(intent):
+    route = respx.post("http://test-server/v1/access/request").mock(
+        return_value=Response(500)
+    )
+    secret = SecretPayload(type="t", value="cached", expires_at="2099-01-01T00:00:00Z")
+    cache = GrantCache()
+    with SentinelClient(
+        base_url="http://test-server",
+        api_token="t",
+        agent_id="a",
+        prefer_agent=False,
+        cache=cache,
+    ) as client:
+        real_get = cache.get
+
+        def get(key):
+            # the previous leader caches its grant and retires right after our miss
+            cache.get = real_get
+            client._cache_grant(key, secret, ())
+            return None
+
+        cache.get = get
+        assert client.request_secret("db", intent).value == "cached"
+
+    assert not route.called
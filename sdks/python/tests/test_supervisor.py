@@ -0,0 +1,163 @@
+import os
+import signal
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sentinel_client.cli import main
+from sentinel_client.exceptions import SentinelNetworkError
+from sentinel_client.supervisor import SecretSupervisor, write_env_file
+
+
+def _client(*snapshots, ready=lambda: True):
+    """
+    A client whose fetch_secrets returns `snapshots`, then repeats the last.
+
+    Later snapshots are held back (the first is repeated) until `ready()`.
+    """
+    client = MagicMock()
+    values = list(snapshots)
+
+    def fetch(environment=None, delta=False):
+        assert delta
+        if not ready():
+            return dict(values[0])
+        value = values.pop(0) if len(values) > 1 else values[0]
+        if isinstance(value, Exception):
+            raise value
+        return dict(value)
+
+    client.fetch_secrets.side_effect = fetch
+    return client
+
+
+def _wait_for_lines(path, count, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if os.path.exists(path):
+            with open(path) as f:
+                lines = f.read().splitlines()
+            if len(lines) >= count:
+                return lines
+        time.sleep(0.02)
+    raise AssertionError(f"{path} never reached {count} lines")
+
+
+def _supervise(supervisor, lines_file, count):
+    """Run `supervisor` until `lines_file` has `count` lines, then stop it."""
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(code=supervisor.run()))
+    thread.start()
+    try:
+        lines = _wait_for_lines(lines_file, count)
+    finally:
+        supervisor.stop()
+        thread.join(10)
+    return lines, result["code"]
+
+
+def test_restarts_child_with_rotated_secrets(tmp_path):
+    out = str(tmp_path / "out")
+    child = (
+        "import os, time\n"
+        f"open({out!r}, 'a').write(os.environ['DB'] + '\\n')\n"
+        "time.sleep(30)"
+    )
+    supervisor = SecretSupervisor(
+        _client({"DB": "v1"}, {"DB": "v1"}, {"DB": "v2"}),
+        [sys.executable, "-c", child],
+        interval=0.05,
+        base_env={},
+    )
+
+    lines, _ = _supervise(supervisor, out, 2)
+
+    assert lines == ["v1", "v2"]
+    stats = supervisor.stats
+    assert stats.changes == 1
+    assert stats.restarts == 1
+    assert stats.checks >= 2
+
+
+def test_signals_child_to_reload_env_file(tmp_path):
+    out = str(tmp_path / "out")
+    env_file = str(tmp_path / "secrets.env")
+    child = (
+        "import os, signal, time\n"
+        "def reload(*_):\n"
+        "    with open(os.environ['SENTINEL_ENV_FILE']) as f:\n"
+        f"        open({out!r}, 'a').write(f.read())\n"
+        "signal.signal(signal.SIGHUP, reload)\n"
+        f"open({out!r}, 'a').write('started\\n')\n"
+        "while True: time.sleep(1)"
+    )
+    supervisor = SecretSupervisor(
+        _client(
+            {"DB": "v1"},
+            {"DB": "v1"},
+            SentinelNetworkError("down"),
+            {"DB": "it's v2"},
+            # rotate only once the child has installed its SIGHUP handler
+            ready=lambda: os.path.exists(out),
+        ),
+        [sys.executable, "-c", child],
+        interval=0.05,
+        on_change="signal",
+        env_file=env_file,
+        base_env={},
+    )
+
+    lines, _ = _supervise(supervisor, out, 2)
+
+    assert lines == ["started", "DB='it'\"'\"'s v2'"]
+    stats = supervisor.stats
+    assert stats.reloads == 1
+    assert stats.restarts == 0
+    assert stats.errors == 1
+    assert os.stat(env_file).st_mode & 0o777 == 0o600
+
+
+def test_returns_child_exit_status():
+    supervisor = SecretSupervisor(
+        _client({}), [sys.executable, "-c", "raise SystemExit(3)"], interval=0.05
+    )
+    assert supervisor.run() == 3
+
+
+def test_write_env_file_is_shell_quoted(tmp_path):
+    path = str(tmp_path / "env")
+    write_env_file(path, {"B": "two words", "A": "$HOME"})
+    with open(path) as f:
+        assert f.read() == "A='$HOME'\nB='two words'\n"
+
+
+def test_run_supervise_exits_with_child_status():
+    with patch("sentinel_client.client.SentinelClient"), patch(
+        "sentinel_client.supervisor.SecretSupervisor"
+    ) as Supervisor, patch.object(
+        sys,
+        "argv",
+        [
+            "sentinel",
+            "--token",
+            "t",
+            "run",
+            "--supervise",
+            "--on-change",
+            "signal",
+            "--",
+            "server",
+        ],
+    ):
+        Supervisor.return_value.run.return_value = -signal.SIGTERM
+        with pytest.raises(SystemExit) as e:
+            main()
+
+    assert e.value.code == 128 + signal.SIGTERM
+    args, kwargs = Supervisor.call_args
+    assert args[1] == ["server"]
+    assert kwargs["on_change"] == "signal"
+    assert kwargs["reload_signal"] == signal.SIGHUP
@@ -207,6 +207,146 @@ describe("Sentinel Server", () => {
     });
   });
 
+  describe("Long Poll", () => {
+    const createPending = async () => {
+      const res = await app.request("/v1/access/request", {
+        method: "POST",
+        headers: authHeaders,
+        body: JSON.stringify({
+          agent_id: "long_poll_agent",
+          resource_id: "prod_long_poll",
+          intent: { summary: "Wait", description: "...", task_id: "lp1" },
+          ttl_seconds: 3600,
+        }),
+      });
+      expect(res.headers.get("X-Sentinel-Long-Poll")).toBe("30");
+      return ((await res.json()) as AccessResponse).request_id;
+    };
+
+    it("should answer a waiting poll as soon as the request is approved", async () => {
+      const requestId = await createPending();
+      const started = Date.now();
+      const poll = app.request(`/v1/access/requests/${requestId}?wait=5`, {
+        headers: authHeaders,
+      });
+
+      await new Promise((resolve) => setTimeout(resolve, 50));
+      await app.request(`/v1/admin/requests/${requestId}/approve`, {
+        method: "POST",
+        headers: authHeaders,
+      });
+
+      const data = (await (await poll).json()) as AccessResponse;
+      expect(data.status).toBe("APPROVED");
+      expect(Date.now() - started).toBeLessThan(1000);
+    });
+
+    it("should return the pending status when the wait elapses", async () => {
+      const requestId = await createPending();
+      const res = await app.request(`/v1/access/requests/${requestId}?wait=0.1`, {
+        headers: authHeaders,
+      });
+      const data = (await res.json()) as AccessResponse;
+      expect(data.status).toBe("PENDING_APPROVAL");
+    });
+  });
+
+  describe("Batch Status", () => {
+    it("should return the status of several requests at once", async () => {
+      const ids: string[] = [];
+      for (const resource_id of ["prod_batch_a", "prod_batch_b"]) {
+        const res = await app.request("/v1/access/request", {
+          method: "POST",
+          headers: authHeaders,
+          body: JSON.stringify({
+            agent_id: "batch_agent",
+            resource_id,
+            intent: { summary: "Batch", description: "...", task_id: "b1" },
+            ttl_seconds: 3600,
+          }),
+        });
+        ids.push(((await res.json()) as AccessResponse).request_id);
+      }
+
+      const res = await app.request(
+        `/v1/access/requests?ids=${ids.join(",")},req_missing`,
+        { headers: authHeaders },
+      );
+      expect(res.status).toBe(200);
+      const data = (await res.json()) as {
+        requests: Record<string, AccessResponse>;
+      };
+      expect(Object.keys(data.requests).sort()).toEqual([...ids].sort());
+      expect(data.requests[ids[0]].status).toBe("PENDING_APPROVAL");
+    });
+
+    it("should reject a batch without ids", async () => {
+      const res = await app.request("/v1/access/requests", {
+        headers: authHeaders,
+      });
+      expect(res.status).toBe(400);
+    });
+  });
+
+  describe("Batch Access Request", () => {
+    it("should evaluate every resource and answer in order", async () => {
+      const res = await app.request("/v1/access/requests/batch", {
+        method: "POST",
+        headers: authHeaders,
+        body: JSON.stringify({
+          agent_id: "batch_agent",
+          intent: { summary: "Batch", description: "...", task_id: "b2" },
+          ttl_seconds: 3600,
+          requests: [
+            { resource_id: "batch_dev_db" },
+            { resource_id: "prod_batch_c" },
+            { resource_id: "forbidden_batch", ttl_seconds: 60 },
+          ],
+        }),
+      });
+
+      expect(res.status).toBe(200);
+      expect(res.headers.get("X-Sentinel-Long-Poll")).toBe("30");
+      const data = (await res.json()) as {
+        responses: (AccessResponse & { resource_id: string })[];
+      };
+      expect(data.responses.map((r) => r.resource_id)).toEqual([
+        "batch_dev_db",
+        "prod_batch_c",
+        "forbidden_batch",
+      ]);
+      expect(data.responses.map((r) => r.status)).toEqual([
+        "APPROVED",
+        "PENDING_APPROVAL",
+        "DENIED",
+      ]);
+      expect(data.responses[0].secret?.value).toMatch(/^secret_v1_/);
+
+      // Every item is stored and can be polled like a single request
+      const poll = await app.request(data.responses[1].polling_url!, {
+        headers: authHeaders,
+      });
+      expect(poll.status).toBe(200);
+      expect(((await poll.json()) as AccessResponse).status).toBe(
+        "PENDING_APPROVAL",
+      );
+    });
+
+    it("should reject an empty batch", async () => {
+      const res = await app.request("/v1/access/requests/batch", {
+        method: "POST",
+        headers: authHeaders,
+        body: JSON.stringify({
+          agent_id: "batch_agent",
+          intent: { summary: "Batch", description: "...", task_id: "b3" },
+          ttl_seconds: 3600,
+          requests: [],
+        }),
+      });
+      expect(res.status).toBe(400);
+    });
+  });
+
   describe("Secret Rotation", () => {
     it("should rotate secrets for a resource", async () => {
       const resourceId = "rotatable_resource";
@@ -278,6 +418,43 @@ describe("Sentinel Server", () => {
     });
   });
 
+  describe("Secret Sync", () => {
+    it("should answer 304 when the secret set is unchanged", async () => {
+      const first = await app.request("/v1/secrets", { headers: authHeaders });
+      expect(first.status).toBe(200);
+      const etag = first.headers.get("ETag");
+      expect(etag).toBeTruthy();
+
+      const second = await app.request("/v1/secrets", {
+        headers: { ...authHeaders, "If-None-Match": etag as string },
+      });
+      expect(second.status).toBe(304);
+    });
+
+    it("should return only resources changed since a cursor", async () => {
+      const first = await app.request("/v1/secrets", { headers: authHeaders });
+      const cursor = first.headers.get("X-Sentinel-Cursor");
+      expect(cursor).toBeTruthy();
+
+      await app.request("/v1/admin/secrets/delta_resource/rotate", {
+        method: "POST",
+        headers: authHeaders,
+      });
+
+      const delta = await app.request(`/v1/secrets?since=${cursor}`, {
+        headers: authHeaders,
+      });
+      expect(delta.status).toBe(200);
+      const data = (await delta.json()) as {
+        cursor: number;
+        secrets: Record<string, string>;
+      };
+      expect(Object.keys(data.secrets)).toEqual(["delta_resource"]);
+      expect(data.secrets.delta_resource).toMatch(/^secret_v2_/);
+      expect(data.cursor).toBeGreaterThan(Number(cursor));
+    });
+  });
+
   describe("Discovery", () => {
     it("should list available resources", async () => {
       // Create a secret first by requesting it (which triggers auto-creation in this mock)
@@ -38,6 +38,10 @@ db.run(`
   )
 `);
 
+db.run(
+  "CREATE INDEX IF NOT EXISTS idx_secrets_resource_version ON secrets (resource_id, version)",
+);
+
 function getOrCreateSecret(resourceId: string): {
   value: string;
   version: number;
@@ -86,6 +90,150 @@ const AccessRequestSchema = z.object({
   ttl_seconds: z.number().positive(),
 });
 
+// --- Long-poll waiters ---
+// GET /v1/access/requests/:id?wait=N holds a pending request open until an
+// admin approves or denies it (or N seconds pass), so agents learn the outcome
+// immediately instead of on their next poll.
+const MAX_WAIT_SECONDS = 30;
+const LONG_POLL_HEADER = "X-Sentinel-Long-Poll";
+const waiters = new Map<string, Set<() => void>>();
+
+function notifyWaiters(id: string) {
+  const callbacks = waiters.get(id);
+  if (!callbacks) return;
+  waiters.delete(id);
+  for (const callback of callbacks) callback();
+}
+
+function waitForResolution(
+  id: string,
+  seconds: number,
+  signal: AbortSignal,
+): Promise<void> {
+  return new Promise((resolve) => {
+    const callbacks = waiters.get(id) ?? new Set<() => void>();
+    waiters.set(id, callbacks);
+    const done = () => {
+      clearTimeout(timer);
+      signal.removeEventListener("abort", done);
+      callbacks.delete(done);
+      if (callbacks.size === 0 && waiters.get(id) === callbacks) {
+        waiters.delete(id);
+      }
+      resolve();
+    };
+    const timer = setTimeout(done, seconds * 1000);
+    signal.addEventListener("abort", done);
+    callbacks.add(done);
+  });
+}
+
+const BatchAccessRequestSchema = z.object({
+  agent_id: z.string(),
+  intent: AccessIntentSchema,
+  ttl_seconds: z.number().positive(),
+  requests: z
+    .array(
+      z.object({
+        resource_id: z.string(),
+        ttl_seconds: z.number().positive().optional(),
+      }),
+    )
+    .min(1)
+    .max(100),
+});
+
+type AccessRequestBody = z.infer<typeof AccessRequestSchema>;
+
+function newRequestId(): string {
+  return `req_${Math.random().toString(36).substring(2, 9)}`;
+}
+
+function statusCode(status: AccessStatus): 200 | 202 | 403 {
+  return status === "DENIED" ? 403 : status === "PENDING_APPROVAL" ? 202 : 200;
+}
+
+// Policy Engine (Simple Regex based)
+function evaluateAccessRequest(
+  body: AccessRequestBody,
+  requestId: string,
+): AccessResponse {
+  const requireApprovalRegex = process.env
+    .SENTINEL_POLICY_REQUIRE_APPROVAL_REGEX
+    ? new RegExp(process.env.SENTINEL_POLICY_REQUIRE_APPROVAL_REGEX)
+    : /(prod|sensitive)/;
+
+  const autoDenyRegex = process.env.SENTINEL_POLICY_AUTO_DENY_REGEX
+    ? new RegExp(process.env.SENTINEL_POLICY_AUTO_DENY_REGEX)
+    : /forbidden/;
+
+  if (requireApprovalRegex.test(body.resource_id)) {
+    return {
+      request_id: requestId,
+      status: "PENDING_APPROVAL",
+      message: "This resource requires human approval. Check status later.",
+      polling_url: `/v1/access/requests/${requestId}`,
+    };
+  }
+  if (autoDenyRegex.test(body.resource_id)) {
+    return {
+      request_id: requestId,
+      status: "DENIED",
+      reason: "Policy Violation: Blocked by static policy.",
+    };
+  }
+
+  const { value } = getOrCreateSecret(body.resource_id);
+  return {
+    request_id: requestId,
+    status: "APPROVED",
+    secret: {
+      type: "managed_secret",
+      value: value,
+      expires_at: new Date(Date.now() + body.ttl_seconds * 1000).toISOString(),
+    },
+  };
+}
+
+function storeAccessRequest(body: AccessRequestBody, response: AccessResponse) {
+  db.prepare(
+    `
+    INSERT INTO requests (id, agent_id, resource_id, intent, status, response, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+  `,
+  ).run(
+    response.request_id,
+    body.agent_id,
+    body.resource_id,
+    JSON.stringify(body.intent),
+    response.status,
+    JSON.stringify(response),
+    new Date().toISOString(),
+  );
+}
+
+// Notify Admin via Webhook (if configured)
+function notifyApprovalWebhook(
+  agentId: string,
+  resourceIds: string[],
+  summary: string,
+) {
+  const webhookUrl = process.env.SENTINEL_WEBHOOK_URL;
+  if (!webhookUrl || resourceIds.length === 0) return;
+
+  // Fire and forget - don't block the response
+  const message = `🛡️ **Sentinel Access Request**\n\n**Agent:** ${agentId}\n**Resource:** ${resourceIds.join(", ")}\n**Intent:** ${summary}\n\nApprove: ${process.env.SENTINEL_URL || "http://localhost:3000"}/admin`;
+
+  fetch(webhookUrl, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({
+      content: message, // Discord
+      text: message, // Slack
+    }),
+  }).catch((e) => console.error("[Webhook] Failed to send notification:", e));
+}
+
 app.post("/v1/access/request", async (c) => {
   try {
     const rawBody = await c.req.json();
@@ -99,8 +247,6 @@ app.post("/v1/access/request", async (c) => {
     }
 
     const body = validation.data;
-    const requestId = `req_${Math.random().toString(36).substring(2, 9)}`;
-    const now = new Date().toISOString();
 
     // 1. Audit Logging (The "Intent")
     console.log(
@@ -110,117 +256,177 @@ app.post("/v1/access/request", async (c) => {
       `[AUDIT] Intent: ${body.intent.summary} (${body.intent.task_id})`,
     );
 
-    // 2. Policy Engine (Simple Regex based)
-    let status: AccessStatus = "APPROVED";
-    let response: AccessResponse = {
-      request_id: requestId,
-      status: "APPROVED",
-    };
+    // 2. Policy Engine
+    const response = evaluateAccessRequest(body, newRequestId());
+    if (response.status === "PENDING_APPROVAL") {
+      notifyApprovalWebhook(
+        body.agent_id,
+        [body.resource_id],
+        body.intent.summary,
+      );
+    }
 
-    const requireApprovalRegex = process.env
-      .SENTINEL_POLICY_REQUIRE_APPROVAL_REGEX
-      ? new RegExp(process.env.SENTINEL_POLICY_REQUIRE_APPROVAL_REGEX)
-      : /(prod|sensitive)/;
-
-    const autoDenyRegex = process.env.SENTINEL_POLICY_AUTO_DENY_REGEX
-      ? new RegExp(process.env.SENTINEL_POLICY_AUTO_DENY_REGEX)
-      : /forbidden/;
-
-    if (requireApprovalRegex.test(body.resource_id)) {
-      status = "PENDING_APPROVAL";
-      response = {
-        request_id: requestId,
-        status: "PENDING_APPROVAL",
-        message: "This resource requires human approval. Check status later.",
-        polling_url: `/v1/access/requests/${requestId}`,
-      };
-
-      // Notify Admin via Webhook (if configured)
-      const webhookUrl = process.env.SENTINEL_WEBHOOK_URL;
-      if (webhookUrl) {
-        // Fire and forget - don't block the response
-        const message = `🛡️ **Sentinel Access Request**\n\n**Agent:** ${body.agent_id}\n**Resource:** ${body.resource_id}\n**Intent:** ${body.intent.summary}\n\nApprove: ${process.env.SENTINEL_URL || "http://localhost:3000"}/admin`;
-
-        fetch(webhookUrl, {
-          method: "POST",
-          headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({
-            content: message, // Discord
-            text: message, // Slack
-          }),
-        }).catch((e) =>
-          console.error("[Webhook] Failed to send notification:", e),
-        );
-      }
-    } else if (autoDenyRegex.test(body.resource_id)) {
-      status = "DENIED";
-      response = {
-        request_id: requestId,
-        status: "DENIED",
-        reason: "Policy Violation: Blocked by static policy.",
-      };
-    } else {
-      // Approved
-      const { value } = getOrCreateSecret(body.resource_id);
-      response.secret = {
-        type: "managed_secret",
-        value: value,
-        expires_at: new Date(
-          Date.now() + body.ttl_seconds * 1000,
-        ).toISOString(),
-      };
+    // 3. Store state
+    storeAccessRequest(body, response);
+
+    c.header(LONG_POLL_HEADER, String(MAX_WAIT_SECONDS));
+    return c.json(response, statusCode(response.status));
+  } catch (err) {
+    console.error(err);
+    return c.json({ error: "Invalid Request" }, 400);
+  }
+});
+
+// Batch access request: many resources, one intent, one transaction.
+// Responses come back in request order; each item carries its own status.
+app.post("/v1/access/requests/batch", async (c) => {
+  try {
+    const rawBody = await c.req.json();
+    const validation = BatchAccessRequestSchema.safeParse(rawBody);
+
+    if (!validation.success) {
+      return c.json(
+        { error: "Invalid Request", details: validation.error },
+        400,
+      );
     }
 
-    // Store state
-    const insert = db.prepare(`
-      INSERT INTO requests (id, agent_id, resource_id, intent, status, response, created_at)
-      VALUES (?, ?, ?, ?, ?, ?, ?)
-    `);
-    insert.run(
-      requestId,
-      body.agent_id,
-      body.resource_id,
-      JSON.stringify(body.intent),
-      status,
-      JSON.stringify(response),
-      now,
+    const batch = validation.data;
+    const bodies: AccessRequestBody[] = batch.requests.map((item) => ({
+      agent_id: batch.agent_id,
+      resource_id: item.resource_id,
+      intent: batch.intent,
+      ttl_seconds: item.ttl_seconds ?? batch.ttl_seconds,
+    }));
+
+    console.log(
+      `[AUDIT] Batch request from ${batch.agent_id} for ${bodies.length} resources: ${bodies.map((b) => b.resource_id).join(", ")}`,
+    );
+    console.log(
+      `[AUDIT] Intent: ${batch.intent.summary} (${batch.intent.task_id})`,
     );
 
-    return c.json(
-      response,
-      status === "DENIED" ? 403 : status === "PENDING_APPROVAL" ? 202 : 200,
+    const responses = db.transaction(() =>
+      bodies.map((body) => {
+        const response = evaluateAccessRequest(body, newRequestId());
+        storeAccessRequest(body, response);
+        return response;
+      }),
+    )();
+
+    notifyApprovalWebhook(
+      batch.agent_id,
+      bodies
+        .filter((_, i) => responses[i].status === "PENDING_APPROVAL")
+        .map((body) => body.resource_id),
+      batch.intent.summary,
     );
+
+    c.header(LONG_POLL_HEADER, String(MAX_WAIT_SECONDS));
+    return c.json({
+      responses: responses.map((response, i) => ({
+        resource_id: bodies[i].resource_id,
+        ...response,
+      })),
+    });
   } catch (err) {
     console.error(err);
     return c.json({ error: "Invalid Request" }, 400);
   }
 });
 
-app.get("/v1/access/requests/:id", (c) => {
+// Batch status check for many pending requests (?ids=a,b,c)
+app.get("/v1/access/requests", (c) => {
+  const ids = (c.req.query("ids") ?? "").split(",").filter((id) => id);
+  if (ids.length === 0 || ids.length > 100) {
+    return c.json({ error: "Provide between 1 and 100 ids" }, 400);
+  }
+
+  const placeholders = ids.map(() => "?").join(", ");
+  const records = db
+    .query(`SELECT id, response FROM requests WHERE id IN (${placeholders})`)
+    .all(...ids) as any[];
+
+  const requests: Record<string, unknown> = {};
+  for (const record of records) {
+    requests[record.id] = JSON.parse(record.response);
+  }
+  return c.json({ requests });
+});
+
+app.get("/v1/access/requests/:id", async (c) => {
   const id = c.req.param("id");
-  const record = db.query("SELECT * FROM requests WHERE id = ?").get(id) as any;
+  const query = db.query("SELECT * FROM requests WHERE id = ?");
+  let record = query.get(id) as any;
 
   if (!record) {
     return c.json({ error: "Request not found" }, 404);
   }
 
+  // Long-poll: hold pending requests open until resolved or ?wait seconds pass
+  const wait = Math.min(Number(c.req.query("wait")) || 0, MAX_WAIT_SECONDS);
+  if (wait > 0 && record.status === "PENDING_APPROVAL") {
+    await waitForResolution(id, wait, c.req.raw.signal);
+    record = query.get(id) as any;
+  }
+
+  c.header(LONG_POLL_HEADER, String(MAX_WAIT_SECONDS));
   return c.json(JSON.parse(record.response));
 });
 
+// Secrets are append-only, so the highest row id is a monotonic change cursor
+function secretsCursor(): number {
+  const row = db
+    .query("SELECT COALESCE(MAX(id), 0) AS cursor FROM secrets")
+    .get() as { cursor: number };
+  return row.cursor;
+}
+
+// Latest value per resource, optionally limited to resources changed after a cursor
+function latestSecrets(since?: number): Record<string, string> {
+  const changed =
+    since === undefined
+      ? ""
+      : "WHERE resource_id IN (SELECT DISTINCT resource_id FROM secrets WHERE id > ?)";
+  const rows = db
+    .query(
+      `SELECT s.resource_id, s.value FROM secrets s
+       JOIN (SELECT resource_id, MAX(version) AS version FROM secrets ${changed}
+             GROUP BY resource_id) latest
+         ON s.resource_id = latest.resource_id AND s.version = latest.version
+       ORDER BY s.resource_id ASC`,
+    )
+    .all(...(since === undefined ? [] : [since])) as any[];
+
+  const secrets: Record<string, string> = {};
+  for (const row of rows) {
+    secrets[row.resource_id] = row.value;
+  }
+  return secrets;
+}
+
 // Fetch all latest secrets (Environment Injection)
+// Supports If-None-Match (ETag) and ?since=<cursor> delta sync.
 app.get("/v1/secrets", (c) => {
-  // 1. Get all secrets
-  const secrets = db
-    .query("SELECT * FROM secrets ORDER BY resource_id ASC, version ASC")
-    .all() as any[];
+  const cursor = secretsCursor();
+  const etag = `"secrets-${cursor}"`;
+  c.header("ETag", etag);
+  c.header("X-Sentinel-Cursor", String(cursor));
 
-  // 2. Reduce to latest version per resource_id
-  const latestSecrets: Record<string, string> = {};
-  for (const secret of secrets) {
-    latestSecrets[secret.resource_id] = secret.value;
+  if (c.req.header("If-None-Match") === etag) {
+    return c.body(null, 304);
   }
 
-  return c.json(latestSecrets);
+  const since = c.req.query("since");
+  if (since !== undefined) {
+    const sinceCursor = Number.parseInt(since, 10);
+    if (Number.isNaN(sinceCursor) || sinceCursor < 0) {
+      return c.json({ error: "Invalid cursor" }, 400);
+    }
+    return c.json({ cursor, secrets: latestSecrets(sinceCursor) });
+  }
+
+  return c.json(latestSecrets());
 });
 
 // List available resources (Discovery)
@@ -301,6 +507,7 @@ app.post("/v1/admin/requests/:id/approve", (c) => {
     JSON.stringify(newPayload),
     id,
   );
+  notifyWaiters(id);
 
   return c.json(newPayload);
 });
@@ -333,6 +540,7 @@ app.post("/v1/admin/requests/:id/deny", (c) => {
     JSON.stringify(newPayload),
     id,
   );
+  notifyWaiters(id);
 
   return c.json(newPayload);
 });
@@ -365,7 +573,16 @@ app.get("/v1/admin/secrets", (c) => {
 
 export { app };
 
-export default {
-  port: parseInt(process.env.PORT || "3000", 10),
-  fetch: app.fetch,
-};
+// Co-located agents can skip TCP entirely by listening on a Unix socket
+const unixSocket = process.env.SENTINEL_SOCKET;
+
+// Keep idle connections open longer than the longest long-poll wait
+const idleTimeout = MAX_WAIT_SECONDS + 10;
+
+export default unixSocket
+  ? { unix: unixSocket, fetch: app.fetch, idleTimeout }
+  : {
+      port: parseInt(process.env.PORT || "3000", 10),
+      fetch: app.fetch,
+      idleTimeout,
+    };